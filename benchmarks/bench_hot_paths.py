@@ -0,0 +1,312 @@
+"""
+Benchmarks de las rutas calientes por frame, con driver de video "dummy".
+
+Mide colisiones entre enemigos (10/100/500), colisiones del ataque del
+jugador, Enemy.update, Game.draw_game (con y sin overlays de debug),
+TileMap.build_map a varios tamaños, construcción de Enemy (nuevo y
+reciclado desde EnemyPool), Minimap.draw y el muestreo de SpawnIndex.
+
+Uso (desde la raíz del repo):
+    python benchmarks/bench_hot_paths.py                    # todo, JSON por stdout
+    python benchmarks/bench_hot_paths.py collisions draw    # solo los que contienen esos textos
+    python benchmarks/bench_hot_paths.py --out bench.json   # además lo guarda en un archivo
+
+Salida: un objeto JSON con "meta" (versiones, commit) y "results", una
+entrada por benchmark con tiempos por llamada en ms (min / mediana / p95)
+y asignaciones de memoria por llamada: bloques netos (sys.getallocatedblocks)
+y pico de memoria trazada (tracemalloc). Comparar dos JSON entre versiones
+permite detectar regresiones.
+"""
+import contextlib
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+SRC = os.path.join(ROOT, "src")
+sys.path.insert(0, SRC)
+os.chdir(SRC)   # las rutas de assets son relativas a src/
+
+import numpy as np
+import pygame
+
+import core.game as game_module
+from core.game import Game
+from core.game_state import GameState
+from core.map import TileMap
+from core.settings import MAP_WIDTH_PX, MAP_HEIGHT_PX, TILE_SIZE
+from entities.enemy import Enemy
+from graphics.frame_cache import enemy_frame_cache
+
+
+REPEAT = 7
+
+
+def measure(fn, number: int = 1, repeat: int = REPEAT, setup=None):
+    """
+    Ejecuta fn() `number` veces por repetición. Devuelve tiempos por llamada
+    (ms) y asignaciones medidas en una repetición adicional.
+    """
+    if setup:
+        setup()
+    fn()  # calentamiento
+
+    times = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        times.append((time.perf_counter() - start) * 1000.0 / number)
+
+    if setup:
+        setup()
+    blocks_before = sys.getallocatedblocks()
+    tracemalloc.start()
+    for _ in range(number):
+        fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    blocks_after = sys.getallocatedblocks()
+
+    times.sort()
+    return {
+        "calls": number * repeat,
+        "min_ms": round(times[0], 4),
+        "median_ms": round(statistics.median(times), 4),
+        "p95_ms": round(times[min(len(times) - 1, int(len(times) * 0.95))], 4),
+        "blocks_per_call": round((blocks_after - blocks_before) / number, 2),
+        "peak_kb": round(peak / 1024, 1),
+    }
+
+
+# ----------------------
+# ESCENARIOS
+# ----------------------
+def make_game():
+    # Los prints del juego van a stderr para que stdout sea solo el JSON
+    with contextlib.redirect_stdout(sys.stderr):
+        game = Game()
+        while game.state == GameState.LOADING:
+            game.update(0.0)
+            time.sleep(0.001)
+        game.start_game()
+    return game
+
+
+def set_enemies(game, count, near_player=False, seed=0):
+    """Deja exactamente `count` orcos vivos (repartidos o alrededor del jugador)."""
+    rng = random.Random(seed)
+    if game.enemy_batch is not None:
+        game.enemy_batch.clear()
+    game.enemies = []
+    for _ in range(count):
+        if near_player:
+            x = game.player.x + rng.randint(-120, 120)
+            y = game.player.y + rng.randint(-120, 120)
+        else:
+            x = rng.randint(0, MAP_WIDTH_PX - TILE_SIZE)
+            y = rng.randint(0, MAP_HEIGHT_PX - TILE_SIZE)
+        game.add_enemy(Enemy(x, y, sound_manager=None))
+
+
+def bench_enemy_collisions(game):
+    results = {}
+    for count in (10, 100, 500):
+        set_enemies(game, count, near_player=True, seed=count)
+        results[f"collisions.enemy[{count}]"] = measure(game.handle_enemy_collisions, number=20)
+    return results
+
+
+def bench_player_attack(game):
+    set_enemies(game, 100, near_player=True, seed=1)
+    player = game.player
+
+    def setup():
+        for enemy in game.enemies:
+            enemy.health = 10 ** 9   # que no mueran durante la medición
+        player.facing = "down"
+        player.is_attacking = True
+        player.hit_enemies_this_swing = set()
+
+    def attack():
+        player.hit_enemies_this_swing.clear()
+        game.handle_player_attack_collisions()
+
+    result = measure(attack, number=50, setup=setup)
+    player.is_attacking = False
+    return {"collisions.player_attack[100]": result}
+
+
+def bench_enemy_update(game):
+    results = {}
+    set_enemies(game, 100, seed=2)
+    enemies = list(game.enemies)
+    player = game.player
+
+    # Ruta por objeto: se desligan del lote para medir Enemy.update directamente
+    if game.enemy_batch is not None:
+        game.enemy_batch.clear()
+
+    def update_objects():
+        for enemy in enemies:
+            enemy.update(1 / 60, player)
+
+    results["enemy.update[100]"] = measure(update_objects, number=20)
+
+    if game.enemy_batch is not None:
+        for enemy in enemies:
+            game.enemy_batch.add(enemy)
+        results["enemy.batch_update[100]"] = measure(
+            lambda: game.enemy_batch.update(1 / 60, player), number=20
+        )
+    return results
+
+
+def bench_draw_game(game):
+    results = {}
+    set_enemies(game, 100, near_player=True, seed=3)
+    game.state = GameState.RUNNING
+    flags = ("DEBUG_DRAW_HITBOXES", "DEBUG_DRAW_ATTACK_FIELDS", "DEBUG_DRAW_RENDER_STATS")
+    saved = {flag: getattr(game_module, flag) for flag in flags}
+
+    for label, enabled in (("debug", True), ("no_debug", False)):
+        for flag in flags:
+            setattr(game_module, flag, enabled)
+        results[f"draw.draw_game[100,{label}]"] = measure(game.draw_game, number=20)
+
+    for flag, value in saved.items():
+        setattr(game_module, flag, value)
+    return results
+
+
+def bench_minimap(game):
+    set_enemies(game, 100, seed=4)
+    minimap = game.minimap
+
+    def draw():
+        minimap._last_marker_update = None   # marcadores recalculados en cada llamada
+        minimap.draw(game.screen, game.player, game.enemies, game.items)
+
+    return {"draw.minimap[100]": measure(draw, number=50)}
+
+
+def bench_enemy_construction(game):
+    rng = random.Random(5)
+
+    def build():
+        Enemy(rng.randint(0, 1000), rng.randint(0, 1000), sound_manager=None)
+
+    results = {"enemy.construct": measure(build, number=50)}
+
+    # Reciclado desde el pool: un orco liberado por cada uno pedido
+    pool = game.enemy_pool
+
+    def recycle():
+        enemy = pool.acquire(rng.randint(0, 1000), rng.randint(0, 1000))
+        enemy.alive = False
+        pool.release(enemy)
+
+    results["enemy.pool_acquire"] = measure(recycle, number=50)
+    # En frío: caché de frames vacía, incluye la carga y el escalado de sprites
+    results["enemy.construct[cold]"] = measure(
+        build, number=1, repeat=3, setup=enemy_frame_cache.clear
+    )
+    enemy_frame_cache.prewarm()
+    return results
+
+
+def bench_spawn_index(game):
+    index = game.spawn_index
+    center = (game.player.x, game.player.y)
+    rng = random.Random(6)
+    return {
+        "spawn.sample": measure(lambda: index.sample(center, TILE_SIZE * 8, rng=rng), number=200),
+        "spawn.sample_many[50]": measure(
+            lambda: index.sample_many(50, center, TILE_SIZE * 10, rng=rng), number=20
+        ),
+        # Radio casi del tamaño del mapa: fuerza el filtrado exacto
+        "spawn.sample[far]": measure(
+            lambda: index.sample(center, MAP_WIDTH_PX * 0.9, rng=rng), number=50
+        ),
+    }
+
+
+def bench_build_map(game):
+    results = {}
+    for size in (50, 100, 200):
+        def build(size=size):
+            TileMap(tile_size=32, width=size, height=size, seed=1234, use_cache=False).build_map()
+
+        results[f"map.build_map[{size}]"] = measure(build, number=1, repeat=3)
+    return results
+
+
+BENCHMARKS = [
+    bench_enemy_collisions,
+    bench_player_attack,
+    bench_enemy_update,
+    bench_draw_game,
+    bench_minimap,
+    bench_enemy_construction,
+    bench_spawn_index,
+    bench_build_map,
+]
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv):
+    out_path = None
+    if "--out" in argv:
+        i = argv.index("--out")
+        out_path = argv[i + 1]
+        argv = argv[:i] + argv[i + 2:]
+    filters = argv
+
+    game = make_game()
+
+    results = {}
+    for bench in BENCHMARKS:
+        if filters and not any(f in bench.__name__ for f in filters):
+            continue
+        results.update(bench(game))
+
+    report = {
+        "meta": {
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+    text = json.dumps(report, indent=2)
+    if out_path:
+        with open(os.path.join(ROOT, out_path) if not os.path.isabs(out_path) else out_path, "w") as f:
+            f.write(text)
+    print(text)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,68 @@
+"""
+Benchmark: campo de biomas de TileMap, ruta por tile vs. perlin_grid.
+
+Uso (desde la raíz del repo):
+    python benchmarks/bench_noise_field.py            # 50, 200 y 500 tiles de lado
+    python benchmarks/bench_noise_field.py 50 200     # tamaños a elección
+
+La ruta por tile (dos PerlinNoise.__call__ por tile + sorted) es la que
+usaba TileMap.generate_noise_map; a 500² tarda decenas de segundos.
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import numpy as np
+from perlin_noise import PerlinNoise
+
+from core.noise import perlin_grid, balanced_thresholds
+
+
+def scalar_field(noise_biome, noise_detail, width, height):
+    raw_values = []
+    rows = []
+    for y in range(height):
+        row = []
+        for x in range(width):
+            v = noise_biome([x / 25, y / 25])
+            v += 0.3 * noise_detail([x / 10, y / 10])
+            row.append(v)
+            raw_values.append(v)
+        rows.append(row)
+    sorted_vals = sorted(raw_values)
+    n = len(sorted_vals)
+    return rows, (sorted_vals[n // 3], sorted_vals[2 * n // 3])
+
+
+def vector_field(noise_biome, noise_detail, width, height):
+    cols = np.arange(width)
+    rows = np.arange(height)
+    field = perlin_grid(noise_biome, cols / 25, rows / 25)
+    field += 0.3 * perlin_grid(noise_detail, cols / 10, rows / 10)
+    return field, balanced_thresholds(field)
+
+
+def main(sizes):
+    print(f"{'tiles':>9} {'por tile (s)':>13} {'NumPy (s)':>10} {'x':>8}  max |dif|")
+    for size in sizes:
+        noise_biome = PerlinNoise(octaves=2, seed=1234)
+        noise_detail = PerlinNoise(octaves=4, seed=5678)
+
+        t0 = time.perf_counter()
+        field, thresholds = vector_field(noise_biome, noise_detail, size, size)
+        t_vec = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        ref, ref_thresholds = scalar_field(noise_biome, noise_detail, size, size)
+        t_ref = time.perf_counter() - t0
+
+        diff = float(np.abs(np.asarray(ref) - field).max())
+        assert np.allclose(thresholds, ref_thresholds), (thresholds, ref_thresholds)
+
+        print(f"{size:>4}x{size:<4} {t_ref:>13.3f} {t_vec:>10.4f} {t_ref / t_vec:>8.0f}  {diff:.1e}")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [50, 200, 500])
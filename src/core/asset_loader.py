@@ -0,0 +1,185 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+from core.settings import ASSET_LOADER_WORKERS
+
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+
+
+def _key(path: str) -> str:
+    """Misma clave para rutas relativas ("assets/...") y absolutas (__file__/..)."""
+    return os.path.normcase(os.path.abspath(path))
+
+
+class AssetLoader:
+    """
+    Carga de imágenes y sonidos en un pool de hilos.
+
+    Los hilos solo DECODIFICAN (pygame.image.load / pygame.mixer.Sound);
+    convert()/convert_alpha() se hace siempre en el hilo principal desde
+    pump(), que Game llama cada frame mientras muestra la pantalla de carga.
+    Todo el código del juego pide sus recursos con image()/sound(): si ya
+    están precargados se devuelven al instante, si no se cargan en el acto.
+    """
+
+    def __init__(self, workers: int = ASSET_LOADER_WORKERS):
+        self.workers = workers
+        self._pool = None
+        self._lock = threading.Lock()
+
+        self._image_jobs = {}   # key -> Future(Surface sin convertir)
+        self._sound_jobs = {}   # key -> Future(Sound)
+        self.images = {}        # (key, alpha) -> Surface convertida
+        self.sounds = {}        # key -> Sound
+
+        # Peticiones de conversión desde otros hilos: [(surface, alpha, Event, resultado)]
+        self._convert_requests = []
+        self.pumping = False    # True mientras el hilo principal llama pump()
+
+    # ----------------------
+    # PRECARGA
+    # ----------------------
+    def _executor(self):
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="assets")
+        return self._pool
+
+    def preload_images(self, paths):
+        pool = self._executor()
+        with self._lock:
+            for path in paths:
+                key = _key(path)
+                if key not in self._image_jobs:
+                    self._image_jobs[key] = pool.submit(pygame.image.load, key)
+
+    def preload_sounds(self, paths):
+        pool = self._executor()
+        with self._lock:
+            for path in paths:
+                key = _key(path)
+                if key not in self._sound_jobs:
+                    self._sound_jobs[key] = pool.submit(pygame.mixer.Sound, key)
+
+    def preload_folder(self, folder):
+        """Encola todas las imágenes bajo `folder` (recursivo)."""
+        paths = []
+        for root, _, files in os.walk(folder):
+            for file in sorted(files):
+                if file.lower().endswith(IMAGE_EXTENSIONS):
+                    paths.append(os.path.join(root, file))
+        self.preload_images(paths)
+
+    def progress(self):
+        """(terminados, total) de los trabajos de precarga, imágenes + sonidos."""
+        with self._lock:
+            jobs = list(self._image_jobs.values()) + list(self._sound_jobs.values())
+        return sum(1 for job in jobs if job.done()), len(jobs)
+
+    def done(self):
+        finished, total = self.progress()
+        return finished == total
+
+    # ----------------------
+    # HILO PRINCIPAL
+    # ----------------------
+    def pump(self):
+        """
+        Convierte (en el hilo principal) las imágenes ya decodificadas y
+        atiende las conversiones pedidas por hilos en segundo plano.
+        """
+        self.pumping = True
+
+        with self._lock:
+            ready = [
+                key for key, job in self._image_jobs.items()
+                if job.done() and (key, True) not in self.images
+            ]
+        for key in ready:
+            surface = self._job_result(self._image_jobs[key])
+            if surface is not None:
+                self.images[(key, True)] = surface.convert_alpha()
+
+        with self._lock:
+            requests, self._convert_requests = self._convert_requests, []
+        for request in requests:
+            surface, alpha, event, result = request
+            try:
+                result.append(surface.convert_alpha() if alpha else surface.convert())
+            except pygame.error as e:
+                result.append(e)
+            event.set()
+
+    def stop_pumping(self):
+        """Llamar cuando ya no quedan hilos cargando: atiende lo pendiente y vuelve al modo directo."""
+        self.pump()
+        self.pumping = False
+
+    @staticmethod
+    def _job_result(job):
+        try:
+            return job.result()
+        except (pygame.error, OSError):
+            return None
+
+    def _convert(self, surface, alpha):
+        on_main = threading.current_thread() is threading.main_thread()
+        if on_main or not self.pumping:
+            return surface.convert_alpha() if alpha else surface.convert()
+
+        # Hilo en segundo plano: el hilo principal hace la conversión en pump()
+        event = threading.Event()
+        result = []
+        with self._lock:
+            self._convert_requests.append((surface, alpha, event, result))
+        event.wait()
+        if isinstance(result[0], Exception):
+            raise result[0]
+        return result[0]
+
+    # ----------------------
+    # ACCESO
+    # ----------------------
+    def image(self, path, alpha: bool = True, cache: bool = True):
+        """
+        Surface convertida de `path`. Lanza pygame.error / FileNotFoundError
+        igual que pygame.image.load si no se puede cargar.
+        """
+        key = _key(path)
+        converted = self.images.get((key, alpha))
+        if converted is not None:
+            return converted
+
+        with self._lock:
+            job = self._image_jobs.get(key)
+        raw = job.result() if job is not None else pygame.image.load(key)
+
+        surface = self._convert(raw, alpha)
+        if cache:
+            self.images[(key, alpha)] = surface
+        return surface
+
+    def sound(self, path):
+        """pygame.mixer.Sound de `path` (precargado si se pidió antes)."""
+        key = _key(path)
+        sound = self.sounds.get(key)
+        if sound is not None:
+            return sound
+
+        with self._lock:
+            job = self._sound_jobs.get(key)
+        sound = job.result() if job is not None else pygame.mixer.Sound(key)
+        self.sounds[key] = sound
+        return sound
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+# Instancia única para todo el proceso
+assets = AssetLoader()
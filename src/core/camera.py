@@ -1,3 +1,5 @@
+import pygame
+
 from core.settings import MAP_WIDTH_PX, MAP_HEIGHT_PX
 
 
@@ -21,4 +23,17 @@ class Camera:
         self.y = max(0, min(self.y, map_height - self.screen_height))
 
     def get_offset(self):
-        return (self.x, self.y)
\ No newline at end of file
+        return (self.x, self.y)
+
+    def get_view_rect(self, margin: int = 0, offset=None):
+        """
+        Rectángulo visible en coordenadas del mundo, agrandado `margin` px por
+        cada lado. `offset` permite usar el offset ya desplazado por el temblor.
+        """
+        x, y = offset if offset is not None else (self.x, self.y)
+        return pygame.Rect(
+            int(x) - margin,
+            int(y) - margin,
+            self.screen_width + margin * 2,
+            self.screen_height + margin * 2,
+        )
@@ -0,0 +1,80 @@
+from core.settings import TILE_SIZE
+
+
+class SpatialHash:
+    """
+    Rejilla uniforme (spatial hash) para la fase ancha de colisiones.
+
+    Cada objeto se registra en todas las celdas que toca su rect, así que
+    solo se comparan pares que comparten al menos una celda.
+    """
+
+    def __init__(self, cell_size: int = TILE_SIZE):
+        self.cell_size = cell_size
+        self.cells: dict[tuple[int, int], list] = {}
+
+    def clear(self):
+        self.cells.clear()
+
+    def _cell_span(self, rect):
+        size = self.cell_size
+        return (
+            rect.left // size,
+            (rect.right - 1) // size,
+            rect.top // size,
+            (rect.bottom - 1) // size,
+        )
+
+    def insert(self, key, rect):
+        """Registra `key` (normalmente el índice del objeto) en las celdas de `rect`."""
+        x0, x1, y0, y1 = self._cell_span(rect)
+        cells = self.cells
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [key]
+                else:
+                    bucket.append(key)
+
+    def query(self, rect):
+        """Devuelve el conjunto de claves registradas en las celdas que toca `rect`."""
+        x0, x1, y0, y1 = self._cell_span(rect)
+        found = set()
+        cells = self.cells
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.update(bucket)
+        return found
+
+    def candidate_pairs(self):
+        """Pares (a, b) con a < b que comparten alguna celda, sin repetir."""
+        pairs = set()
+        for bucket in self.cells.values():
+            n = len(bucket)
+            if n < 2:
+                continue
+            for i in range(n):
+                a = bucket[i]
+                for j in range(i + 1, n):
+                    b = bucket[j]
+                    pairs.add((a, b) if a < b else (b, a))
+        return sorted(pairs)
+
+
+def min_translation(moving, fixed):
+    """
+    Vector mínimo (dx, dy) que saca el rect `moving` del rect `fixed`.
+    Empuja por el eje de menor penetración; (0, 0) si no se solapan.
+    """
+    overlap_x = min(moving.right, fixed.right) - max(moving.left, fixed.left)
+    overlap_y = min(moving.bottom, fixed.bottom) - max(moving.top, fixed.top)
+
+    if overlap_x <= 0 or overlap_y <= 0:
+        return 0, 0
+
+    if overlap_x < overlap_y:
+        return (overlap_x if moving.centerx >= fixed.centerx else -overlap_x), 0
+    return 0, (overlap_y if moving.centery >= fixed.centery else -overlap_y)
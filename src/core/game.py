@@ -2,8 +2,11 @@ import pygame
 import sys
 from entities.player import Player
 from core.camera import Camera
+from core.collision import SpatialHash, min_translation
 from core.map import TileMap
-from entities.enemy import Enemy, EnemyState
+from entities.enemy import EnemyState
+from entities.enemy_batch import EnemyBatch
+from entities.enemy_pool import EnemyPool
 from core.game_state import GameState
 from core.settings import (
     SCREEN_HEIGTH, SCREEN_WIDTH, FPS, WINDOW_TITLE, COLOR_BG,
@@ -12,19 +15,31 @@ from core.settings import (
     ENEMIES_PER_LEVEL, MAX_PLAYER_LEVEL, XP_PER_KILL, KILLS_PER_BANDAGE, MAX_BANDAGES,
     PLAYER_XP_BASE,
     DEBUG_DRAW_HITBOXES,
-    DEBUG_DRAW_ATTACK_FIELDS, ENEMY_BASE_HEALTH, SPECIAL_FRONTAL_DAMAGE,
-    SPECIAL_SPIRAL_DAMAGE, SPECIAL_RADIUS, XP_PER_KILL, SPECIAL_FRONTAL_KILLS,SPECIAL_SPIRAL_KILLS
+    DEBUG_DRAW_ATTACK_FIELDS, DEBUG_DRAW_RENDER_STATS, CULL_MARGIN, ENEMY_BASE_HEALTH, SPECIAL_FRONTAL_DAMAGE,
+    SPECIAL_SPIRAL_DAMAGE, SPECIAL_RADIUS, XP_PER_KILL, SPECIAL_FRONTAL_KILLS,SPECIAL_SPIRAL_KILLS,
+    ENEMY_SIM_BACKEND, MAP_SEED, DIRTY_RECT_RENDERING,
+    FIXED_TIMESTEP, SIM_TICK_RATE, SIM_MAX_CATCHUP_STEPS, SIM_INTERPOLATE,
+    PROFILER_ENABLED,
 )
 from core.minimapa import Minimap
 from core.sound_manager import SoundManager
 from entities.item import Item
-import math, os, random
+import math, os, random, threading
 from entities.boss_diablo import BossDiablo
+from graphics.frame_cache import enemy_frame_cache
+from core.asset_loader import assets
+from graphics.text_cache import text_cache
+from graphics.effect_cache import effect_cache
+from graphics.tint_cache import tint_cache
+from core.hud import Hud, TextWidget, BarWidget
+from core.profiler import FrameProfiler
+from core.music import MusicController
+from core.spawn_index import SpawnIndex
 
 
 
 class Game:
-    def __init__(self):
+    def __init__(self, input_provider=None):
         pygame.init()
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGTH))
         pygame.display.set_caption(WINDOW_TITLE)
@@ -39,13 +54,12 @@ class Game:
             "sprites",
             "FondoPantallaInicio.jpg",
         )
-        try:
-            self.menu_background = pygame.image.load(bg_path).convert()
-        except pygame.error:
-            self.menu_background = None
-        
+        self.menu_background_path = bg_path
+        self.menu_background = None
+
         # --- Estados de juego ---
-        self.state = GameState.MENU
+        # Se arranca en LOADING: los recursos se cargan en segundo plano
+        self.state = GameState.LOADING
 
         # --- Progresión ---
         self.level = 1
@@ -68,18 +82,10 @@ class Game:
         self.spawn_interval = ENEMY_INITIAL_SPAWN_INTERVAL
         self.max_enemies_on_screen = ENEMY_MAX_ON_SCREEN_BASE
 
-        self.sound_manager = SoundManager()
-
-        # Create game objects
-        # Configure player to use 8 frames per direction and 1-based row indexing
-        self.player = Player(SCREEN_WIDTH // 2, SCREEN_HEIGTH // 2,
-                            frames_per_direction=8,
-                            unarmed_row=39,
-                            armed_row=9,
-                            row_index_base=1,
-                            sound_manager=self.sound_manager)
-        
-        self.level = self.player.level  # sincronizar nivel del juego con nivel del jugador
+        # Player, SoundManager y mapa se crean en _load_world (segundo plano)
+        self.input_provider = input_provider
+        self.sound_manager = None
+        self.player = None
 
         # Efectos visuales de habilidades especiales (Q/E)
         # Cada efecto será un dict con:
@@ -92,22 +98,20 @@ class Game:
         # }
         self.special_effects = []
 
-        # DEBUG: comprobar balance de daño en nivel 1
-
-        print("=== DEBUG BALANCE NIVEL 1 ===")
-        print(f"Vida enemigo base: {ENEMY_BASE_HEALTH}")
-        print(f"Daño puños (sin fuerza extra): {self.player.base_attack_damage_unarmed}")
-        print(f"Golpes necesarios (puños): {ENEMY_BASE_HEALTH / self.player.base_attack_damage_unarmed:.2f}")
-        print(f"Daño machete (sin fuerza extra): {self.player.base_attack_damage_armed}")
-        print(f"Golpes necesarios (machete): {ENEMY_BASE_HEALTH / self.player.base_attack_damage_armed:.2f}")
-        print("================================")
-
         self.camera = Camera(SCREEN_WIDTH, SCREEN_HEIGTH)
         self.minimap = Minimap(SCREEN_WIDTH, SCREEN_HEIGTH, minimap_size=100)
-        self.tile_map = TileMap(tile_size=32, width=50, height=50)
-        self.tile_map.build_map()
+        self.tile_map = None
+        self.spawn_index = None
+
         # ---- Enemigos ----
         self.enemies = []
+        self.collision_grid = SpatialHash()
+        # Contadores de culling del último frame dibujado
+        self.render_stats = {"drawn": 0, "culled": 0}
+        # Backend de simulación de orcos: lote NumPy o ruta por objeto
+        self.enemy_batch = EnemyBatch() if ENEMY_SIM_BACKEND == "numpy" else None
+        # Orcos muertos reciclados para los siguientes spawns
+        self.enemy_pool = EnemyPool()
         # Enemigos se crean cuando realmente empieza la partida
         # sincronizar nivel del juego con nivel del jugador
 
@@ -118,17 +122,6 @@ class Game:
         self.flash_timer = 0.0
         self.shake_timer = 0.0
         self.shake_strength = 0
-        
-        # Cargar sonidos de habilidades especiales
-        sound_path = os.path.join(os.path.dirname(__file__), "..", "assets", "sounds")
-        self.snd_slash_q = pygame.mixer.Sound(os.path.join(sound_path, "Slash.mp3"))
-        self.snd_slash_d = pygame.mixer.Sound(os.path.join(sound_path, "SlashD.mp3"))
-        self.snd_explosion_e = pygame.mixer.Sound(os.path.join(sound_path, "Explosion.mp3"))
-        self.snd_whoosh = pygame.mixer.Sound(os.path.join(sound_path, "Woosh.mp3"))
-        self.snd_slash_q.set_volume(0.7)
-        self.snd_slash_d.set_volume(0.7)
-        self.snd_explosion_e.set_volume(0.8)
-        self.snd_whoosh.set_volume(0.6)
 
         # --- Estado del jefe ---
         self.boss_active = False      # Hay combate contra el Diablo
@@ -144,10 +137,168 @@ class Game:
             os.path.join(music_base, "ElJornalero.wav"),
             os.path.join(music_base, "MulaHijueputa.wav"),
         ]
+        self.boss_music_path = os.path.join(music_base, "LaPeleaConelDiablo.wav")
         self.last_music_index = -1
+        self.next_music_index = None
+        self.music = MusicController()
+
+        # Posiciones reales guardadas mientras se dibuja interpolado
+        self._interp_saved = []
+        self._interp_camera = None
+
+        # --- HUD en modo retenido ---
+        self.build_hud()
+
+        # --- Profiler por fases (F3 panel, F4 volcado) ---
+        self.profiler = FrameProfiler(enabled=PROFILER_ENABLED)
+
+        # --- Render por rectángulos sucios ---
+        self.dirty_rendering = DIRTY_RECT_RENDERING
+        self.dirty_rects = []            # zonas de pantalla tocadas este frame
+        self._prev_dirty_rects = []      # ...y el frame anterior (para borrar)
+        self._full_redraw = True         # presentar la pantalla entera este frame
+        self._static_screen_key = None   # pantalla estática ya presentada
+        self._last_camera_offset = None
+        self._last_drawn_state = None
+        self._menu_background_scaled = None
+
+        # --- Carga en segundo plano ---
+        self.loading_thread = None
+        self.loading_error = None
+        self.start_loading()
+
+    # ----------------------
+    # CARGA DE RECURSOS
+    # ----------------------
+    SPECIAL_SOUND_FILES = {
+        "snd_slash_q": ("Slash.mp3", 0.7),
+        "snd_slash_d": ("SlashD.mp3", 0.7),
+        "snd_explosion_e": ("Explosion.mp3", 0.8),
+        "snd_whoosh": ("Woosh.mp3", 0.6),
+    }
+
+    def start_loading(self):
+        """Encola la decodificación de sprites y sonidos en el pool de assets."""
+        base = os.path.join(os.path.dirname(__file__), "..", "assets")
+        sound_path = os.path.join(base, "Sounds")
+
+        assets.preload_folder(os.path.join(base, "sprites"))
+        assets.preload_sounds(
+            SoundManager.sound_paths()
+            + [os.path.join(sound_path, file) for file, _ in self.SPECIAL_SOUND_FILES.values()]
+        )
+
+    def _load_world(self):
+        """
+        Hilo de carga: crea Player, SoundManager y el mapa. Las imágenes
+        que pidan se convierten en el hilo principal vía assets.pump().
+        """
+        try:
+            self.sound_manager = SoundManager()
+
+            # Create game objects
+            # Configure player to use 8 frames per direction and 1-based row indexing
+            player = Player(SCREEN_WIDTH // 2, SCREEN_HEIGTH // 2,
+                            frames_per_direction=8,
+                            unarmed_row=39,
+                            armed_row=9,
+                            row_index_base=1,
+                            sound_manager=self.sound_manager,
+                            input_provider=self.input_provider)
+
+            tile_map = TileMap(tile_size=32, width=50, height=50, seed=MAP_SEED)
+            tile_map.build_map()
+            spawn_index = SpawnIndex.from_tile_map(tile_map)
+
+            # Pre-calentar la caché de frames de orcos
+            enemy_frame_cache.prewarm()
+
+            # Sonidos de habilidades especiales
+            sound_path = os.path.join(os.path.dirname(__file__), "..", "assets", "Sounds")
+            for attr, (file, volume) in self.SPECIAL_SOUND_FILES.items():
+                sound = assets.sound(os.path.join(sound_path, file))
+                sound.set_volume(volume)
+                setattr(self, attr, sound)
+
+            self.tile_map = tile_map
+            self.spawn_index = spawn_index
+            self.player = player
+        except Exception as e:
+            self.loading_error = e
+
+    def finish_loading(self):
+        """Pasos finales en el hilo principal, cuando ya no queda nada en segundo plano."""
+        assets.stop_pumping()
+        if self.loading_error is not None:
+            raise self.loading_error
+
+        try:
+            self.menu_background = assets.image(self.menu_background_path, alpha=False)
+        except (pygame.error, FileNotFoundError):
+            self.menu_background = None
+
+        self.level = self.player.level  # sincronizar nivel del juego con nivel del jugador
+
+        # Miniatura del terreno para la capa estática del minimapa
+        self.minimap.build_static_layer(self.tile_map)
+
+        # La primera pista se decodifica mientras el jugador está en el menú
+        self.prefetch_normal_music()
+
+        # DEBUG: comprobar balance de daño en nivel 1
+
+        print("=== DEBUG BALANCE NIVEL 1 ===")
+        print(f"Vida enemigo base: {ENEMY_BASE_HEALTH}")
+        print(f"Daño puños (sin fuerza extra): {self.player.base_attack_damage_unarmed}")
+        print(f"Golpes necesarios (puños): {ENEMY_BASE_HEALTH / self.player.base_attack_damage_unarmed:.2f}")
+        print(f"Daño machete (sin fuerza extra): {self.player.base_attack_damage_armed}")
+        print(f"Golpes necesarios (machete): {ENEMY_BASE_HEALTH / self.player.base_attack_damage_armed:.2f}")
+        print("================================")
 
+        self.state = GameState.MENU
 
+    def update_loading(self):
+        """Avanza la carga un frame: conversiones pendientes y arranque del hilo del mundo."""
+        assets.pump()
 
+        if self.loading_thread is None:
+            # El mundo se construye cuando las imágenes ya están decodificadas
+            if assets.done():
+                self.loading_thread = threading.Thread(
+                    target=self._load_world, name="load-world", daemon=True
+                )
+                self.loading_thread.start()
+        elif not self.loading_thread.is_alive():
+            self.finish_loading()
+
+    def loading_progress(self) -> float:
+        finished, total = assets.progress()
+        decoded = finished / total if total else 1.0
+        # La decodificación cuenta 70 %, construir el mundo el 30 % restante
+        if self.loading_thread is None:
+            return decoded * 0.7
+        return 0.7 if self.loading_thread.is_alive() else 1.0
+
+    def draw_loading(self):
+        font = text_cache.font("arial", 28, bold=True)
+        hint_font = text_cache.font("arial", 18)
+
+        progress = self.loading_progress()
+        cx, cy = SCREEN_WIDTH // 2, SCREEN_HEIGTH // 2
+
+        title_surf = font.render(f"Cargando... {int(progress * 100)}%", True, (240, 240, 240))
+        self.screen.blit(title_surf, (cx - title_surf.get_width() // 2, cy - 60))
+
+        bar_width, bar_height = 360, 18
+        bar_rect = pygame.Rect(cx - bar_width // 2, cy - bar_height // 2, bar_width, bar_height)
+        pygame.draw.rect(self.screen, (60, 60, 60), bar_rect)
+        fill = bar_rect.copy()
+        fill.width = int(bar_width * progress)
+        pygame.draw.rect(self.screen, (200, 170, 60), fill)
+        pygame.draw.rect(self.screen, (240, 240, 240), bar_rect, 2)
+
+        hint_surf = hint_font.render("ESC: Salir", True, (200, 200, 200))
+        self.screen.blit(hint_surf, (cx - hint_surf.get_width() // 2, cy + 40))
 
     def save_current_run_summary(self):
         """Guarda un resumen de la partida actual para mostrar en el menú."""
@@ -195,14 +346,11 @@ class Game:
         self.max_enemies_on_screen = ENEMY_MAX_ON_SCREEN_BASE
         self.spawn_interval = ENEMY_INITIAL_SPAWN_INTERVAL
 
-        try:
-            pygame.mixer.music.stop()
-        except:
-            pass
+        self.stop_music()
 
         # --- Reset completo de enemigos y spawns ---
         # eliminar TODOS los enemigos de la partida anterior
-        self.enemies = []
+        self.release_all_enemies()
 
         # Reset de ítems
         self.items = []
@@ -263,19 +411,12 @@ class Game:
 
     def spawn_initial_enemies(self, count: int = 5):
     # """Crea algunos enemigos en posiciones aleatorias lejos del jugador."""
-        import random
-        from core.settings import MAP_WIDTH_PX, MAP_HEIGHT_PX, TILE_SIZE
-
-        for _ in range(count):
-            while True:
-                x = random.randint(0, MAP_WIDTH_PX - TILE_SIZE)
-                y = random.randint(0, MAP_HEIGHT_PX - TILE_SIZE)
-
-                dx = x - self.player.x
-                dy = y - self.player.y
-                if dx * dx + dy * dy > (TILE_SIZE * 10) ** 2:
-                    break
+        from core.settings import TILE_SIZE
 
+        points = self.spawn_index.sample_many(
+            count, (self.player.x, self.player.y), TILE_SIZE * 10, table="enemy"
+        )
+        for x, y in points:
             from core.settings import (
                 ENEMY_BASE_HEALTH, ENEMY_BASE_DAMAGE,
                 ENEMY_HEALTH_GROWTH, ENEMY_DAMAGE_GROWTH,
@@ -286,30 +427,59 @@ class Game:
             health = int(ENEMY_BASE_HEALTH * (ENEMY_HEALTH_GROWTH ** level_index))
             damage = ENEMY_BASE_DAMAGE * (ENEMY_DAMAGE_GROWTH ** level_index)
 
-            enemy = Enemy(x, y, health=health, damage=damage, sound_manager=self.sound_manager)
-            self.enemies.append(enemy) 
+            enemy = self.enemy_pool.acquire(x, y, health=health, damage=damage,
+                                            sound_manager=self.sound_manager)
+            self.add_enemy(enemy)
+
+    def add_enemy(self, enemy):
+        """Añade un orco a la partida (y a su fila del EnemyBatch si está activo)."""
+        if self.enemy_batch is not None:
+            self.enemy_batch.add(enemy)
+        self.enemies.append(enemy)
+
+    def remove_dead_enemies(self):
+        """
+        Quita los enemigos con alive=False (swap con el último, sin reconstruir
+        la lista) y devuelve los orcos al pool. El orden de self.enemies no se
+        conserva: el dibujo ya ordena por profundidad.
+        """
+        if self.enemy_batch is not None:
+            self.enemy_batch.remove_dead()
+
+        enemies = self.enemies
+        hit_set = getattr(self.player, "hit_enemies_this_swing", None)
+        i = 0
+        while i < len(enemies):
+            enemy = enemies[i]
+            if enemy.alive:
+                i += 1
+                continue
+            last = enemies.pop()
+            if last is not enemy:
+                enemies[i] = last
+            if hit_set is not None:
+                hit_set.discard(enemy)
+            self.enemy_pool.release(enemy)
+
+    def release_all_enemies(self):
+        """Vacía la partida de enemigos (nueva partida, llegada del jefe) reciclando los orcos."""
+        if self.enemy_batch is not None:
+            self.enemy_batch.clear()
+        for enemy in self.enemies:
+            self.enemy_pool.release(enemy)
+        self.enemies.clear()
 
     def spawn_aguardiente_item(self):
         """Spawnea un ítem de aguardiente en posición aleatoria."""
         if self.item_spawned_this_level:
             return
         
-        import random
-        from core.settings import MAP_WIDTH_PX, MAP_HEIGHT_PX, TILE_SIZE
-        
-        # Posición aleatoria lejos del jugador
-        while True:
-            x = random.randint(TILE_SIZE * 5, MAP_WIDTH_PX - TILE_SIZE * 5)
-            y = random.randint(TILE_SIZE * 5, MAP_HEIGHT_PX - TILE_SIZE * 5)
-            
-            dx = x - self.player.x
-            dy = y - self.player.y
-            dist = math.sqrt(dx * dx + dy * dy)
-            
-            # Al menos 300 píxeles de distancia del jugador
-            if dist > 300:
-                break
-        
+        # Posición lejos del jugador (al menos 300 px), a 5 tiles del borde
+        point = self.spawn_index.sample((self.player.x, self.player.y), 300, table="item")
+        if point is None:
+            return
+        x, y = point
+
         item = Item(x, y, item_type="aguardiente")
         self.items.append(item)
         self.item_spawned_this_level = True
@@ -320,6 +490,22 @@ class Game:
             if event.type == pygame.QUIT:
                 self.running = False
 
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                self.invalidate_screen()
+
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.profiler.toggle()
+                self.invalidate_screen()
+
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                if self.profiler.phases:
+                    self.profiler.dump()
+
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F9:
+                # Comparar render por rectángulos sucios vs. flip completo
+                self.dirty_rendering = not self.dirty_rendering
+                self.invalidate_screen()
+
             elif event.type == pygame.KEYDOWN:
                 # ESC ya no sale siempre: depende del estado
                 if self.state == GameState.RUNNING:
@@ -355,10 +541,11 @@ class Game:
                         elif event.key == pygame.K_m:
                             self.save_current_run_summary()
                             self.state = GameState.MENU
-                            try:
-                                pygame.mixer.music.stop()
-                            except:
-                                pass
+                            self.stop_music()
+
+                elif self.state == GameState.LOADING:
+                    if event.key == pygame.K_ESCAPE:
+                        self.running = False
 
                 elif self.state == GameState.MENU:
                     if event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
@@ -368,10 +555,7 @@ class Game:
 
                 elif self.state == GameState.GAME_OVER:
                     # Detener música del jefe SIEMPRE al entrar a GAME_OVER
-                    try:
-                        pygame.mixer.music.stop()
-                    except:
-                        pass
+                    self.stop_music()
                     if event.key == pygame.K_RETURN:
                         self.start_game()
                     elif event.key == pygame.K_m:
@@ -393,21 +577,38 @@ class Game:
 
 
     def update(self, dt: float):
+        if self.state == GameState.LOADING:
+            self.update_loading()
+            return
         if self.state != GameState.RUNNING:
             return
 
         # Tiempo total de la partida
         self.run_time += dt
 
-        self.player.update(dt)
-        self.camera.update(self.player)
+        profiler = self.profiler
 
-        for enemy in self.enemies:
-            enemy.update(dt, self.player)
+        with profiler.section("player.update"):
+            self.player.update(dt)
+        self.camera.update(self.player)
 
-        self.handle_enemy_collisions()
-        self.handle_player_attack_collisions()
-        self.update_enemy_spawning(dt)
+        with profiler.section("enemies.update"):
+            if self.enemy_batch is not None:
+                self.enemy_batch.update(dt, self.player)
+                # El jefe (y cualquier enemigo fuera del lote) sigue por objeto
+                for enemy in self.enemies:
+                    if getattr(enemy, "batch", None) is None:
+                        enemy.update(dt, self.player)
+            else:
+                for enemy in self.enemies:
+                    enemy.update(dt, self.player)
+
+        with profiler.section("collisions.enemy"):
+            self.handle_enemy_collisions()
+        with profiler.section("collisions.attack"):
+            self.handle_player_attack_collisions()
+        with profiler.section("spawning"):
+            self.update_enemy_spawning(dt)
         # Actualizar ítems
         for item in self.items:
             item.update(dt)
@@ -472,86 +673,58 @@ class Game:
         - Enemigos no atraviesan a otros enemigos.
         - No empujan al jugador: solo se recolocan ellos.
         - Compatible con Enemy y BossDiablo (sin usar _rect).
+
+        Fase ancha con SpatialHash (celdas de TILE_SIZE) y separación
+        cerrada por vector mínimo de traslación (sin bucles de 1 px).
         """
 
         # --- Hitbox del jugador ---
-        player_hitbox = pygame.Rect(
-            self.player.x + self.player.hitbox_offset_x,
-            self.player.y + self.player.hitbox_offset_y,
-            self.player.hitbox_width,
-            self.player.hitbox_height,
-        )
-
-        # --- ENEMIGO ↔ JUGADOR ---
-        for enemy in self.enemies:
-            if not enemy.alive:
-                continue
+        player_hitbox = self.player.hitbox
 
-            e_hit = enemy.rect  # usar propiedad rect SIEMPRE
+        enemies = self.enemies
+        grid = self.collision_grid
+        grid.clear()
 
-            if e_hit.colliderect(player_hitbox):
+        for i, enemy in enumerate(enemies):
+            if enemy.alive:
+                grid.insert(i, enemy.rect)  # usar propiedad rect SIEMPRE
 
-                # Dejar quieto a enemigos “normales” (NO al Diablo muerto)
-                if hasattr(enemy, "set_state") and enemy.state != "death":
-                    enemy.set_state("idle")
-
-                # Separar enemigo del jugador (1 px hasta no chocar)
-                while e_hit.colliderect(player_hitbox):
+        # --- ENEMIGO ↔ JUGADOR ---
+        for i in sorted(grid.query(player_hitbox)):
+            enemy = enemies[i]
+            e_hit = enemy.rect
 
-                    dx = e_hit.centerx - player_hitbox.centerx
-                    dy = e_hit.centery - player_hitbox.centery
+            if not e_hit.colliderect(player_hitbox):
+                continue
 
-                    if abs(dx) > abs(dy):
-                        step_x = 1 if dx > 0 else -1
-                        enemy.x += step_x
-                    else:
-                        step_y = 1 if dy > 0 else -1
-                        enemy.y += step_y
+            # Dejar quieto a enemigos “normales” (NO al Diablo muerto)
+            if hasattr(enemy, "set_state") and enemy.state != "death":
+                enemy.set_state("idle")
 
-                    # actualizar hitbox
-                    e_hit = enemy.rect
+            # Separar enemigo del jugador de una sola vez
+            dx, dy = min_translation(e_hit, player_hitbox)
+            enemy.x += dx
+            enemy.y += dy
 
         # --- ENEMIGO ↔ ENEMIGO ---
-        n = len(self.enemies)
-        for i in range(n):
-            e1 = self.enemies[i]
-            if not e1.alive:
-                continue
+        for i, j in grid.candidate_pairs():
+            e1 = enemies[i]
+            e2 = enemies[j]
 
             r1 = e1.rect
+            r2 = e2.rect
 
-            for j in range(i + 1, n):
-                e2 = self.enemies[j]
-                if not e2.alive:
-                    continue
-
-                r2 = e2.rect
-
-                if not r1.colliderect(r2):
-                    continue
-
-                # Separar ambos en direcciones opuestas
-                while r1.colliderect(r2):
-
-                    dx = r2.centerx - r1.centerx
-                    dy = r2.centery - r1.centery
-
-                    if abs(dx) > abs(dy):
-                        step1_x = -1 if dx > 0 else 1
-                        step2_x = -step1_x
-
-                        e1.x += step1_x
-                        e2.x += step2_x
-                    else:
-                        step1_y = -1 if dy > 0 else 1
-                        step2_y = -step1_y
-
-                        e1.y += step1_y
-                        e2.y += step2_y
+            # Separar ambos en direcciones opuestas (mitad cada uno)
+            dx, dy = min_translation(r2, r1)
+            if dx == 0 and dy == 0:
+                continue
 
-                    # actualizar hitboxes
-                    r1 = e1.rect
-                    r2 = e2.rect
+            half_x = dx // 2
+            half_y = dy // 2
+            e1.x -= half_x
+            e1.y -= half_y
+            e2.x += dx - half_x
+            e2.y += dy - half_y
 
 
     def handle_player_attack_collisions(self):
@@ -589,7 +762,7 @@ class Game:
                     killed_now += 1
 
         # Quitar de la lista SOLO a los que ya terminaron animación de muerte
-        self.enemies = [e for e in self.enemies if e.alive]
+        self.remove_dead_enemies()
 
         # --- Si hubo kills, actualizamos todo ---
         if killed_now > 0:
@@ -617,13 +790,8 @@ class Game:
 
     def handle_item_collection(self):
         """Detecta si el jugador recoge un ítem."""
-        player_rect = pygame.Rect(
-            self.player.x + self.player.hitbox_offset_x,
-            self.player.y + self.player.hitbox_offset_y,
-            self.player.hitbox_width,
-            self.player.hitbox_height,
-        )
-        
+        player_rect = self.player.hitbox
+
         for item in self.items[:]:  # copiar lista para poder modificarla
             if item.collected:
                 continue
@@ -667,7 +835,7 @@ class Game:
 
     def update_enemy_spawning(self, dt: float):
         """Spawnea enemigos con el tiempo, limitado por max_enemies_on_screen."""
-        from core.settings import MAP_WIDTH_PX, MAP_HEIGHT_PX, TILE_SIZE
+        from core.settings import TILE_SIZE
 
         # Si estamos en combate con el jefe, NO spawneamos más orcos
         if self.boss_active or self.boss_spawned:
@@ -684,15 +852,11 @@ class Game:
 
         self.spawn_timer = 0.0
 
-        # Buscar posición aleatoria lejos del jugador
-        while True:
-            x = random.randint(0, MAP_WIDTH_PX - TILE_SIZE)
-            y = random.randint(0, MAP_HEIGHT_PX - TILE_SIZE)
-
-            dx = x - self.player.x
-            dy = y - self.player.y
-            if dx * dx + dy * dy > (TILE_SIZE * 8) ** 2:
-                break
+        # Posición lejos del jugador desde el índice de celdas válidas
+        point = self.spawn_index.sample((self.player.x, self.player.y), TILE_SIZE * 8, table="enemy")
+        if point is None:
+            return
+        x, y = point
 
         from core.settings import (
             ENEMY_BASE_HEALTH, ENEMY_BASE_DAMAGE,
@@ -704,8 +868,9 @@ class Game:
         health = int(ENEMY_BASE_HEALTH * (ENEMY_HEALTH_GROWTH ** level_index))
         damage = ENEMY_BASE_DAMAGE * (ENEMY_DAMAGE_GROWTH ** level_index)
 
-        enemy = Enemy(x, y, health=health, damage=damage, sound_manager=self.sound_manager)
-        self.enemies.append(enemy)
+        enemy = self.enemy_pool.acquire(x, y, health=health, damage=damage,
+                                        sound_manager=self.sound_manager)
+        self.add_enemy(enemy)
 
 
 
@@ -717,6 +882,10 @@ class Game:
         self.player.level += 1
         self.level = self.player.level
 
+        # A un nivel del jefe su música se va cargando en segundo plano
+        if self.level >= MAX_PLAYER_LEVEL - 1 and not self.boss_spawned:
+            self.music.prefetch(self.boss_music_path)
+
         # Si llegamos al nivel del jefe, lo spawneamos
         if self.level == 13 and not self.boss_spawned:
             self.spawn_boss_diablo()
@@ -775,9 +944,9 @@ class Game:
         overlay.fill((0, 0, 0, 180))
         self.screen.blit(overlay, (0, 0))
 
-        font_title = pygame.font.SysFont("arial", 32, bold=True)
-        font_opt = pygame.font.SysFont("arial", 22)
-        font_hint = pygame.font.SysFont("arial", 18)
+        font_title = text_cache.font("arial", 32, bold=True)
+        font_opt = text_cache.font("arial", 22)
+        font_hint = text_cache.font("arial", 18)
 
         title = font_title.render("¡Subes de nivel!", True, (255, 255, 255))
         hint = font_hint.render("Elige una mejora: 1-MOV  2-Fuerza  3-Rango  4-Resistencia", True, (220, 220, 220))
@@ -809,10 +978,38 @@ class Game:
             self.screen.blit(surf, (cx - surf.get_width() // 2, cy - 60 + i * 30))
 
 
+    # Pantallas que no cambian mientras no cambie el estado
+    STATIC_STATES = (GameState.MENU, GameState.PAUSED, GameState.GAME_OVER, GameState.VICTORY)
+
+    def invalidate_screen(self):
+        """Obliga a redibujar y presentar la pantalla completa en el próximo frame."""
+        self._full_redraw = True
+        self._static_screen_key = None
+
+    def mark_dirty(self, rect):
+        """Registra una zona de pantalla tocada este frame (solo en modo rectángulos sucios)."""
+        if self.dirty_rendering and not self._full_redraw:
+            self.dirty_rects.append(pygame.Rect(rect))
+
     def draw(self):
+        # Al cambiar de pantalla se presenta entera al menos una vez
+        if self.state != self._last_drawn_state:
+            self.invalidate_screen()
+            self._last_drawn_state = self.state
+
+        static_key = None
+        if self.state in self.STATIC_STATES:
+            static_key = (self.state, self.pending_level_up_choice)
+            if self.dirty_rendering and static_key == self._static_screen_key:
+                return  # ya está en pantalla y nada ha cambiado
+            self._full_redraw = True
+
+        self.dirty_rects = []
         self.screen.fill(COLOR_BG)
 
-        if self.state == GameState.MENU:
+        if self.state == GameState.LOADING:
+            self.draw_loading()
+        elif self.state == GameState.MENU:
             self.draw_menu()
         elif self.state == GameState.RUNNING:
             self.draw_game()
@@ -826,7 +1023,28 @@ class Game:
         elif self.state == GameState.VICTORY:
             self.draw_victory()
 
-        pygame.display.flip()
+        overlay_rect = self.profiler.draw(self.screen)
+        if overlay_rect is not None:
+            self.mark_dirty(overlay_rect)
+
+        with self.profiler.section("present"):
+            self.present()
+        self._static_screen_key = static_key
+
+    def present(self):
+        """flip() completo o display.update() con las zonas sucias de este frame y el anterior."""
+        if not self.dirty_rendering or self._full_redraw or self.state == GameState.LOADING:
+            pygame.display.flip()
+            self._prev_dirty_rects = []
+            self._full_redraw = False
+            self.render_stats["dirty_rects"] = -1
+            return
+
+        rects = self._prev_dirty_rects + self.dirty_rects
+        if rects:
+            pygame.display.update(rects)
+        self._prev_dirty_rects = self.dirty_rects
+        self.render_stats["dirty_rects"] = len(rects)
 
 
     def draw_pause_menu(self):
@@ -838,8 +1056,8 @@ class Game:
         overlay.fill((0, 0, 0, 160))
         self.screen.blit(overlay, (0, 0))
 
-        font_title = pygame.font.SysFont("arial", 40, bold=True)
-        font_small = pygame.font.SysFont("arial", 20)
+        font_title = text_cache.font("arial", 40, bold=True)
+        font_small = text_cache.font("arial", 20)
 
         text_title = font_title.render("PAUSA", True, (255, 255, 255))
 
@@ -885,30 +1103,48 @@ class Game:
             camera_offset[1] + shake_y,
         )
 
+        # Con la cámara moviéndose (o efectos a pantalla completa) cambia todo
+        if (
+            camera_offset != self._last_camera_offset
+            or self.special_effects
+            or self.flash_timer > 0
+        ):
+            self._full_redraw = True
+        self._last_camera_offset = camera_offset
+
+        profiler = self.profiler
+        profiler.mark()
+
         # 1) Mapa
         self.tile_map.draw(self.screen, camera_offset)
+        profiler.lap("draw.map")
 
         # 2) Construir lista de entidades ordenadas por profundidad (rect.bottom)
         drawables = []
 
+        # Culling: solo entran en la lista las entidades cerca del viewport
+        view = self.camera.get_view_rect(CULL_MARGIN, camera_offset)
+        drawn = 0
+        culled = 0
+
         special_ready = self.player.can_use_special_frontal() or self.player.can_use_special_spiral()
         # --- Enemigos ---
         for enemy in self.enemies:
             if not enemy.alive:
                 continue
 
+            if not self._is_on_screen(view, enemy):
+                culled += 1
+                continue
+            drawn += 1
+
             depth_rect = enemy.rect  # rect en coordenadas del mundo
             drawables.append(("enemy", depth_rect.bottom, enemy))
 
         # --- Jugador ---
         # Usamos hitbox reducida si es posible para la profundidad
-        if hasattr(self.player, "hitbox_width"):
-            player_rect_world = pygame.Rect(
-                self.player.x + self.player.hitbox_offset_x,
-                self.player.y + self.player.hitbox_offset_y,
-                self.player.hitbox_width,
-                self.player.hitbox_height,
-            )
+        if hasattr(self.player, "hitbox"):
+            player_rect_world = self.player.hitbox
         elif hasattr(self.player, "rect"):
             player_rect_world = self.player.rect
         else:
@@ -929,6 +1165,7 @@ class Game:
             if kind == "enemy":
                 # Sprite
                 obj.draw(self.screen, camera_offset)
+                self.mark_dirty(self._screen_rect(obj, camera_offset))
 
                 # Hitbox del enemigo (debug)
                 if DEBUG_DRAW_HITBOXES:
@@ -939,7 +1176,7 @@ class Game:
                         enemy_rect.width,
                         enemy_rect.height,
                     )
-                    pygame.draw.rect(self.screen, (0, 255, 0), debug_rect, 1)
+                    self.mark_dirty(pygame.draw.rect(self.screen, (0, 255, 0), debug_rect, 1))
 
                 # Campo de ataque del enemigo (debug)
                 if DEBUG_DRAW_ATTACK_FIELDS and hasattr(obj, "get_attack_hitbox"):
@@ -952,7 +1189,7 @@ class Game:
                             atk_rect.height,
                         )
                         # Magenta
-                        pygame.draw.rect(self.screen, (255, 0, 255), debug_atk, 2)
+                        self.mark_dirty(pygame.draw.rect(self.screen, (255, 0, 255), debug_atk, 2))
 
             elif kind == "player":
                 # Posición del jugador en pantalla
@@ -963,14 +1200,15 @@ class Game:
 
                 # --- Hurt flash (parpadeo blanco cuando recibe daño) ---
                 image_to_draw = obj.image
-                if getattr(obj, "is_hurt", False):
-                    t = pygame.time.get_ticks() // 40
-                    if t % 2 == 0:
-                        image_to_draw = obj.image.copy()
-                        image_to_draw.fill((255, 255, 255), special_flags=pygame.BLEND_RGB_ADD)
+                if getattr(obj, "is_hurt", False) and tint_cache.flash_on():
+                    image_to_draw = tint_cache.variant(obj.image, "flash")
 
                 # Dibujar sprite del jugador
                 self.screen.blit(image_to_draw, player_pos)
+                # Incluye el margen de las auras (inmunidad / especial listo)
+                self.mark_dirty(
+                    self._screen_rect(obj, camera_offset).inflate(obj.width, obj.height)
+                )
 
                 # --- Efecto de inmunidad ---
                 if obj.is_immune:
@@ -982,15 +1220,8 @@ class Game:
                     radius = int(obj.width * 0.8 + 5 * math.sin(t * 5))
                     alpha = int(150 + 80 * math.sin(t * 8))
                     
-                    immune_surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-                    pygame.draw.circle(
-                        immune_surface,
-                        (255, 215, 0, alpha),
-                        (radius, radius),
-                        radius,
-                        4
-                    )
-                    
+                    immune_surface = effect_cache.ring(radius, 4, (255, 215, 0), alpha)
+
                     self.screen.blit(
                         immune_surface,
                         (center_x - radius, center_y - radius)
@@ -1004,19 +1235,12 @@ class Game:
 
                     # radio del círculo
                     radius = int(obj.width * 0.7)
-                    aura_surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
 
                     # pequeño pulso con sin() para que respire
                     t = pygame.time.get_ticks() / 1000.0
                     alpha = 120 + int(80 * math.sin(t * 4))  # oscila entre ~40 y ~200
 
-                    pygame.draw.circle(
-                        aura_surface,
-                        (255, 255, 150, alpha),
-                        (radius, radius),
-                        radius,
-                        3
-                    )
+                    aura_surface = effect_cache.ring(radius, 3, (255, 255, 150), alpha)
 
                     # dibujamos la aura centrada en los pies
                     self.screen.blit(
@@ -1050,7 +1274,7 @@ class Game:
                             atk_rect.height,
                         )
                         # Amarillo
-                        pygame.draw.rect(self.screen, (255, 255, 0), debug_atk, 2)
+                        self.mark_dirty(pygame.draw.rect(self.screen, (255, 255, 0), debug_atk, 2))
                 
                 # 🔥 Swing del ataque del jugador (si está atacando)
                 swing_data = obj.get_attack_swing_sprite() if hasattr(obj, "get_attack_swing_sprite") else None
@@ -1060,18 +1284,37 @@ class Game:
                         swing_x - camera_offset[0],
                         swing_y - camera_offset[1],
                     )
-                    self.screen.blit(swing_img, swing_pos)
+                    self.mark_dirty(self.screen.blit(swing_img, swing_pos))
 
         # Dibujar ítems (siempre encima del suelo, debajo de entidades)
         for item in self.items:
+            if not self._is_on_screen(view, item):
+                culled += 1
+                continue
+            drawn += 1
             item.draw(self.screen, camera_offset)
+            # Incluye el brillo y la flotación del ítem
+            self.mark_dirty(self._screen_rect(item, camera_offset).inflate(16, 32))
+
+        # Jugador: siempre visible
+        self.render_stats["drawn"] = drawn + 1
+        self.render_stats["culled"] = culled
+        profiler.lap("draw.entities")
+
         # 4) UI siempre encima
         self.draw_ui()
+        profiler.lap("draw.ui")
 
         # Efectos visuales de habilidades especiales por encima de entidades
         self.draw_special_effects(camera_offset)
+        profiler.lap("draw.effects")
 
         self.minimap.draw(self.screen, self.player, self.enemies, self.items)
+        self.mark_dirty(self.minimap.rect.inflate(0, 40))
+        profiler.lap("draw.minimap")
+
+        if DEBUG_DRAW_RENDER_STATS:
+            self.draw_render_stats()
 
         if self.flash_timer > 0:
             alpha = int(255 * (self.flash_timer / 0.15))
@@ -1083,180 +1326,173 @@ class Game:
 
 
 
-    def draw_ui(self):
-
-        bar_width = 200
-        bar_height = 20
-        margin = 10
-
-        # --- Barra de vida ---
-        pygame.draw.rect(
-            self.screen,
-            (60, 60, 60),
-            pygame.Rect(margin, margin, bar_width, bar_height),
-            border_radius=4
+    def _is_on_screen(self, view, obj):
+        """
+        True si el sprite de `obj` (dibujado en x, y) toca el rect `view`.
+        Compara números directamente para no crear un Rect por entidad.
+        """
+        w = getattr(obj, "sprite_width", obj.width)
+        h = getattr(obj, "sprite_height", obj.height)
+        return (
+            obj.x + w > view.left
+            and obj.x < view.right
+            and obj.y + h > view.top
+            and obj.y < view.bottom
         )
 
-        ratio = self.player.health / self.player.max_health if self.player.max_health > 0 else 0
-        pygame.draw.rect(
-            self.screen,
-            (0, 200, 60),
-            pygame.Rect(margin, margin, int(bar_width * ratio), bar_height),
-            border_radius=4
+    def _screen_rect(self, obj, camera_offset):
+        """Rect en pantalla del frame actual de `obj` (o de su tamaño de sprite)."""
+        frames = getattr(obj, "current_frames", None)
+        if frames:
+            w, h = frames[obj.current_frame_index].get_size()
+        else:
+            w = getattr(obj, "sprite_width", obj.width)
+            h = getattr(obj, "sprite_height", obj.height)
+        return pygame.Rect(int(obj.x - camera_offset[0]), int(obj.y - camera_offset[1]), w, h)
+
+    def draw_render_stats(self):
+        """Overlay de depuración: entidades dibujadas vs. descartadas este frame."""
+        font = text_cache.font("arial", 14)
+        txt = font.render_uncached(
+            f"Dibujadas: {self.render_stats['drawn']}  Culled: {self.render_stats['culled']}"
+            f"  HUD: {self.hud.rerendered}"
+            f"  Rects: {self.render_stats.get('dirty_rects', -1)}"
+            f"  SFX: {self._sound_summary()}"
+            f"  Pool: {self._pool_summary()}",
+            True,
+            (180, 255, 180),
         )
+        self.mark_dirty(self.screen.blit(txt, (SCREEN_WIDTH - txt.get_width() - 10, 70)))
 
-        # Marco
-        pygame.draw.rect(
-            self.screen,
-            (255, 255, 255),
-            pygame.Rect(margin, margin, bar_width, bar_height),
-            2,
-            border_radius=4
-        )
+    def _sound_summary(self):
+        if self.sound_manager is None:
+            return "-"
+        c = self.sound_manager.counters
+        return f"{c['played']}/{c['triggered']}"
 
-        # --- Texto: LVL y Score ---
-        font = pygame.font.SysFont("arial", 18)
+    def _pool_summary(self):
+        stats = self.enemy_pool.stats()
+        return f"{stats['free']} ({stats['reuse_rate']:.0%})"
 
-        txt_level = font.render(f"Nivel: {self.level}", True, (230, 230, 230))
-        txt_score = font.render(f"Score: {self.score}", True, (230, 230, 230))
+    def build_hud(self):
+        """Widgets del HUD; cada uno lee su valor en cada frame y solo se redibuja si cambió."""
+        from core.settings import SPECIAL_FRONTAL_KILLS, SPECIAL_SPIRAL_KILLS
 
-        self.screen.blit(txt_level, (margin, margin + bar_height + 8))
-        self.screen.blit(txt_score, (margin, margin + bar_height + 8 + txt_level.get_height()))
+        self.hud = Hud()
+        self._hud_boss = None
 
-        txt_xp = font.render(
-            f"XP: {int(self.player.xp)}/{self.player.xp_to_next}",
-            True,
-            (180, 200, 255)
-        )
-        self.screen.blit(
-            txt_xp,
-            (margin, margin + bar_height + 8 + txt_level.get_height() + txt_score.get_height())
-        )
+        bar_width = 200
+        bar_height = 20
+        margin = 10
+        line = text_cache.font("arial", 18).get_height()
+        text_y = margin + bar_height + 8
 
-        # Vendas
-        txt_bandages = font.render(f"Vendas (H): {self.player.bandages}", True, (180, 220, 255))
-        self.screen.blit(
-            txt_bandages,
-            (margin, margin + bar_height + 8 + txt_level.get_height() + txt_score.get_height() + txt_xp.get_height())
-        )
-        # Indicador de inmunidad
-        if self.player.is_immune:
+        def blink():
+            # pequeño parpadeo usando el tiempo global (cambia cada 150 ms)
+            return (pygame.time.get_ticks() // 150) % 2 == 0
+
+        def special_ready():
+            return self.player.can_use_special_frontal() or self.player.can_use_special_spiral()
+
+        def immune_state():
+            if not self.player.is_immune:
+                return None
             time_left = self.player.immunity_duration - self.player.immunity_timer
-            
-            # Texto parpadeante
-            t = pygame.time.get_ticks() // 150
-            if t % 2 == 0:
-                color = (255, 215, 0)  # Dorado
-            else:
-                color = (255, 255, 150)  # Amarillo claro
-            
-            txt_immune = font.render(
-                f"¡INMUNE! {time_left:.1f}s",
-                True,
-                color
-            )
-            
-            # Posición centrada arriba
-            self.screen.blit(
-                txt_immune,
-                (SCREEN_WIDTH // 2 - txt_immune.get_width() // 2, 20)
-            )
+            color = (255, 215, 0) if blink() else (255, 255, 150)  # Dorado / amarillo claro
+            return f"¡INMUNE! {time_left:.1f}s", color
 
-        # Contador especial
-        from core.settings import SPECIAL_FRONTAL_KILLS, SPECIAL_SPIRAL_KILLS
+        def special_state():
+            special = self.player.special_kill_counter
+            color = (255, 220, 120) if special_ready() else (200, 200, 200)
+            return f"Especial: {special}/{SPECIAL_FRONTAL_KILLS} (Q) | {special}/{SPECIAL_SPIRAL_KILLS} (E)", color
 
-        special = self.player.special_kill_counter
-        ready = self.player.can_use_special_frontal() or self.player.can_use_special_spiral()
+        def boss_ratio():
+            boss = self._hud_boss
+            if boss is None or not boss.alive:
+                return None
+            return boss.health / boss.max_health
 
-        color = (255, 220, 120) if ready else (200, 200, 200)
-        txt_special = font.render(
-            f"Especial: {special}/{SPECIAL_FRONTAL_KILLS} (Q) | {special}/{SPECIAL_SPIRAL_KILLS} (E)",
-            True,
-            color
-        )
-        self.screen.blit(
-            txt_special,
-            (margin, SCREEN_HEIGTH - txt_special.get_height() - margin)
-        )
+        def boss_text():
+            boss = self._hud_boss
+            if boss is None or not boss.alive:
+                return None
+            return f"Boss HP: {int(boss.health)}/{int(boss.max_health)}", (255, 230, 230)
 
-        # Indicador extra cuando el especial está listo
-        if ready:
-            # pequeño parpadeo usando el tiempo global
-            t = pygame.time.get_ticks() // 150  # cambia cada 150 ms
-            if t % 2 == 0:
-                ready_text = "¡ESPECIAL LISTA!"
-                txt_ready = font.render(ready_text, True, (255, 255, 150))
-                # lo dibujamos justo encima de la línea de especial
-                self.screen.blit(
-                    txt_ready,
-                    (margin, SCREEN_HEIGTH - txt_special.get_height() - margin - txt_ready.get_height() - 4)
-                )
-    
-         # -----------------------------------
-        # Barra de vida del JEFE (si existe)
-        # -----------------------------------
+        hud = self.hud
+
+        # --- Barra de vida ---
+        hud.add(BarWidget(
+            (margin, margin), (bar_width, bar_height),
+            lambda: self.player.health / self.player.max_health if self.player.max_health > 0 else 0,
+            back_color=(60, 60, 60), fill_color=(0, 200, 60),
+        ))
+
+        # --- Texto: LVL, Score, XP y vendas ---
+        hud.add(TextWidget((margin, text_y), lambda: (f"Nivel: {self.level}", (230, 230, 230))))
+        hud.add(TextWidget((margin, text_y + line), lambda: (f"Score: {self.score}", (230, 230, 230))))
+        hud.add(TextWidget(
+            (margin, text_y + 2 * line),
+            lambda: (f"XP: {int(self.player.xp)}/{self.player.xp_to_next}", (180, 200, 255)),
+        ))
+        hud.add(TextWidget(
+            (margin, text_y + 3 * line),
+            lambda: (f"Vendas (H): {self.player.bandages}", (180, 220, 255)),
+        ))
+
+        # Indicador de inmunidad (centrado arriba)
+        hud.add(TextWidget((SCREEN_WIDTH // 2, 20), immune_state, anchor="midtop"))
+
+        # Contador especial e indicador extra cuando está listo
+        hud.add(TextWidget((margin, SCREEN_HEIGTH - margin), special_state, anchor="bottomleft"))
+        hud.add(TextWidget(
+            (margin, SCREEN_HEIGTH - margin - line - 4),
+            lambda: ("¡ESPECIAL LISTA!", (255, 255, 150)) if special_ready() and blink() else None,
+            anchor="bottomleft",
+        ))
+
+        # Barra de vida del JEFE (arriba a la derecha)
+        boss_bar_width = 250
+        boss_bar_height = 22
+        boss_margin = 20
+        x = SCREEN_WIDTH - boss_bar_width - boss_margin
+        y = boss_margin
+        hud.add(BarWidget(
+            (x, y), (boss_bar_width, boss_bar_height), boss_ratio,
+            back_color=(60, 0, 0), fill_color=(255, 0, 80),   # rojo brillante estilo "boss"
+        ))
+        hud.add(TextWidget(
+            (x + boss_bar_width // 2, y + boss_bar_height + 4), boss_text, bold=True, anchor="midtop",
+        ))
+
+    def draw_ui(self):
         # Verificar si hay un jefe vivo en pantalla
         boss = None
         for e in self.enemies:
             if hasattr(e, "is_boss") or e.__class__.__name__.lower().startswith("boss"):
                 boss = e
                 break
+        self._hud_boss = boss
 
-        if boss and boss.alive:
-            # Ajustes de tamaño
-            boss_bar_width = 250
-            boss_bar_height = 22
-            margin = 20
-
-            # Posición (arriba a la derecha)
-            x = SCREEN_WIDTH - boss_bar_width - margin
-            y = margin
-
-            # Fondo oscuro de la barra
-            pygame.draw.rect(
-                self.screen,
-                (60, 0, 0),
-                pygame.Rect(x, y, boss_bar_width, boss_bar_height),
-                border_radius=4
-            )
-
-            # Vida actual
-            ratio = max(0.0, boss.health / boss.max_health)
-            pygame.draw.rect(
-                self.screen,
-                (255, 0, 80),   # rojo brillante estilo "boss"
-                pygame.Rect(x, y, int(boss_bar_width * ratio), boss_bar_height),
-                border_radius=4
-            )
-
-            # Marco
-            pygame.draw.rect(
-                self.screen,
-                (255, 255, 255),
-                pygame.Rect(x, y, boss_bar_width, boss_bar_height),
-                2,
-                border_radius=4
-            )
-
-            # Texto opcional
-            font = pygame.font.SysFont("arial", 18, bold=True)
-            txt = font.render(f"Boss HP: {int(boss.health)}/{int(boss.max_health)}", True, (255, 230, 230))
-            self.screen.blit(txt, (x + boss_bar_width//2 - txt.get_width()//2, y + boss_bar_height + 4))
+        self.hud.draw(self.screen)
+        for rect in self.hud.dirty_rects:
+            self.mark_dirty(rect)
 
 
 
     def draw_menu(self):
         if getattr(self, "menu_background", None) is not None:
-            bg = pygame.transform.scale(
-                self.menu_background,
-                (SCREEN_WIDTH, SCREEN_HEIGTH)
-            )
-            self.screen.blit(bg, (0, 0))
+            # Escalado una sola vez (el fondo no cambia)
+            if self._menu_background_scaled is None:
+                self._menu_background_scaled = pygame.transform.scale(
+                    self.menu_background,
+                    (SCREEN_WIDTH, SCREEN_HEIGTH)
+                )
+            self.screen.blit(self._menu_background_scaled, (0, 0))
         else:
             self.screen.fill(COLOR_BG)
 
-        font = pygame.font.SysFont("arial", 32, bold=True)
-        hint_font = pygame.font.SysFont("arial", 20)
+        font = text_cache.font("arial", 32, bold=True)
+        hint_font = text_cache.font("arial", 20)
 
         title_surf = font.render("The Epic Feat of Octavio Mesa", True, (240, 240, 240))
         hint_surf = hint_font.render("ENTER / ESPACIO: Nueva partida   |   Q: Salir", True, (200, 200, 200))
@@ -1272,7 +1508,7 @@ class Game:
 
         # Resumen de la última partida (si existe)
         if self.last_run_summary is not None:
-            small = pygame.font.SysFont("arial", 18)
+            small = text_cache.font("arial", 18)
             t = self.format_time(self.last_run_summary["time"])
             txt = small.render(
                 f"Última partida — Nivel {self.last_run_summary['level']} | "
@@ -1297,8 +1533,8 @@ class Game:
         overlay.fill((0, 0, 0, 160))
         self.screen.blit(overlay, (0, 0))
 
-        font_big = pygame.font.SysFont("arial", 40, bold=True)
-        font_small = pygame.font.SysFont("arial", 20)
+        font_big = text_cache.font("arial", 40, bold=True)
+        font_small = text_cache.font("arial", 20)
 
         text_go = font_big.render("GAME OVER", True, (255, 80, 80))
         text_score = font_small.render(f"Puntuación: {self.score}", True, (230, 230, 230))
@@ -1319,12 +1555,7 @@ class Game:
         """Rect básico frente al jugador si no está atacando justo ahora."""
         import pygame
 
-        base_rect = pygame.Rect(
-            self.player.x + self.player.hitbox_offset_x,
-            self.player.y + self.player.hitbox_offset_y,
-            self.player.hitbox_width,
-            self.player.hitbox_height,
-        )
+        base_rect = self.player.hitbox
 
         if self.player.facing == 'up':
             return pygame.Rect(
@@ -1506,8 +1737,8 @@ class Game:
             if eff.get("shockwave", False):
                 radius = int(40 + 120 * progress)
                 alpha = int(200 * (1 - progress))
-                sw = pygame.Surface((radius*2, radius*2), pygame.SRCALPHA)
-                pygame.draw.circle(sw, (255,255,255, alpha), (radius, radius), radius, 4)
+                sw = effect_cache.ring(radius, 4, (255, 255, 255), alpha, radius_step=4)
+                radius = sw.get_width() // 2
                 self.screen.blit(sw, (screen_x - radius, screen_y - radius))
 
 
@@ -1523,7 +1754,7 @@ class Game:
             if eff["type"] == "frontal":
 
                 scale = 1.0 + 1.5 * progress
-                img = pygame.transform.rotozoom(base_frame, 0, scale)
+                img = effect_cache.scaled(base_frame, scale)
                 rect = img.get_rect(center=(screen_x, screen_y))
 
                 # desplazamiento hacia adelante
@@ -1569,31 +1800,19 @@ class Game:
                     ex = screen_x + math.cos(ang) * dist
                     ey = screen_y + math.sin(ang) * dist
 
-                    img = pygame.transform.rotozoom(base_frame_dir, 0, scale)
+                    img = effect_cache.scaled(base_frame_dir, scale)
                     rect = img.get_rect(center=(ex, ey))
                     self.screen.blit(img, rect.topleft)
 
     def start_boss_music(self):
-        base_path = os.path.dirname(__file__)
-        music_path = os.path.join(base_path, "..", "assets", "Sounds", "LaPeleaConelDiablo.wav")
-
-        try:
-            pygame.mixer.music.load(music_path)
-            pygame.mixer.music.set_volume(0.07)
-            pygame.mixer.music.play(-1)  # loop infinito
-        except pygame.error as e:
-            print("Error cargando música del jefe:", e)
+        self.music.play(self.boss_music_path, volume=0.07)
 
     def stop_music(self):
-        """Detiene cualquier música que esté sonando."""
-        try:
-            pygame.mixer.music.stop()
-        except pygame.error:
-            pass
-
-    def start_normal_music(self):
-        """Reproduce una canción aleatoria (no repite la misma dos veces seguidas)."""
+        """Desvanece cualquier música que esté sonando."""
+        self.music.stop()
 
+    def prefetch_normal_music(self):
+        """Elige la próxima canción (sin repetir la última) y empieza a cargarla."""
         if not self.normal_music_tracks:
             return
 
@@ -1601,17 +1820,22 @@ class Game:
         if self.last_music_index in choices and len(choices) > 1:
             choices.remove(self.last_music_index)
 
-        index = random.choice(choices)
-        path = self.normal_music_tracks[index]
+        self.next_music_index = random.choice(choices)
+        self.music.prefetch(self.normal_music_tracks[self.next_music_index])
 
-        try:
-            pygame.mixer.music.load(path)
-            pygame.mixer.music.set_volume(0.02)
-            pygame.mixer.music.play(-1)   # loop
-            self.last_music_index = index
-        except pygame.error as e:
-            print("Error cargando música normal:", e)
+    def start_normal_music(self):
+        """Reproduce la canción ya precargada y deja cargando la siguiente."""
 
+        if not self.normal_music_tracks:
+            return
+
+        if self.next_music_index is None:
+            self.prefetch_normal_music()
+
+        index = self.next_music_index
+        self.music.play(self.normal_music_tracks[index], volume=0.02)
+        self.last_music_index = index
+        self.prefetch_normal_music()
 
     def spawn_boss_diablo(self):
         """Invoca al jefe Diablo y prepara el combate."""
@@ -1622,7 +1846,7 @@ class Game:
         self.boss_active = True
 
         # Limpiar enemigos normales
-        self.enemies.clear()
+        self.release_all_enemies()
 
         # Posicionar al jefe cerca del centro del mapa
         boss_x = self.player.x + 150
@@ -1633,14 +1857,13 @@ class Game:
         # Rugido al aparecer
         self.sound_manager.play("diablo_roar")
 
-        # Música del jefe
-        self.stop_music()
+        # Música del jefe (fundido cruzado desde la actual)
         self.start_boss_music()
     
     def draw_victory(self):
 
-        font_big = pygame.font.SysFont("arial", 48, bold=True)
-        font_small = pygame.font.SysFont("arial", 24)
+        font_big = text_cache.font("arial", 48, bold=True)
+        font_small = text_cache.font("arial", 24)
 
         time_text = self.format_time(int(self.run_time))
 
@@ -1663,13 +1886,100 @@ class Game:
 
 
 
-    def run(self):
-        while self.running:
-            dt_ms = self.clock.tick(FPS)
-            dt = dt_ms / 1000.0
-            self.handle_events()
-            self.update(dt)
-            self.draw()
+    # ----------------------
+    # PASO FIJO E INTERPOLACIÓN
+    # ----------------------
+    def _moving_objects(self):
+        if self.player is None:
+            return []
+        return [self.player] + self.enemies
 
+    def step(self, dt: float):
+        """Un paso de simulación; guarda antes las posiciones para interpolar el render."""
+        if self.state == GameState.RUNNING:
+            for obj in self._moving_objects():
+                obj.prev_x = obj.x
+                obj.prev_y = obj.y
+        self.update(dt)
+
+    def begin_interpolation(self, alpha: float):
+        """
+        Coloca jugador, enemigos y cámara en prev + (actual - prev) * alpha
+        para dibujar; end_interpolation() devuelve las posiciones reales.
+        """
+        self._interp_saved = []
+        if self.state != GameState.RUNNING:
+            return
+
+        for obj in self._moving_objects():
+            x, y = obj.x, obj.y
+            prev_x = getattr(obj, "prev_x", x)
+            prev_y = getattr(obj, "prev_y", y)
+            if prev_x == x and prev_y == y:
+                continue
+            self._interp_saved.append((obj, x, y))
+            obj.x = prev_x + (x - prev_x) * alpha
+            obj.y = prev_y + (y - prev_y) * alpha
+
+        self._interp_camera = (self.camera.x, self.camera.y)
+        self.camera.update(self.player)
+
+    def end_interpolation(self):
+        for obj, x, y in self._interp_saved:
+            obj.x = x
+            obj.y = y
+        self._interp_saved = []
+        if self._interp_camera is not None:
+            self.camera.x, self.camera.y = self._interp_camera
+            self._interp_camera = None
+
+    def flush_sounds(self):
+        """Reproduce los sonidos pedidos en el frame (fusionados por clave) y avanza la música."""
+        with self.profiler.section("sound"):
+            self.music.update()
+            if self.sound_manager is None:
+                return
+            listener = (self.player.x, self.player.y) if self.player is not None else None
+            self.sound_manager.flush(listener)
+
+    def run(self):
+        if not FIXED_TIMESTEP:
+            while self.running:
+                dt_ms = self.clock.tick(FPS)
+                dt = dt_ms / 1000.0
+                with self.profiler.section("events"):
+                    self.handle_events()
+                self.update(dt)
+                self.draw()
+                self.flush_sounds()
+                self.profiler.end_frame()
+        else:
+            sim_dt = 1.0 / SIM_TICK_RATE
+            accumulator = 0.0
+            while self.running:
+                accumulator += self.clock.tick(FPS) / 1000.0
+                with self.profiler.section("events"):
+                    self.handle_events()
+
+                steps = 0
+                while accumulator >= sim_dt and steps < SIM_MAX_CATCHUP_STEPS:
+                    self.step(sim_dt)
+                    accumulator -= sim_dt
+                    steps += 1
+                if steps == SIM_MAX_CATCHUP_STEPS and accumulator >= sim_dt:
+                    # Demasiado atrasados: se descarta el resto en vez de acumular
+                    accumulator = 0.0
+
+                if SIM_INTERPOLATE:
+                    self.begin_interpolation(accumulator / sim_dt)
+                    self.draw()
+                    self.end_interpolation()
+                else:
+                    self.draw()
+                self.flush_sounds()
+                self.profiler.end_frame()
+
+        assets.shutdown()
+        self.music.shutdown()
         pygame.quit()
         sys.exit()
@@ -1,4 +1,5 @@
 class GameState:
+    LOADING = "loading"   # pantalla de carga mientras se preparan los recursos
     MENU = "menu"
     RUNNING = "running"
     GAME_OVER = "game_over"
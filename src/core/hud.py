@@ -0,0 +1,127 @@
+import pygame
+
+from graphics.text_cache import text_cache
+
+
+_UNSET = object()
+
+
+class HudWidget:
+    """
+    Elemento del HUD en modo retenido.
+
+    `state_fn()` devuelve el valor del que depende el widget (None = oculto).
+    Solo se vuelve a renderizar cuando ese valor cambia; si no, se reutiliza
+    la Surface del frame anterior. `anchor` es un atributo de pygame.Rect
+    ("topleft", "midtop", "bottomleft", ...) que se coloca en `pos`.
+    Las subclases implementan `render(state) -> pygame.Surface`.
+    """
+
+    def __init__(self, pos, state_fn, anchor: str = "topleft"):
+        self.pos = pos
+        self.state_fn = state_fn
+        self.anchor = anchor
+
+        self.state = _UNSET
+        self.surface = None
+        self.rect = None
+
+    def normalize(self, state):
+        """Reduce el valor a lo que realmente cambia el dibujo (p. ej. píxeles de una barra)."""
+        return state
+
+    def refresh(self) -> bool:
+        """True si el widget se volvió a renderizar en esta llamada."""
+        state = self.state_fn()
+        if state is not None:
+            state = self.normalize(state)
+        if state == self.state:
+            return False
+
+        self.state = state
+        if state is None:
+            self.surface = None
+            self.rect = None
+        else:
+            self.surface = self.render(state)
+            self.rect = self.surface.get_rect(**{self.anchor: self.pos})
+        return True
+
+    def invalidate(self):
+        self.state = _UNSET
+
+
+class TextWidget(HudWidget):
+    """Texto de una línea; state_fn devuelve (texto, color) o None."""
+
+    def __init__(self, pos, state_fn, size: int = 18, bold: bool = False, anchor: str = "topleft"):
+        super().__init__(pos, state_fn, anchor)
+        self.font = text_cache.font("arial", size, bold=bold)
+
+    def render(self, state):
+        text, color = state
+        return self.font.render(text, True, color)
+
+
+class BarWidget(HudWidget):
+    """Barra de vida con fondo, relleno y marco; state_fn devuelve la fracción 0..1 o None."""
+
+    def __init__(self, pos, size, state_fn, back_color, fill_color,
+                 frame_color=(255, 255, 255), anchor: str = "topleft"):
+        super().__init__(pos, state_fn, anchor)
+        self.size = size
+        self.back_color = back_color
+        self.fill_color = fill_color
+        self.frame_color = frame_color
+
+    def normalize(self, ratio):
+        # Ancho en píxeles del relleno: solo se redibuja cuando cambia
+        return int(self.size[0] * max(0.0, min(1.0, ratio)))
+
+    def render(self, fill_width):
+        width, height = self.size
+        surface = pygame.Surface(self.size, pygame.SRCALPHA)
+        pygame.draw.rect(surface, self.back_color, (0, 0, width, height), border_radius=4)
+        pygame.draw.rect(surface, self.fill_color, (0, 0, fill_width, height), border_radius=4)
+        pygame.draw.rect(surface, self.frame_color, (0, 0, width, height), 2, border_radius=4)
+        return surface
+
+
+class Hud:
+    """
+    HUD en modo retenido: cada widget conserva su Surface y solo se vuelve
+    a renderizar cuando cambia su valor.
+    `rerendered` cuenta los widgets re-renderizados en el último frame y
+    `dirty_rects` guarda las zonas de pantalla que cambiaron (antes y después).
+    """
+
+    def __init__(self):
+        self.widgets: list[HudWidget] = []
+        self.rerendered = 0
+        self.dirty_rects: list[pygame.Rect] = []
+
+    def add(self, widget: HudWidget) -> HudWidget:
+        self.widgets.append(widget)
+        return widget
+
+    def invalidate(self):
+        """Fuerza a re-renderizar todo en el próximo frame (p. ej. nueva partida)."""
+        for widget in self.widgets:
+            widget.invalidate()
+
+    def update(self):
+        self.rerendered = 0
+        self.dirty_rects = []
+        for widget in self.widgets:
+            old_rect = widget.rect
+            if widget.refresh():
+                self.rerendered += 1
+                for rect in (old_rect, widget.rect):
+                    if rect is not None:
+                        self.dirty_rects.append(rect)
+
+    def draw(self, screen: pygame.Surface):
+        self.update()
+        for widget in self.widgets:
+            if widget.surface is not None:
+                screen.blit(widget.surface, widget.rect)
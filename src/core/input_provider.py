@@ -0,0 +1,77 @@
+import random
+
+import pygame
+
+
+class KeyboardInput:
+    """Teclado y ratón reales (modo normal con ventana)."""
+
+    def get_pressed(self):
+        return pygame.key.get_pressed()
+
+    def mouse_pressed(self):
+        return pygame.mouse.get_pressed()
+
+
+class PressedKeys:
+    """Sustituto de pygame.key.get_pressed(): keys[K_x] -> bool."""
+
+    def __init__(self, keys=()):
+        self.keys = frozenset(keys)
+
+    def __getitem__(self, key):
+        return key in self.keys
+
+
+NO_MOUSE = (False, False, False)
+
+
+class ScriptedInput:
+    """
+    Reproduce en bucle un guion [(ticks, teclas), ...]: mantiene pulsadas
+    `teclas` durante `ticks` llamadas a get_pressed() (una por Player.update).
+    """
+
+    def __init__(self, script):
+        self.script = [(max(1, int(ticks)), PressedKeys(keys)) for ticks, keys in script]
+        self.index = 0
+        self.remaining = self.script[0][0] if self.script else 0
+
+    def get_pressed(self):
+        if not self.script:
+            return PressedKeys()
+        if self.remaining <= 0:
+            self.index = (self.index + 1) % len(self.script)
+            self.remaining = self.script[self.index][0]
+        self.remaining -= 1
+        return self.script[self.index][1]
+
+    def mouse_pressed(self):
+        return NO_MOUSE
+
+
+class RandomInput(ScriptedInput):
+    """
+    Paseo aleatorio reproducible: cada `hold_ticks` ticks elige una o dos
+    teclas de movimiento y, con probabilidad `attack_chance`, ataca (J).
+    """
+
+    MOVE_KEYS = (pygame.K_w, pygame.K_s, pygame.K_a, pygame.K_d)
+
+    def __init__(self, seed=None, hold_ticks: int = 20, attack_chance: float = 0.3):
+        self.rng = random.Random(seed)
+        self.hold_ticks = hold_ticks
+        self.attack_chance = attack_chance
+        super().__init__([])
+        self.current = PressedKeys()
+        self.remaining = 0
+
+    def get_pressed(self):
+        if self.remaining <= 0:
+            keys = self.rng.sample(self.MOVE_KEYS, self.rng.randint(0, 2))
+            if self.rng.random() < self.attack_chance:
+                keys.append(pygame.K_j)
+            self.current = PressedKeys(keys)
+            self.remaining = self.hold_ticks
+        self.remaining -= 1
+        return self.current
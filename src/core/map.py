@@ -1,13 +1,42 @@
+import hashlib
 import os
 import pygame
 import random
+import numpy as np
+from collections import OrderedDict
 from perlin_noise import PerlinNoise
-from core.settings import TILE_SIZE, MAP_WIDTH_TILES, MAP_HEIGHT_TILES
+from core.noise import perlin_grid, balanced_thresholds
+from core.asset_loader import assets
+from core.settings import (
+    TILE_SIZE, MAP_WIDTH_TILES, MAP_HEIGHT_TILES,
+    MAP_CHUNKED, MAP_CHUNK_TILES, MAP_CHUNK_BUDGET_MB,
+    MAP_CHUNK_PREFETCH, MAP_CHUNK_KEEP_RADIUS,
+    MAP_CACHE_ENABLED, MAP_CACHE_DIR, MAP_CACHE_VERSION,
+)
 
 
 
+class _TileRecorder:
+    """Target falso para _draw_tile: guarda los blits (imagen, posición) en vez de pintarlos."""
+
+    def __init__(self):
+        self.ops = []
+
+    def blit(self, image, pos):
+        self.ops.append((image, pos))
+
+
 class TileMap:
-    def __init__(self, tile_size=TILE_SIZE, width=MAP_WIDTH_TILES, height=MAP_HEIGHT_TILES):
+    # Carpetas de sprites usadas por el mapa: clave -> (ruta relativa, tamaño máximo)
+    ASSET_FOLDERS = {
+        "floor": (("Nature Floor",), None),
+        "particles": (("Objects", "Grass Particles"), None),
+        "shadows": (("Objects", "Shadow Grass"), (32, 32)),
+        "stones": (("Objects", "Stones"), None),
+    }
+
+    def __init__(self, tile_size=TILE_SIZE, width=MAP_WIDTH_TILES, height=MAP_HEIGHT_TILES,
+                 chunked=None, seed=None, use_cache=None):
         self.tile_size = tile_size
         self.width = width
         self.height = height
@@ -16,22 +45,52 @@ class TileMap:
         self.surfaces = {}
         self.map_surface = None
 
-        # Generadores de ruido
-        self.noise_biome = PerlinNoise(octaves=2, seed=random.randint(0, 5000))
-        self.noise_detail = PerlinNoise(octaves=4, seed=random.randint(0, 20000))
+        # Semilla del mapa: de ella salen el ruido y las decoraciones, así que
+        # la misma semilla produce el mismo mapa (y la misma entrada de caché)
+        self.seed = seed if seed is not None else random.randint(0, 1_000_000)
+        seed_rng = random.Random(self.seed)
+
+        # Generadores de ruido (semilla > 0: PerlinNoise trata 0 como "aleatoria")
+        self.noise_biome = PerlinNoise(octaves=2, seed=seed_rng.randint(1, 5000))
+        self.noise_detail = PerlinNoise(octaves=4, seed=seed_rng.randint(1, 20000))
+
+        # --- Caché en disco (ruido + mapa renderizado / chunks) ---
+        # Solo con semilla explícita: un mapa aleatorio de una partida no se repite
+        if use_cache is None:
+            use_cache = MAP_CACHE_ENABLED and seed is not None
+        self.use_cache = use_cache
+        self._cache_key = None
+
+        # --- Modo por chunks (mundos grandes) ---
+        # En vez de un map_surface gigante, el mundo se parte en chunks de
+        # MAP_CHUNK_TILES x MAP_CHUNK_TILES que se generan al acercarse la
+        # cámara y viven en un LRU limitado por MAP_CHUNK_BUDGET_MB.
+        self.chunked = MAP_CHUNKED if chunked is None else chunked
+        self.chunk_tiles = MAP_CHUNK_TILES
+        self.chunk_px = self.chunk_tiles * self.tile_size
+        self.chunks_x = (self.width + self.chunk_tiles - 1) // self.chunk_tiles
+        self.chunks_y = (self.height + self.chunk_tiles - 1) // self.chunk_tiles
+        self.chunk_budget_bytes = int(MAP_CHUNK_BUDGET_MB * 1024 * 1024)
+        self.chunks: OrderedDict[tuple[int, int], pygame.Surface] = OrderedDict()
+        self.chunk_bytes = 0
+        # Semilla de decoraciones: un chunk regenerado tras ser expulsado es idéntico
+        self.chunk_seed = self.seed
 
     # ---------------------------------------------------------------------
     # 🔹 Cargar sprites y ajustar tamaños
     # ---------------------------------------------------------------------
-    def load_images(self):
-        base_path = os.path.join("assets", "sprites")
+    def _asset_folder(self, key):
+        parts, _ = self.ASSET_FOLDERS[key]
+        return os.path.join("assets", "sprites", *parts)
 
+    def load_images(self):
         def load_folder(folder_path, max_size=None):
             images = []
-            for file in os.listdir(folder_path):
+            # Orden estable: la elección aleatoria depende del orden de la lista
+            for file in sorted(os.listdir(folder_path)):
                 if file.endswith(".png"):
                     path = os.path.join(folder_path, file)
-                    image = pygame.image.load(path).convert_alpha()
+                    image = assets.image(path)
                     if max_size:
                         w, h = image.get_size()
                         if w > max_size[0] or h > max_size[1]:
@@ -41,32 +100,29 @@ class TileMap:
                     images.append((file, image))
             return images
 
-        self.surfaces["floor"] = load_folder(os.path.join(base_path, "Nature Floor"))
-        self.surfaces["particles"] = load_folder(os.path.join(base_path, "Objects", "Grass Particles"))
-        self.surfaces["shadows"] = load_folder(os.path.join(base_path, "Objects", "Shadow Grass"), max_size=(32, 32))
-        self.surfaces["stones"] = load_folder(os.path.join(base_path, "Objects", "Stones"))
+        for key, (_, max_size) in self.ASSET_FOLDERS.items():
+            self.surfaces[key] = load_folder(self._asset_folder(key), max_size=max_size)
 
     # ---------------------------------------------------------------------
     # 🔹 Generar mapa procedural con biomas balanceados
     # ---------------------------------------------------------------------
     def generate_noise_map(self):
-        """Usa un mapa de ruido y mapeo de percentiles para equilibrar biomas."""
-        raw_values = []
-        for y in range(self.height):
-            row = []
-            for x in range(self.width):
-                v = self.noise_biome([x / 25, y / 25])
-                v += 0.3 * self.noise_detail([x / 10, y / 10])
-                row.append(v)
-                raw_values.append(v)
-            self.biome_map.append(row)
+        """
+        Usa un mapa de ruido y mapeo de percentiles para equilibrar biomas.
+        El campo completo se evalúa en bloque con NumPy (perlin_grid), con
+        los mismos valores que llamar a noise_biome/noise_detail por tile.
+        """
+        cols = np.arange(self.width)
+        rows = np.arange(self.height)
+
+        field = perlin_grid(self.noise_biome, cols / 25, rows / 25)
+        field += 0.3 * perlin_grid(self.noise_detail, cols / 10, rows / 10)
+
+        self.biome_field = field
+        self.biome_map = field.tolist()
 
         # Balancear proporciones (campo, rocoso, húmedo ≈ 1/3 cada uno)
-        sorted_vals = sorted(raw_values)
-        n = len(sorted_vals)
-        th1 = sorted_vals[n // 3]
-        th2 = sorted_vals[2 * n // 3]
-        self.thresholds = (th1, th2)
+        self.thresholds = balanced_thresholds(field)
 
     def get_biome(self, v):
         """Asigna bioma en proporciones similares."""
@@ -107,81 +163,351 @@ class TileMap:
     # 🔹 Construir mapa final
     # ---------------------------------------------------------------------
     def build_map(self):
+        # 1) Campo de biomas: desde caché si existe, si no se genera y se guarda
+        if not self._load_noise_cache():
+            self.generate_noise_map()
+            self._save_noise_cache()
+        self.classify_tiles()
+
+        if self.chunked:
+            # Los chunks se generan (o leen de disco) bajo demanda desde draw()
+            self.load_images()
+            self.prepare_tile_tables()
+            self.chunks.clear()
+            self.chunk_bytes = 0
+            return
+
+        # 2) Mapa renderizado: una sola lectura de imagen si está en caché
+        if self._load_surface_cache():
+            return
+
         self.load_images()
-        self.generate_noise_map()
+        self.prepare_tile_tables()
 
         self.map_surface = pygame.Surface(
             (self.width * self.tile_size, self.height * self.tile_size), pygame.SRCALPHA
         )
 
+        rng = random.Random(self.seed)
         for y in range(self.height):
             for x in range(self.width):
-                biome = self.get_biome(self.biome_map[y][x])
-                world_x = x * self.tile_size
-                world_y = y * self.tile_size
-
-                # Detectar vecinos (para bordes)
-                neighbors = []
-                for dy in (-1, 0, 1):
-                    for dx in (-1, 0, 1):
-                        nx, ny = x + dx, y + dy
-                        if 0 <= nx < self.width and 0 <= ny < self.height:
-                            neighbors.append(self.get_biome(self.biome_map[ny][nx]))
-
-                # Seleccionar textura base coherente con bioma
-                if biome == "rocky":
-                    if any(nb != "rocky" for nb in neighbors):
-                        candidates = [img for name, img in self.surfaces["floor"] if "rock.grass" in name or "grass.rock" in name]
-                    else:
-                        candidates = [img for name, img in self.surfaces["floor"] if "rock" in name and "grass" not in name]
-                elif biome == "field":
-                    candidates = [img for name, img in self.surfaces["floor"] if "grass" in name and "rock" not in name]
-                else:  # wet
-                    candidates = [img for name, img in self.surfaces["floor"] if "grass" in name and "rock" not in name]
-
-                if not candidates:
-                    candidates = [img for _, img in self.surfaces["floor"]]
-
-                base_img = random.choice(candidates)
-                base_img = self.apply_biome_color(base_img, biome)
-                self.map_surface.blit(base_img, (world_x, world_y))
-
-                # --- 🌿 Decoraciones según bioma ---
-                r = random.random()
-
-                if biome == "field":
-                    # Mayor densidad de pasto y partículas
-                    if r < 0.25:
-                        deco = random.choice([img for _, img in self.surfaces["particles"]])
-                        self.map_surface.blit(deco, (world_x, world_y))
-                    # posibilidad de doble capa de hierba (más densa visualmente)
-                    if random.random() < 0.1:
-                        deco2 = random.choice([img for _, img in self.surfaces["particles"]])
-                        offset_x = random.randint(-8, 8)
-                        offset_y = random.randint(-4, 4)
-                        self.map_surface.blit(deco2, (world_x + offset_x, world_y + offset_y))
-
-                elif biome == "rocky":
-                    # rocas y piedras dispersas
-                    if r < 0.12:
-                        deco = random.choice([img for _, img in self.surfaces["stones"]])
-                        self.map_surface.blit(deco, (world_x, world_y))
-
-                elif biome == "wet":
-                    # Más vegetación húmeda + sombras
-                    if r < 0.20:
-                        deco = random.choice([img for _, img in self.surfaces["particles"]])
-                        self.map_surface.blit(deco, (world_x, world_y))
-                    if random.random() < 0.12:
-                        shadow = random.choice([img for _, img in self.surfaces["shadows"]])
-                        rect = shadow.get_rect(center=(world_x + 16, world_y + 16))
-                        self.map_surface.blit(shadow, rect.topleft)
+                self._draw_tile(self.map_surface, x, y, x * self.tile_size, y * self.tile_size, rng)
+
+        self._save_surface_cache()
+
+    # ---------------------------------------------------------------------
+    # 🔹 Caché en disco
+    # ---------------------------------------------------------------------
+    def cache_key(self):
+        """
+        Clave de caché: versión, semilla, tamaño y hash del contenido de las
+        carpetas de sprites (si cambia un PNG, el mapa cacheado deja de valer).
+        """
+        if self._cache_key is None:
+            digest = hashlib.md5()
+            for key in self.ASSET_FOLDERS:
+                folder = self._asset_folder(key)
+                for file in sorted(os.listdir(folder)):
+                    if file.endswith(".png"):
+                        digest.update(file.encode("utf-8"))
+                        with open(os.path.join(folder, file), "rb") as f:
+                            digest.update(f.read())
+            self._cache_key = (
+                f"v{MAP_CACHE_VERSION}_seed{self.seed}_{self.width}x{self.height}"
+                f"_t{self.tile_size}_{digest.hexdigest()[:12]}"
+            )
+        return self._cache_key
+
+    def _cache_path(self, suffix):
+        return os.path.join(MAP_CACHE_DIR, self.cache_key() + suffix)
+
+    def _load_noise_cache(self):
+        if not self.use_cache:
+            return False
+        path = self._cache_path(".npz")
+        if not os.path.exists(path):
+            return False
+        try:
+            with np.load(path) as data:
+                self.biome_field = data["biome_field"]
+                self.thresholds = tuple(float(t) for t in data["thresholds"])
+        except (OSError, KeyError, ValueError) as e:
+            print(f"[WARN] Caché de mapa ilegible ({path}): {e}")
+            return False
+        self.biome_map = self.biome_field.tolist()
+        return True
+
+    def _save_noise_cache(self):
+        if not self.use_cache:
+            return
+        try:
+            os.makedirs(MAP_CACHE_DIR, exist_ok=True)
+            path = self._cache_path(".npz")
+            tmp = path + ".tmp.npz"
+            np.savez(tmp, biome_field=self.biome_field, thresholds=np.array(self.thresholds))
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"[WARN] No se pudo guardar la caché de ruido: {e}")
+
+    def _load_image_cache(self, path):
+        if not self.use_cache or not os.path.exists(path):
+            return None
+        try:
+            return assets.image(path, cache=False)
+        except pygame.error as e:
+            print(f"[WARN] Caché de mapa ilegible ({path}): {e}")
+            return None
+
+    def _save_image_cache(self, surface, path):
+        if not self.use_cache:
+            return
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = path + ".tmp.png"
+            pygame.image.save(surface, tmp)
+            os.replace(tmp, path)
+        except (OSError, pygame.error) as e:
+            print(f"[WARN] No se pudo guardar la caché de mapa: {e}")
+
+    def _load_surface_cache(self):
+        surface = self._load_image_cache(self._cache_path(".png"))
+        if surface is None:
+            return False
+        self.map_surface = surface
+        return True
+
+    def _save_surface_cache(self):
+        self._save_image_cache(self.map_surface, self._cache_path(".png"))
+
+    def _chunk_cache_path(self, cx, cy):
+        return os.path.join(
+            MAP_CACHE_DIR, f"{self.cache_key()}_c{self.chunk_tiles}", f"{cx}_{cy}.png"
+        )
+
+    def prepare_tile_tables(self):
+        """
+        Tablas de candidatos por tipo de tile, construidas UNA vez tras
+        load_images(): filtrado por nombre de archivo y tinte del bioma
+        húmedo ya aplicados, para que el bucle por tile solo elija y blitee.
+        """
+        floor = self.surfaces["floor"]
+        all_floor = [img for _, img in floor]
+
+        def pick(predicate):
+            return [img for name, img in floor if predicate(name)] or all_floor
+
+        grass = pick(lambda name: "grass" in name and "rock" not in name)
+
+        self.floor_tables = {
+            "rocky_edge": pick(lambda name: "rock.grass" in name or "grass.rock" in name),
+            "rocky": pick(lambda name: "rock" in name and "grass" not in name),
+            "field": grass,
+            # Variantes oscurecidas cacheadas (antes: copia + surfarray por tile)
+            "wet": [self.apply_biome_color(img, "wet") for img in grass],
+        }
+        self.deco_tables = {
+            key: [img for _, img in self.surfaces[key]]
+            for key in ("particles", "stones", "shadows")
+        }
+
+    def classify_tiles(self):
+        """
+        Clasifica cada tile en "rocky_edge", "rocky", "field" o "wet" de una
+        vez con NumPy. Un rocoso es borde si algún vecino (3x3, dentro del
+        mapa) no es rocoso.
+        """
+        th1, th2 = self.thresholds
+        field = self.biome_field
+
+        rocky = field < th1
+        wet = field >= th2
+
+        # Dilatación 3x3 de "no rocoso" (el relleno exterior no cuenta como vecino)
+        not_rocky = np.pad(~rocky, 1, constant_values=False)
+        near_other = np.zeros_like(rocky)
+        for dy in (0, 1, 2):
+            for dx in (0, 1, 2):
+                near_other |= not_rocky[dy:dy + self.height, dx:dx + self.width]
+
+        kinds = np.full(field.shape, "field", dtype=object)
+        kinds[wet] = "wet"
+        kinds[rocky] = "rocky"
+        kinds[rocky & near_other] = "rocky_edge"
+        self.tile_kinds = kinds.tolist()
+
+    def _draw_tile(self, target, x, y, world_x, world_y, rng):
+        """
+        Pinta el tile (x, y) en `target` con esquina en (world_x, world_y).
+        `rng` es el módulo random (mapa completo) o un random.Random por chunk.
+        """
+        kind = self.tile_kinds[y][x]
+        decos = self.deco_tables
+
+        target.blit(rng.choice(self.floor_tables[kind]), (world_x, world_y))
+
+        # --- 🌿 Decoraciones según bioma ---
+        r = rng.random()
+
+        if kind == "field":
+            # Mayor densidad de pasto y partículas
+            if r < 0.25:
+                target.blit(rng.choice(decos["particles"]), (world_x, world_y))
+            # posibilidad de doble capa de hierba (más densa visualmente)
+            if rng.random() < 0.1:
+                deco2 = rng.choice(decos["particles"])
+                offset_x = rng.randint(-8, 8)
+                offset_y = rng.randint(-4, 4)
+                target.blit(deco2, (world_x + offset_x, world_y + offset_y))
+
+        elif kind == "wet":
+            # Más vegetación húmeda + sombras
+            if r < 0.20:
+                target.blit(rng.choice(decos["particles"]), (world_x, world_y))
+            if rng.random() < 0.12:
+                shadow = rng.choice(decos["shadows"])
+                rect = shadow.get_rect(center=(world_x + 16, world_y + 16))
+                target.blit(shadow, rect.topleft)
+
+        else:  # rocky / rocky_edge
+            # rocas y piedras dispersas
+            if r < 0.12:
+                target.blit(rng.choice(decos["stones"]), (world_x, world_y))
+
+    # ---------------------------------------------------------------------
+    # 🔹 Chunks bajo demanda (modo chunked)
+    # ---------------------------------------------------------------------
+    # Las decoraciones sobresalen de su tile (pasto desplazado, sombras):
+    # como mucho este número de tiles, así que basta un anillo de vecinos
+    CHUNK_OVERHANG_TILES = 1
+
+    def _chunk_bounds(self, cx, cy):
+        x0 = cx * self.chunk_tiles
+        y0 = cy * self.chunk_tiles
+        return x0, y0, min(x0 + self.chunk_tiles, self.width), min(y0 + self.chunk_tiles, self.height)
+
+    def _record_chunk(self, cx, cy):
+        """
+        Blits de cada tile del chunk (cx, cy) relativos a la esquina del tile:
+        {(x, y): [(imagen, (dx, dy)), ...]}. Mismo RNG por chunk que al pintarlo,
+        así que los vecinos se reproducen idénticos.
+        """
+        x0, y0, x1, y1 = self._chunk_bounds(cx, cy)
+        rng = random.Random(f"{self.chunk_seed}:{cx}:{cy}")
+        ops = {}
+        for y in range(y0, y1):
+            for x in range(x0, x1):
+                recorder = _TileRecorder()
+                self._draw_tile(recorder, x, y, 0, 0, rng)
+                ops[(x, y)] = recorder.ops
+        return ops
+
+    def _render_chunk(self, cx, cy):
+        """
+        Genera la surface del chunk (cx, cy); los chunks del borde pueden ser
+        más pequeños. También se repinta el anillo de tiles vecinos (recortado
+        por la surface) en orden de filas global, para que lo que sobresale
+        de un chunk aparezca igual en el de al lado y no queden costuras.
+        """
+        x0, y0, x1, y1 = self._chunk_bounds(cx, cy)
+        surface = pygame.Surface(
+            ((x1 - x0) * self.tile_size, (y1 - y0) * self.tile_size), pygame.SRCALPHA
+        )
+
+        ring = self.CHUNK_OVERHANG_TILES
+        ops = {}
+        for ncy in range(max(0, cy - 1), min(self.chunks_y, cy + 2)):
+            for ncx in range(max(0, cx - 1), min(self.chunks_x, cx + 2)):
+                ops.update(self._record_chunk(ncx, ncy))
+
+        for y in range(max(0, y0 - ring), min(self.height, y1 + ring)):
+            for x in range(max(0, x0 - ring), min(self.width, x1 + ring)):
+                left = (x - x0) * self.tile_size
+                top = (y - y0) * self.tile_size
+                for image, (dx, dy) in ops[(x, y)]:
+                    surface.blit(image, (left + dx, top + dy))
+        return surface
+
+    def get_chunk(self, cx, cy):
+        """Devuelve el chunk (cx, cy), generándolo si no está en el LRU."""
+        key = (cx, cy)
+        surface = self.chunks.get(key)
+        if surface is not None:
+            self.chunks.move_to_end(key)
+            return surface
+
+        path = self._chunk_cache_path(cx, cy) if self.use_cache else None
+        surface = self._load_image_cache(path) if path else None
+        if surface is None:
+            surface = self._render_chunk(cx, cy)
+            if path:
+                self._save_image_cache(surface, path)
+
+        self.chunks[key] = surface
+        self.chunk_bytes += self._surface_bytes(surface)
+
+        # Presupuesto de memoria: expulsar los menos usados (nunca el recién creado)
+        while self.chunk_bytes > self.chunk_budget_bytes and len(self.chunks) > 1:
+            _, old = self.chunks.popitem(last=False)
+            self.chunk_bytes -= self._surface_bytes(old)
+
+        return surface
+
+    @staticmethod
+    def _surface_bytes(surface):
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def _chunk_span(self, left, top, right, bottom, pad=0):
+        """Rango de chunks (cx0, cx1, cy0, cy1) que cubren el rect en píxeles, + `pad` chunks."""
+        size = self.chunk_px
+        return (
+            max(0, left // size - pad),
+            min(self.chunks_x - 1, (right - 1) // size + pad),
+            max(0, top // size - pad),
+            min(self.chunks_y - 1, (bottom - 1) // size + pad),
+        )
+
+    def _draw_chunks(self, screen, camera_offset):
+        cam_x = int(camera_offset[0])
+        cam_y = int(camera_offset[1])
+        screen_w, screen_h = screen.get_size()
+        right = cam_x + screen_w
+        bottom = cam_y + screen_h
+        size = self.chunk_px
+
+        # 1) Chunks visibles: se generan si faltan y se dibujan
+        cx0, cx1, cy0, cy1 = self._chunk_span(cam_x, cam_y, right, bottom)
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                screen.blit(self.get_chunk(cx, cy), (cx * size - cam_x, cy * size - cam_y))
+
+        # 2) Precarga: como mucho un chunk del anillo por frame, para no dar tirones
+        px0, px1, py0, py1 = self._chunk_span(cam_x, cam_y, right, bottom, MAP_CHUNK_PREFETCH)
+        for cy in range(py0, py1 + 1):
+            for cx in range(px0, px1 + 1):
+                if (cx, cy) not in self.chunks:
+                    self.get_chunk(cx, cy)
+                    break
+            else:
+                continue
+            break
+
+        # 3) Expulsar los que quedaron lejos de la cámara
+        kx0, kx1, ky0, ky1 = self._chunk_span(cam_x, cam_y, right, bottom, MAP_CHUNK_KEEP_RADIUS)
+        far = [
+            key for key in self.chunks
+            if not (kx0 <= key[0] <= kx1 and ky0 <= key[1] <= ky1)
+        ]
+        for key in far:
+            self.chunk_bytes -= self._surface_bytes(self.chunks.pop(key))
 
 
     # ---------------------------------------------------------------------
     # 🔹 Dibujar mapa en pantalla
     # ---------------------------------------------------------------------
     def draw(self, screen, camera_offset):
+        if self.chunked:
+            self._draw_chunks(screen, camera_offset)
+            return
         if not self.map_surface:
             return
         screen.blit(self.map_surface, (-camera_offset[0], -camera_offset[1]))
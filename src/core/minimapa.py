@@ -1,31 +1,34 @@
+import math
+
 import pygame
-from core.settings import MAP_WIDTH_PX, MAP_HEIGHT_PX
+from core.settings import MAP_WIDTH_PX, MAP_HEIGHT_PX, MINIMAP_MARKER_HZ, MINIMAP_SHOW_TERRAIN
+from graphics.text_cache import text_cache
 
 
 class Minimap:
-    def __init__(self, screen_width, screen_height, minimap_size):
+    def __init__(self, screen_width, screen_height, minimap_size, marker_hz=MINIMAP_MARKER_HZ):
         """
         Inicializa el minimapa.
-        
+
         Args:
             screen_width: Ancho de la pantalla
             screen_height: Alto de la pantalla
             minimap_size: Tamaño del minimapa (ancho y alto)
+            marker_hz: Veces por segundo que se recalculan los marcadores
+                       de enemigos e ítems (0 = cada frame)
         """
         self.minimap_size = minimap_size
         self.margin = 15  # Margen desde el borde de la pantalla
-        
+
         # Posición del minimapa (abajo a la derecha)
         self.x = screen_width - minimap_size - self.margin
         self.y = screen_height - minimap_size - self.margin
-        
-        # Superficie del minimapa
-        self.surface = pygame.Surface((minimap_size, minimap_size), pygame.SRCALPHA)
-        
+        self.rect = pygame.Rect(self.x, self.y, minimap_size, minimap_size)
+
         # Factores de escala (mapa del mundo -> minimapa)
         self.scale_x = minimap_size / MAP_WIDTH_PX
         self.scale_y = minimap_size / MAP_HEIGHT_PX
-        
+
         # Colores
         self.bg_color = (30, 30, 40, 200)  # Fondo semitransparente
         self.border_color = (255, 255, 255, 255)  # Borde blanco
@@ -33,105 +36,141 @@ class Minimap:
         self.enemy_color = (255, 50, 50, 255)  # Rojo para enemigos
         self.boss_color = (255, 150, 0, 255)  # Naranja para jefe
         self.item_color = (255, 215, 0, 255)  # Dorado para ítems
-        
+        self.terrain_alpha = 110  # Opacidad de la miniatura del mapa
+
+        # Capa estática (fondo + miniatura + borde) y etiqueta, renderizadas una vez
+        self.static_layer = None
+        self.build_static_layer()
+        self.label = text_cache.font("arial", 12).render("Mapa", True, (200, 200, 200))
+
+        # Sellos de marcadores: (color, radio[, borde]) -> Surface
+        self._stamps = {}
+
+        # Marcadores de enemigos e ítems en coordenadas de pantalla: [(Surface, (x, y))]
+        self.markers = []
+        self.marker_interval_ms = 1000.0 / marker_hz if marker_hz > 0 else 0.0
+        self._last_marker_update = None
+
     def world_to_minimap(self, world_x, world_y):
         """Convierte coordenadas del mundo a coordenadas del minimapa."""
         mini_x = int(world_x * self.scale_x)
         mini_y = int(world_y * self.scale_y)
         return mini_x, mini_y
-    
-    def draw(self, screen, player, enemies, items=None):
+
+    def build_static_layer(self, tile_map=None):
         """
-        Dibuja el minimapa en la pantalla.
-        
-        Args:
-            screen: Superficie de pygame donde dibujar
-            player: Objeto del jugador
-            enemies: Lista de enemigos
+        Fondo, miniatura del terreno (si el mapa tiene map_surface; en modo
+        por chunks no se fuerza a renderizar el mundo entero) y borde.
         """
-        # Limpiar superficie
-        self.surface.fill(self.bg_color)
-        
-        # Dibujar borde
+        size = (self.minimap_size, self.minimap_size)
+        layer = pygame.Surface(size, pygame.SRCALPHA)
+        layer.fill(self.bg_color)
+
+        map_surface = getattr(tile_map, "map_surface", None)
+        if MINIMAP_SHOW_TERRAIN and map_surface is not None:
+            thumbnail = pygame.transform.smoothscale(map_surface, size)
+            thumbnail.set_alpha(self.terrain_alpha)
+            layer.blit(thumbnail, (0, 0))
+
         pygame.draw.rect(
-            self.surface,
+            layer,
             self.border_color,
             (0, 0, self.minimap_size, self.minimap_size),
             2
         )
-        
+        self.static_layer = layer
+
+    def _stamp(self, color, radius, outline=None):
+        """Círculo pre-renderizado (con borde negro opcional de 1 px)."""
+        key = (color, radius, outline)
+        stamp = self._stamps.get(key)
+        if stamp is None:
+            outer = radius + 1 if outline else radius
+            # Margen de 1 px para que el círculo quede igual que con draw.circle
+            stamp = pygame.Surface((2 * outer + 2, 2 * outer + 2), pygame.SRCALPHA)
+            center = (outer + 1, outer + 1)
+            if outline:
+                pygame.draw.circle(stamp, outline, center, outer)
+            pygame.draw.circle(stamp, color, center, radius)
+            self._stamps[key] = stamp
+        return stamp
+
+    def update_markers(self, enemies, items=None):
+        """Recalcula en bloque la lista de sellos de enemigos e ítems."""
+        markers = []
+        left, top = self.x, self.y
+
         # Dibujar enemigos primero (para que el jugador quede encima)
         for enemy in enemies:
             if not enemy.alive:
                 continue
-                
+
             # Posición del enemigo en el minimapa
-            enemy_x = enemy.x + enemy.width // 2
-            enemy_y = enemy.y + enemy.height // 2
-            mini_x, mini_y = self.world_to_minimap(enemy_x, enemy_y)
-            
+            mini_x, mini_y = self.world_to_minimap(
+                enemy.x + enemy.width // 2,
+                enemy.y + enemy.height // 2,
+            )
+
             # Determinar si es jefe
             is_boss = hasattr(enemy, "is_boss") and enemy.is_boss
             color = self.boss_color if is_boss else self.enemy_color
             size = 5 if is_boss else 3
-            
-            # Dibujar punto del enemigo
-            pygame.draw.circle(
-                self.surface,
-                color,
-                (mini_x, mini_y),
-                size
-            )
-        # Dibujar ítems (antes del jugador para que quede debajo)
+            stamp = self._stamp(color, size)
+            offset = stamp.get_width() // 2
+            markers.append((stamp, (left + mini_x - offset, top + mini_y - offset)))
+
+        # Ítems (antes del jugador para que quede debajo) con efecto pulsante
         if items:
+            pulse = math.sin(pygame.time.get_ticks() / 300.0)
+            size = int(4 + pulse * 1.5)  # tamaño entre 2.5 y 5.5
+            stamp = self._stamp(self.item_color, size, outline=(0, 0, 0, 255))
+            offset = stamp.get_width() // 2
             for item in items:
                 if item.collected:
                     continue
-                
-                # Posición del ítem en el minimapa
-                item_x = item.x + item.width // 2
-                item_y = item.y + item.height // 2
-                mini_x, mini_y = self.world_to_minimap(item_x, item_y)
-                
-                # Dibujar punto del ítem con efecto pulsante
-                import math
-                pulse = math.sin(pygame.time.get_ticks() / 300.0)
-                size = int(4 + pulse * 1.5)  # tamaño entre 2.5 y 5.5
-                
-                # Borde negro
-                pygame.draw.circle(
-                    self.surface,
-                    (0, 0, 0, 255),
-                    (mini_x, mini_y),
-                    size + 1
-                )
-                # Centro dorado
-                pygame.draw.circle(
-                    self.surface,
-                    self.item_color,
-                    (mini_x, mini_y),
-                    size
+                mini_x, mini_y = self.world_to_minimap(
+                    item.x + item.width // 2,
+                    item.y + item.height // 2,
                 )
-        
-        # Dibujar jugador
+                markers.append((stamp, (left + mini_x - offset, top + mini_y - offset)))
+
+        self.markers = markers
+
+    def draw(self, screen, player, enemies, items=None):
+        """
+        Dibuja el minimapa en la pantalla.
+
+        Args:
+            screen: Superficie de pygame donde dibujar
+            player: Objeto del jugador
+            enemies: Lista de enemigos
+        """
+        now = pygame.time.get_ticks()
+        if (
+            self._last_marker_update is None
+            or now - self._last_marker_update >= self.marker_interval_ms
+        ):
+            self.update_markers(enemies, items)
+            self._last_marker_update = now
+
+        screen.blit(self.static_layer, (self.x, self.y))
+
+        # Los marcadores se recortan al recuadro del minimapa
+        previous_clip = screen.get_clip()
+        screen.set_clip(self.rect.clip(previous_clip))
+        screen.blits(self.markers, doreturn=False)
+
+        # Dibujar jugador (cada frame: es un solo marcador)
         player_x = player.x + player.width // 2
         player_y = player.y + player.height // 2
         mini_x, mini_y = self.world_to_minimap(player_x, player_y)
-        
+        center = (self.x + mini_x, self.y + mini_y)
+
         # Dibujar punto del jugador (más grande y con borde)
-        pygame.draw.circle(
-            self.surface,
-            (0, 0, 0, 255),  # Borde negro
-            (mini_x, mini_y),
-            5
-        )
-        pygame.draw.circle(
-            self.surface,
-            self.player_color,
-            (mini_x, mini_y),
-            4
-        )
-        
+        stamp = self._stamp(self.player_color, 4, outline=(0, 0, 0, 255))
+        offset = stamp.get_width() // 2
+        screen.blit(stamp, (center[0] - offset, center[1] - offset))
+
         # Indicador de dirección del jugador
         direction_offsets = {
             'up': (0, -6),
@@ -139,21 +178,18 @@ class Minimap:
             'left': (-6, 0),
             'right': (6, 0)
         }
-        
+
         if hasattr(player, 'facing') and player.facing in direction_offsets:
             dx, dy = direction_offsets[player.facing]
             pygame.draw.line(
-                self.surface,
+                screen,
                 self.player_color,
-                (mini_x, mini_y),
-                (mini_x + dx, mini_y + dy),
+                center,
+                (center[0] + dx, center[1] + dy),
                 2
             )
-        
-        # Dibujar el minimapa en la pantalla
-        screen.blit(self.surface, (self.x, self.y))
-        
-        # Etiqueta opcional
-        font = pygame.font.SysFont("arial", 12)
-        label = font.render("Mapa", True, (200, 200, 200))
-        screen.blit(label, (self.x + 5, self.y - 18))
\ No newline at end of file
+
+        screen.set_clip(previous_clip)
+
+        # Etiqueta
+        screen.blit(self.label, (self.x + 5, self.y - 18))
@@ -0,0 +1,208 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+from core.settings import MUSIC_CROSSFADE_MS, MUSIC_CACHE_TRACKS
+
+
+def _key(path: str) -> str:
+    return os.path.normcase(os.path.abspath(path))
+
+
+class MusicController:
+    """
+    Música de fondo sin cortes en el hilo principal.
+
+    Las pistas se decodifican completas (pygame.mixer.Sound) en un hilo en
+    segundo plano y suenan en dos canales reservados que se alternan, así
+    que un cambio de pista es un fundido cruzado y no un music.load() que
+    bloquea el frame. Si se pide una pista que aún no terminó de cargarse,
+    la anterior se desvanece y la nueva entra en cuanto esté lista (update()).
+
+    - prefetch(path): empieza a cargarla ya (p. ej. la siguiente pista).
+    - play(path, volume): fundido cruzado hacia `path`.
+    - stop(): desvanece lo que esté sonando.
+    - update(): una vez por frame, arranca la pista pendiente si ya cargó.
+    - stats(): latencias de carga y de espera en milisegundos.
+    """
+
+    CHANNELS = (0, 1)   # reservados con set_reserved: los efectos no los usan
+
+    def __init__(self, fade_ms: int = MUSIC_CROSSFADE_MS, cache_tracks: int = MUSIC_CACHE_TRACKS):
+        self.fade_ms = fade_ms
+        self.cache_tracks = cache_tracks
+
+        self._pool = None
+        self._lock = threading.Lock()
+        self._jobs = {}          # key -> Future(Sound)
+        self._requested = {}     # key -> perf_counter() del prefetch
+        self.load_ms = {}        # nombre de archivo -> ms de decodificación
+        self._failed = set()
+
+        self._channels = None
+        self._active = None      # índice en CHANNELS del canal que suena
+        self.current = None      # key de la pista que suena
+        self._pending = None     # (key, volumen, perf_counter() de la petición)
+        self.last_wait_ms = 0.0  # desde play() hasta que empezó a sonar
+        self.max_stall_ms = 0.0  # lo más que tardó play()/update() en el hilo principal
+
+    # ----------------------
+    # CARGA EN SEGUNDO PLANO
+    # ----------------------
+    def _executor(self):
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="music")
+        return self._pool
+
+    def _load(self, key):
+        start = time.perf_counter()
+        sound = pygame.mixer.Sound(key)
+        self.load_ms[os.path.basename(key)] = round((time.perf_counter() - start) * 1000.0, 1)
+        return sound
+
+    def prefetch(self, path):
+        """Encola la decodificación de `path` si no está ya cargada o en curso."""
+        if not pygame.mixer.get_init():
+            return
+        key = _key(path)
+        with self._lock:
+            if key in self._jobs or key in self._failed:
+                return
+            self._requested[key] = time.perf_counter()
+            self._jobs[key] = self._executor().submit(self._load, key)
+
+    def _ready(self, key):
+        """Sound si ya cargó, None si sigue cargando; False si falló."""
+        with self._lock:
+            job = self._jobs.get(key)
+        if job is None or not job.done():
+            return None
+        try:
+            return job.result()
+        except (pygame.error, OSError) as e:
+            print(f"[WARN] No se pudo cargar la música {os.path.basename(key)}: {e}")
+            with self._lock:
+                self._jobs.pop(key, None)
+                self._failed.add(key)
+            return False
+
+    def _evict(self):
+        """Libera pistas decodificadas de sobra (se conservan la actual y las más recientes)."""
+        with self._lock:
+            keep = {self.current}
+            if self._pending is not None:
+                keep.add(self._pending[0])
+            recent = sorted(self._requested, key=self._requested.get, reverse=True)
+            for key in recent:
+                if len(keep) >= self.cache_tracks:
+                    break
+                keep.add(key)
+            for key in list(self._jobs):
+                if key not in keep and self._jobs[key].done():
+                    del self._jobs[key]
+                    self._requested.pop(key, None)
+
+    # ----------------------
+    # REPRODUCCIÓN
+    # ----------------------
+    def _get_channels(self):
+        if self._channels is None:
+            pygame.mixer.set_reserved(len(self.CHANNELS))
+            self._channels = [pygame.mixer.Channel(i) for i in self.CHANNELS]
+        return self._channels
+
+    def play(self, path, volume: float = 1.0, fade_ms: int | None = None):
+        """Fundido cruzado hacia `path` (en bucle). No bloquea si aún no cargó."""
+        if not pygame.mixer.get_init():
+            return
+        start = time.perf_counter()
+        key = _key(path)
+        if key == self.current and self._pending is None:
+            return
+        if self._is_failed(key):
+            # Archivo que ya falló: no se corta la música que esté sonando
+            return
+
+        self.prefetch(path)
+        self._fade_out_active(fade_ms)
+        self._pending = (key, volume, start)
+        self._start_pending(fade_ms)
+        self._track_stall(start)
+
+    def stop(self, fade_ms: int | None = None):
+        """Desvanece la pista actual y cancela la pendiente."""
+        self._pending = None
+        if pygame.mixer.get_init():
+            self._fade_out_active(fade_ms)
+
+    def update(self):
+        """Llamar cada frame: arranca la pista pendiente en cuanto termine de cargarse."""
+        if self._pending is None:
+            return
+        start = time.perf_counter()
+        self._start_pending()
+        self._track_stall(start)
+
+    def _fade_out_active(self, fade_ms=None):
+        if self._active is None:
+            return
+        fade = self.fade_ms if fade_ms is None else fade_ms
+        channel = self._get_channels()[self._active]
+        if fade > 0:
+            channel.fadeout(fade)
+        else:
+            channel.stop()
+        self._active = None
+        self.current = None
+
+    def _is_failed(self, key):
+        with self._lock:
+            return key in self._failed
+
+    def _start_pending(self, fade_ms=None):
+        key, volume, requested = self._pending
+        if self._is_failed(key):
+            self._pending = None
+            return
+        sound = self._ready(key)
+        if sound is None:
+            return
+        self._pending = None
+        if sound is False:
+            return
+
+        # Se usa el canal que no se está desvaneciendo (si ambos lo están, se corta uno)
+        channels = self._get_channels()
+        index = 0 if channels[1].get_busy() and not channels[0].get_busy() else 1
+        channel = channels[index]
+
+        fade = self.fade_ms if fade_ms is None else fade_ms
+        sound.set_volume(volume)
+        channel.stop()
+        channel.play(sound, loops=-1, fade_ms=fade)
+
+        self._active = index
+        self.current = key
+        self.last_wait_ms = round((time.perf_counter() - requested) * 1000.0, 1)
+        self._evict()
+
+    def _track_stall(self, start):
+        self.max_stall_ms = max(self.max_stall_ms, (time.perf_counter() - start) * 1000.0)
+
+    def stats(self):
+        return {
+            "current": os.path.basename(self.current) if self.current else None,
+            "loading": self._pending is not None,
+            "load_ms": dict(self.load_ms),
+            "last_wait_ms": self.last_wait_ms,
+            "max_stall_ms": round(self.max_stall_ms, 3),
+            "cached": len(self._jobs),
+        }
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
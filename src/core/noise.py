@@ -0,0 +1,78 @@
+import random
+
+import numpy as np
+
+
+def _lattice_vector(seed: int, i: int, j: int):
+    """
+    Gradiente del vértice (i, j) exactamente como lo genera perlin_noise:
+    semilla = seed * hasher((i, j)) y dos random.uniform(-1, 1) seguidos.
+    """
+    corner_hash = max(1, int(abs(i + 10 * j + 1)))
+    state = random.getstate()
+    random.seed(seed * corner_hash)
+    vec = (random.uniform(-1, 1), random.uniform(-1, 1))
+    random.setstate(state)
+    return vec
+
+
+def _fade(t):
+    return 6 * t ** 5 - 15 * t ** 4 + 10 * t ** 3
+
+
+def perlin_grid(noise, xs, ys):
+    """
+    Evalúa un PerlinNoise 2D sobre la rejilla xs × ys de una sola vez.
+
+    Equivale a `noise([x, y])` para cada x de `xs` y cada y de `ys`
+    (mismas octavas y semilla), pero los gradientes se calculan una vez
+    por vértice de la retícula y la interpolación va en NumPy.
+    Devuelve un array (len(ys), len(xs)).
+    """
+    cx = np.asarray(xs, dtype=np.float64) * noise.octaves
+    cy = np.asarray(ys, dtype=np.float64) * noise.octaves
+
+    ix0 = np.floor(cx).astype(np.int64)
+    iy0 = np.floor(cy).astype(np.int64)
+
+    i_min, i_max = int(ix0.min()), int(ix0.max()) + 1
+    j_min, j_max = int(iy0.min()), int(iy0.max()) + 1
+
+    # Tabla de gradientes: grads[j - j_min, i - i_min] -> (gx, gy)
+    grads = np.empty((j_max - j_min + 1, i_max - i_min + 1, 2), dtype=np.float64)
+    for j in range(j_min, j_max + 1):
+        for i in range(i_min, i_max + 1):
+            grads[j - j_min, i - i_min] = _lattice_vector(noise.seed, i, j)
+
+    # Distancias a la esquina inferior (x0, y0); ejes separables
+    fx = cx - ix0
+    fy = cy - iy0
+    col = ix0 - i_min
+    row = iy0 - j_min
+
+    total = np.zeros((cy.size, cx.size), dtype=np.float64)
+
+    # Mismo orden que itertools.product: (x0,y0), (x0,y1), (x1,y0), (x1,y1)
+    for di in (0, 1):
+        dx = (fx - di)[np.newaxis, :]
+        wx = _fade(1 - np.abs(dx))
+        for dj in (0, 1):
+            dy = (fy - dj)[:, np.newaxis]
+            wy = _fade(1 - np.abs(dy))
+            g = grads[(row + dj)[:, np.newaxis], (col + di)[np.newaxis, :]]
+            total += (wx * wy) * (g[..., 0] * dx + g[..., 1] * dy)
+
+    return total
+
+
+def balanced_thresholds(values):
+    """
+    Umbrales que reparten `values` en tres tercios: los elementos n//3 y
+    2n//3 del array ordenado (mismo criterio que ordenar la lista entera),
+    obtenidos con np.partition en O(n).
+    """
+    flat = np.asarray(values, dtype=np.float64).ravel()
+    n = flat.size
+    k1, k2 = n // 3, 2 * n // 3
+    part = np.partition(flat, (k1, k2))
+    return float(part[k1]), float(part[k2])
@@ -0,0 +1,232 @@
+import csv
+import json
+import os
+import time
+
+import numpy as np
+import pygame
+
+from core.settings import PROFILER_HISTORY, PROFILER_DUMP_DIR
+from graphics.text_cache import text_cache
+
+
+class _Section:
+    """Context manager reutilizable de una fase; no hace nada si el profiler está apagado."""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = None
+
+    def __enter__(self):
+        self.start = time.perf_counter() if self.profiler.enabled else None
+        return self
+
+    def __exit__(self, *exc):
+        if self.start is not None:
+            self.profiler.add(self.name, time.perf_counter() - self.start)
+            self.start = None
+        return False
+
+
+class FrameProfiler:
+    """
+    Tiempos por fase del bucle principal en buffers circulares.
+
+    - `with profiler.section("fase"):` mide un bloque.
+    - `profiler.mark()` + `profiler.lap("fase")` miden etapas consecutivas
+      (el tiempo desde la marca/vuelta anterior) sin re-indentar código.
+    - `end_frame()` cierra el frame: lo acumulado por fase (varios pasos de
+      simulación suman) pasa a su buffer de PROFILER_HISTORY frames.
+
+    Apagado, cada medición es una comprobación de `enabled` y nada más.
+    """
+
+    GRAPH_BUDGET_MS = 1000.0 / 60.0   # barra llena = un frame a 60 FPS
+
+    def __init__(self, history: int = PROFILER_HISTORY, enabled: bool = False):
+        self.history = history
+        self.enabled = enabled
+
+        self.buffers: dict[str, np.ndarray] = {}   # fase -> ms por frame (circular)
+        self.counts: dict[str, int] = {}           # muestras escritas por fase
+        self.phases: list[str] = []                # orden de primera aparición
+
+        self._sections: dict[str, _Section] = {}
+        self._frame: dict[str, float] = {}
+        self._lap_start = None
+        self._frame_start = None
+        self.frame_index = 0
+
+        self._overlay = None
+        self._overlay_time = 0
+
+    # ----------------------
+    # MEDICIÓN
+    # ----------------------
+    def section(self, name: str) -> _Section:
+        section = self._sections.get(name)
+        if section is None:
+            section = _Section(self, name)
+            self._sections[name] = section
+        return section
+
+    def add(self, name: str, seconds: float):
+        self._frame[name] = self._frame.get(name, 0.0) + seconds
+
+    def mark(self):
+        if self.enabled:
+            self._lap_start = time.perf_counter()
+
+    def lap(self, name: str):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self._lap_start is not None:
+            self.add(name, now - self._lap_start)
+        self._lap_start = now
+
+    def end_frame(self):
+        """Pasa lo medido en este frame a los buffers (incluye 'frame' = tiempo total)."""
+        if not self.enabled:
+            self._frame_start = None
+            return
+
+        now = time.perf_counter()
+        if self._frame_start is not None:
+            self.add("frame", now - self._frame_start)
+        self._frame_start = now
+
+        for name, seconds in self._frame.items():
+            buffer = self.buffers.get(name)
+            if buffer is None:
+                buffer = np.zeros(self.history, dtype=np.float64)
+                self.buffers[name] = buffer
+                self.counts[name] = 0
+                self.phases.append(name)
+            buffer[self.counts[name] % self.history] = seconds * 1000.0
+            self.counts[name] += 1
+
+        self._frame.clear()
+        self.frame_index += 1
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self._frame.clear()
+        self._frame_start = None
+        self._overlay = None
+
+    def reset(self):
+        self.buffers.clear()
+        self.counts.clear()
+        self.phases.clear()
+        self.frame_index = 0
+
+    # ----------------------
+    # ESTADÍSTICAS
+    # ----------------------
+    def samples(self, name: str) -> np.ndarray:
+        """Muestras de la fase en orden cronológico (ms)."""
+        buffer = self.buffers[name]
+        count = self.counts[name]
+        if count <= self.history:
+            return buffer[:count].copy()
+        start = count % self.history
+        return np.concatenate((buffer[start:], buffer[:start]))
+
+    def summary(self):
+        """fase -> {'p50','p95','p99','max','samples'} en ms."""
+        result = {}
+        for name in self.phases:
+            data = self.samples(name)
+            if data.size == 0:
+                continue
+            p50, p95, p99 = np.percentile(data, (50, 95, 99))
+            result[name] = {
+                "p50": round(float(p50), 3),
+                "p95": round(float(p95), 3),
+                "p99": round(float(p99), 3),
+                "max": round(float(data.max()), 3),
+                "samples": int(data.size),
+            }
+        return result
+
+    def dump(self, folder: str = PROFILER_DUMP_DIR):
+        """Escribe <folder>/trace_<fecha>.json (resumen + muestras) y .csv (fase, muestra, ms)."""
+        os.makedirs(folder, exist_ok=True)
+        stamp = time.strftime("%Y%m%d_%H%M%S")
+        base = os.path.join(folder, f"trace_{stamp}")
+
+        trace = {
+            "frames": self.frame_index,
+            "summary": self.summary(),
+            "samples": {name: self.samples(name).round(4).tolist() for name in self.phases},
+        }
+        with open(base + ".json", "w") as f:
+            json.dump(trace, f, indent=2)
+
+        with open(base + ".csv", "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["phase", "sample", "ms"])
+            for name in self.phases:
+                for i, ms in enumerate(self.samples(name)):
+                    writer.writerow([name, i, round(float(ms), 4)])
+
+        print(f"[PROFILER] Traza guardada en {base}.json / .csv")
+        return base
+
+    # ----------------------
+    # OVERLAY
+    # ----------------------
+    def _render_overlay(self):
+        font = text_cache.font("consolas", 13)
+        line = font.get_height() + 2
+        stats = self.summary()
+
+        rows = [name for name in self.phases if name in stats]
+        width, graph_h = 420, 60
+        height = 8 + line * (len(rows) + 1) + graph_h + 8
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 190))
+
+        panel.blit(font.render("fase                  p50    p95    p99 ms", True, (200, 200, 200)), (8, 4))
+        bar_x, bar_w = 300, width - 300 - 8
+        for i, name in enumerate(rows):
+            s = stats[name]
+            y = 4 + line * (i + 1)
+            text = f"{name:<20} {s['p50']:6.2f} {s['p95']:6.2f} {s['p99']:6.2f}"
+            panel.blit(font.render_uncached(text, True, (230, 230, 230)), (8, y))
+
+            # Barra del p95 respecto al presupuesto de un frame
+            fill = min(1.0, s["p95"] / self.GRAPH_BUDGET_MS)
+            color = (90, 200, 90) if fill < 0.5 else (230, 200, 60) if fill < 0.9 else (230, 70, 70)
+            pygame.draw.rect(panel, (60, 60, 60), (bar_x, y + 3, bar_w, line - 6))
+            pygame.draw.rect(panel, color, (bar_x, y + 3, int(bar_w * fill), line - 6))
+
+        # Gráfico del tiempo de frame (últimos frames, línea = presupuesto)
+        if "frame" in self.buffers:
+            data = self.samples("frame")[-(width - 16):]
+            top = height - graph_h - 8
+            budget_y = top + graph_h - int(graph_h * 0.5)
+            pygame.draw.line(panel, (120, 120, 120), (8, budget_y), (width - 8, budget_y))
+            scale = graph_h * 0.5 / self.GRAPH_BUDGET_MS
+            points = [
+                (8 + i, top + graph_h - min(graph_h, int(ms * scale)))
+                for i, ms in enumerate(data)
+            ]
+            if len(points) > 1:
+                pygame.draw.lines(panel, (120, 220, 255), False, points)
+
+        return panel
+
+    def draw(self, screen, pos=(10, 120), refresh_ms: int = 250):
+        """Dibuja el panel; las estadísticas se recalculan cada `refresh_ms`. Devuelve el Rect tocado."""
+        if not self.enabled:
+            return None
+        now = pygame.time.get_ticks()
+        if self._overlay is None or now - self._overlay_time >= refresh_ms:
+            self._overlay = self._render_overlay()
+            self._overlay_time = now
+        return screen.blit(self._overlay, pos)
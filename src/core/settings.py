@@ -13,11 +13,27 @@ MAP_HEIGHT_TILES = 50
 MAP_WIDTH_PX = TILE_SIZE * MAP_WIDTH_TILES
 MAP_HEIGHT_PX = TILE_SIZE * MAP_HEIGHT_TILES
 
+# --- Mapa por chunks (mundos grandes) ---
+MAP_CHUNKED = False          # True: chunks bajo demanda en vez de un único map_surface
+MAP_CHUNK_TILES = 16         # lado de cada chunk en tiles
+MAP_CHUNK_BUDGET_MB = 64     # memoria máxima de chunks en caché (LRU)
+MAP_CHUNK_PREFETCH = 1       # anillo de chunks que se precargan alrededor de la cámara
+MAP_CHUNK_KEEP_RADIUS = 3    # chunks más lejos que esto (en chunks) se expulsan
+
+# --- Semilla y caché de mapa en disco ---
+MAP_SEED = None              # None: mapa aleatorio en cada partida; un entero lo hace reproducible
+MAP_CACHE_ENABLED = True     # guardar/leer ruido y mapa renderizado en MAP_CACHE_DIR (solo con MAP_SEED fijo)
+MAP_CACHE_DIR = "cache/maps" # relativo al directorio de ejecución, como assets/
+MAP_CACHE_VERSION = 2        # subir si cambia la generación del mapa para invalidar la caché
+
 PLAYER_MAX_HEALTH = 100
 ENEMY_BASE_HEALTH = 45
 
 DEBUG_DRAW_HITBOXES = True          # Rectángulos de hitbox (cuerpo)
 DEBUG_DRAW_ATTACK_FIELDS = True     # Rectángulos de campo de ataque
+DEBUG_DRAW_RENDER_STATS = True      # Contador de entidades dibujadas / descartadas por culling
+
+CULL_MARGIN = 96   # px extra alrededor de la cámara antes de descartar una entidad (sprites que sobresalen)
 
 # --- Gameplay ---
 ENEMY_INITIAL_SPAWN_INTERVAL = 2.5  # segundos entre spawns al principio
@@ -35,6 +51,8 @@ ENEMY_BASE_DAMAGE = 6.0  # daño base por “golpe/contacto”
 ENEMY_ATTACK_COOLDOWN = 0.9   # segundos entre ataques de un mismo enemigo
 ENEMY_ATTACK_RANGE = 45       # distancia en píxeles para poder atacar
 ENEMY_FRAME_SIZE = 64         # tamaño (ancho/alto) de cada frame del orco (ajusta si no es 64)
+ENEMY_SPRITE_SCALE = 1.5      # escala de los frames de orco (se aplica una vez en la caché compartida)
+ENEMY_SIM_BACKEND = "numpy"   # "numpy" (EnemyBatch, IA en lote) u "object" (Enemy.update por objeto)
 
 # --- Enemigos: sprites ---
 ENEMY_SPRITES = {
@@ -97,3 +115,69 @@ SPECIAL_SPIRAL_KILLS = 20     # kills necesarias para E
 SPECIAL_FRONTAL_DAMAGE = 100  # daño muy alto en línea (ajustable)
 SPECIAL_SPIRAL_DAMAGE = 180   # daño muy alto en área (ajustable)
 SPECIAL_RADIUS = 200          # radio del ataque en área (E)
+
+# Hilos que decodifican imágenes y sonidos durante la pantalla de carga
+ASSET_LOADER_WORKERS = 4
+
+# Máximo de textos renderizados que guarda la caché de texto (LRU)
+TEXT_CACHE_MAX_SURFACES = 256
+
+# Minimapa: frecuencia (Hz) de actualización de marcadores de enemigos/ítems
+# (0 = cada frame) y miniatura del terreno bajo los marcadores
+MINIMAP_MARKER_HZ = 15
+MINIMAP_SHOW_TERRAIN = True
+
+# Caché de efectos pre-renderizados (auras, brillos, ondas, swings escalados)
+EFFECT_CACHE_BUDGET_MB = 48
+EFFECT_ALPHA_STEP = 8        # cuantización del alfa (0-255)
+EFFECT_SCALE_STEP = 0.05     # cuantización de la escala de rotozoom
+
+# Variantes teñidas (flash de daño, dorado) cacheadas por frame de origen
+TINT_CACHE_MAX_SURFACES = 1024
+ENEMY_HURT_FLASH = True     # los orcos parpadean en blanco mientras están en HURT
+
+# Render por rectángulos sucios (display.update(rects)) en vez de flip completo.
+# Se alterna en juego con F9 para comparar.
+DIRTY_RECT_RENDERING = False
+
+# Simulación a paso fijo: update() corre a SIM_TICK_RATE Hz independientemente
+# del render; como mucho SIM_MAX_CATCHUP_STEPS pasos por frame para no entrar
+# en espiral si un frame va lento. El render interpola entre los dos últimos pasos.
+FIXED_TIMESTEP = True
+SIM_TICK_RATE = 60
+SIM_MAX_CATCHUP_STEPS = 5
+SIM_INTERPOLATE = True
+
+# Profiler de frame: F3 muestra/oculta el panel (p50/p95/p99 por fase),
+# F4 guarda la traza en PROFILER_DUMP_DIR (JSON + CSV)
+PROFILER_ENABLED = False
+PROFILER_HISTORY = 600        # frames guardados por fase
+PROFILER_DUMP_DIR = "profiles"
+
+# Sonido: canales del mixer y distancia (px desde el jugador) a partir de la
+# cual los sonidos de enemigos se descartan. Los disparos repetidos de un mismo
+# sonido en un frame se fusionan en una sola reproducción.
+SOUND_CHANNELS = 16
+SOUND_CULL_DISTANCE = 700
+
+# Música: las pistas se decodifican en segundo plano y cambian con un fundido
+# cruzado de MUSIC_CROSSFADE_MS; como mucho MUSIC_CACHE_TRACKS pistas en memoria
+MUSIC_CROSSFADE_MS = 1500
+MUSIC_CACHE_TRACKS = 3
+
+# Orcos muertos que se guardan para reciclarlos en vez de construir nuevos
+ENEMY_POOL_MAX_FREE = 256
+
+# Tablas de spawn por bioma: peso relativo por celda (0 = nunca) y margen en
+# tiles respecto al borde del mapa. SpawnIndex las precalcula al cargar el mapa.
+SPAWN_TABLES = {
+    "enemy": {
+        "weights": {"field": 1.0, "wet": 1.0, "rocky": 1.0, "rocky_edge": 0.5},
+        "margin": 0,
+    },
+    "item": {
+        "weights": {"field": 1.0, "wet": 0.7, "rocky": 0.4, "rocky_edge": 0.0},
+        "margin": 5,
+    },
+}
+SPAWN_SAMPLE_ATTEMPTS = 8    # intentos O(1) antes del filtrado exacto con NumPy
@@ -1,44 +1,91 @@
+import math
 import os
 import pygame
 
+from core.asset_loader import assets
+from core.settings import SOUND_CHANNELS, SOUND_CULL_DISTANCE
+
 
 class SoundManager:
     """Gestor centralizado de todos los sonidos del juego."""
-    
+
+    # Todos los sonidos a cargar: clave -> (archivo, volumen)
+    SOUND_FILES = {
+        # Diablo
+        "diablo_attack": ("diablo-attack.wav", 0.4),
+        "diablo_death": ("diablo-death.wav", 0.4),
+        "diablo_hurt": ("diablo-hurt.mp3", 0.4),
+        "diablo_roar": ("diablo-roar.mp3", 0.9),
+
+        # Octavio (jugador)
+        "octavio_attack": ("octavio-attack.mp3", 0.1),
+        "octavio_death": ("octavio-death.mp3", 0.8),
+        "octavio_hurt": ("octavio-hurt.mp3", 0.1),
+
+        # Orcos (enemigos)
+        "orc_attack": ("orc-attack.mp3", 0.1),
+        "orc_death": ("orc-death.mp3", 0.3),
+        "orc_hurt": ("orc-hurt.mp3", 0.1),
+    }
+
+    # Voces simultáneas máximas y prioridad por clave (más alta = más importante).
+    # Si no hay canal libre, un sonido puede robar el canal de otro de prioridad
+    # menor o igual (el más antiguo de la prioridad más baja).
+    SOUND_VOICES = {
+        "diablo_attack": (1, 3),
+        "diablo_death": (1, 4),
+        "diablo_hurt": (1, 3),
+        "diablo_roar": (1, 4),
+
+        "octavio_attack": (2, 2),
+        "octavio_death": (1, 4),
+        "octavio_hurt": (1, 3),
+
+        "orc_attack": (3, 0),
+        "orc_death": (3, 1),
+        "orc_hurt": (3, 0),
+    }
+    DEFAULT_VOICES = (2, 1)
+
+    SOUND_PATH = os.path.join(os.path.dirname(__file__), "..", "assets", "Sounds")
+
     def __init__(self):
         """Inicializa el gestor y carga todos los sonidos."""
         self.sounds = {}
-        self.sound_path = os.path.join(os.path.dirname(__file__), "..", "assets", "sounds")
-        
+        self.sound_path = self.SOUND_PATH
+
+        # Disparos del frame actual: clave -> veces pedida (se fusionan en flush)
+        self.pending: dict[str, int] = {}
+        # Voces propias sonando: [canal, clave, prioridad, inicio_ms]
+        self.voices: list[list] = []
+        self.listener = None
+        self._warned = set()
+        self.counters = {
+            "triggered": 0,   # llamadas a play()
+            "merged": 0,      # repetidas en el mismo frame
+            "culled": 0,      # fuente demasiado lejos del jugador
+            "played": 0,      # reproducciones reales
+            "stolen": 0,      # voces cortadas para dejar sitio
+            "dropped": 0,     # sin canal disponible o sin sonido cargado
+        }
+
+        if pygame.mixer.get_init():
+            pygame.mixer.set_num_channels(SOUND_CHANNELS)
+
         # Cargar todos los sonidos
         self._load_sounds()
+
+    @classmethod
+    def sound_paths(cls):
+        """Rutas de todos los archivos, para precargarlos con el AssetLoader."""
+        return [os.path.join(cls.SOUND_PATH, filename) for filename, _ in cls.SOUND_FILES.values()]
         
     def _load_sounds(self):
-        """Carga todos los archivos de audio."""
-        # Definir todos los sonidos a cargar con sus volúmenes
-        sound_files = {
-            # Diablo
-            "diablo_attack": ("diablo-attack.wav", 0.4),
-            "diablo_death": ("diablo-death.wav", 0.4),
-            "diablo_hurt": ("diablo-hurt.mp3", 0.4),
-            "diablo_roar": ("diablo-roar.mp3", 0.9),
-            
-            # Octavio (jugador)
-            "octavio_attack": ("octavio-attack.mp3", 0.1),
-            "octavio_death": ("octavio-death.mp3", 0.8),
-            "octavio_hurt": ("octavio-hurt.mp3", 0.1),
-            
-            # Orcos (enemigos)
-            "orc_attack": ("orc-attack.mp3", 0.1),
-            "orc_death": ("orc-death.mp3", 0.3),
-            "orc_hurt": ("orc-hurt.mp3", 0.1),
-        }
-        
-        # Cargar cada sonido
-        for key, (filename, volume) in sound_files.items():
+        """Carga todos los archivos de audio (ya decodificados si se precargaron)."""
+        for key, (filename, volume) in self.SOUND_FILES.items():
             file_path = os.path.join(self.sound_path, filename)
             try:
-                sound = pygame.mixer.Sound(file_path)
+                sound = assets.sound(file_path)
                 sound.set_volume(volume)
                 self.sounds[key] = sound
                 print(f"[SOUND] Cargado: {filename}")
@@ -46,18 +93,102 @@ class SoundManager:
                 print(f"[WARN] No se pudo cargar {filename}: {e}")
                 self.sounds[key] = None
     
-    def play(self, sound_key):
+    def play(self, sound_key, pos=None):
         """
-        Reproduce un sonido por su clave.
-        
+        Pide un sonido por su clave; suena en el próximo flush().
+
         Args:
             sound_key: Clave del sonido (ej: "octavio_attack", "diablo_roar")
+            pos: Posición (x, y) en el mundo de la fuente, o None si es global.
+                 Si está a más de SOUND_CULL_DISTANCE del jugador no suena.
         """
-        if sound_key in self.sounds and self.sounds[sound_key] is not None:
-            self.sounds[sound_key].play()
+        self.counters["triggered"] += 1
+
+        if self.sounds.get(sound_key) is None:
+            self.counters["dropped"] += 1
+            if sound_key not in self._warned:
+                self._warned.add(sound_key)
+                print(f"[WARN] Sonido '{sound_key}' no encontrado o no cargado")
+            return
+
+        if pos is not None and self.listener is not None:
+            dist = math.hypot(pos[0] - self.listener[0], pos[1] - self.listener[1])
+            if dist > SOUND_CULL_DISTANCE:
+                self.counters["culled"] += 1
+                return
+
+        if sound_key in self.pending:
+            self.pending[sound_key] += 1
+            self.counters["merged"] += 1
         else:
-            print(f"[WARN] Sonido '{sound_key}' no encontrado o no cargado")
-    
+            self.pending[sound_key] = 1
+
+    def flush(self, listener=None):
+        """
+        Reproduce lo pedido en este frame (una vez por clave, por prioridad)
+        y actualiza la posición del oyente para el culling del próximo frame.
+        """
+        if listener is not None:
+            self.listener = listener
+        if not self.pending:
+            return
+
+        pending = sorted(self.pending, key=lambda key: -self._voice_info(key)[1])
+        self.pending.clear()
+
+        if not pygame.mixer.get_init():
+            self.counters["dropped"] += len(pending)
+            return
+
+        self._prune_voices()
+        for sound_key in pending:
+            self._start_voice(sound_key)
+
+    def _voice_info(self, sound_key):
+        return self.SOUND_VOICES.get(sound_key, self.DEFAULT_VOICES)
+
+    def _prune_voices(self):
+        """Olvida las voces que ya terminaron (o cuyo canal se reutilizó)."""
+        self.voices = [
+            voice for voice in self.voices
+            if voice[0].get_busy() and voice[0].get_sound() is self.sounds.get(voice[1])
+        ]
+
+    def _start_voice(self, sound_key):
+        sound = self.sounds[sound_key]
+        max_voices, priority = self._voice_info(sound_key)
+        now = pygame.time.get_ticks()
+
+        same_key = [voice for voice in self.voices if voice[1] == sound_key]
+        if len(same_key) >= max_voices:
+            # Límite por clave: se reinicia la voz más antigua de esa clave
+            victim = min(same_key, key=lambda voice: voice[3])
+        else:
+            channel = pygame.mixer.find_channel()
+            if channel is not None:
+                channel.play(sound)
+                self.voices.append([channel, sound_key, priority, now])
+                self.counters["played"] += 1
+                return
+
+            # Sin canales libres: robar la voz de menor prioridad (la más antigua)
+            candidates = [voice for voice in self.voices if voice[2] <= priority]
+            if not candidates:
+                self.counters["dropped"] += 1
+                return
+            victim = min(candidates, key=lambda voice: (voice[2], voice[3]))
+
+        victim[0].stop()
+        victim[0].play(sound)
+        victim[1], victim[2], victim[3] = sound_key, priority, now
+        self.counters["stolen"] += 1
+        self.counters["played"] += 1
+
+    def stats(self):
+        """Contadores de disparos vs. reproducciones y voces activas."""
+        self._prune_voices()
+        return {**self.counters, "voices": len(self.voices)}
+
     def stop(self, sound_key):
         """Detiene un sonido específico."""
         if sound_key in self.sounds and self.sounds[sound_key] is not None:
@@ -65,6 +196,8 @@ class SoundManager:
     
     def stop_all(self):
         """Detiene todos los sonidos."""
+        self.pending.clear()
+        self.voices.clear()
         pygame.mixer.stop()
     
     def set_volume(self, sound_key, volume):
@@ -0,0 +1,134 @@
+import random
+
+import numpy as np
+
+from core.settings import SPAWN_TABLES, SPAWN_SAMPLE_ATTEMPTS
+
+
+class _Bucket:
+    """Celdas candidatas de un bioma dentro de una tabla (esquinas en píxeles)."""
+
+    __slots__ = ("biome", "weight", "cells")
+
+    def __init__(self, biome, weight, cells):
+        self.biome = biome
+        self.weight = weight
+        self.cells = cells
+
+
+class SpawnIndex:
+    """
+    Celdas válidas para spawnear, precalculadas una vez desde la rejilla de
+    biomas del TileMap (tile_kinds).
+
+    Cada tabla de SPAWN_TABLES da un peso por bioma (densidad relativa por
+    celda; 0 = nunca) y un margen en tiles respecto al borde del mapa.
+
+    - sample(): un punto a más de `min_distance` del centro. Elige bioma y
+      celda en O(1) y reintenta como mucho SPAWN_SAMPLE_ATTEMPTS veces; si
+      el radio cubre casi todo, cae a un filtrado exacto con NumPy.
+    - sample_many(): N puntos con un solo filtrado de distancias.
+
+    Los puntos caen en una posición aleatoria dentro de la celda elegida.
+    """
+
+    def __init__(self, tile_kinds, tile_size: int, tables=SPAWN_TABLES):
+        kinds = np.array(tile_kinds, dtype=object)
+        rows, cols = kinds.shape
+        self.tile_size = tile_size
+        self.max_x = cols * tile_size - tile_size
+        self.max_y = rows * tile_size - tile_size
+
+        self.tables: dict[str, list[_Bucket]] = {}
+        self.cum_weights: dict[str, list[float]] = {}
+        for name, spec in tables.items():
+            margin = spec.get("margin", 0)
+            buckets = []
+            for biome, weight in spec["weights"].items():
+                if weight <= 0:
+                    continue
+                mask = kinds == biome
+                if margin:
+                    mask[:margin, :] = False
+                    mask[-margin:, :] = False
+                    mask[:, :margin] = False
+                    mask[:, -margin:] = False
+                ys, xs = np.nonzero(mask)
+                if len(xs) == 0:
+                    continue
+                cells = np.column_stack((xs, ys)).astype(np.float64) * tile_size
+                buckets.append(_Bucket(biome, weight, cells))
+
+            self.tables[name] = buckets
+            total = 0.0
+            self.cum_weights[name] = []
+            for bucket in buckets:
+                total += bucket.weight * len(bucket.cells)
+                self.cum_weights[name].append(total)
+
+    @classmethod
+    def from_tile_map(cls, tile_map, tables=SPAWN_TABLES):
+        return cls(tile_map.tile_kinds, tile_map.tile_size, tables)
+
+    def cell_count(self, table: str) -> int:
+        return sum(len(bucket.cells) for bucket in self.tables[table])
+
+    # ----------------------
+    # MUESTREO
+    # ----------------------
+    def _point(self, cell, rng):
+        """Posición (enteros) dentro de la celda, sin salirse del mapa."""
+        x = min(int(cell[0]) + rng.randrange(self.tile_size), self.max_x)
+        y = min(int(cell[1]) + rng.randrange(self.tile_size), self.max_y)
+        return x, y
+
+    def sample(self, center, min_distance: float, table: str = "enemy",
+               rng=random, attempts: int = SPAWN_SAMPLE_ATTEMPTS):
+        """Punto (x, y) a más de `min_distance` px de `center`, o None si la tabla está vacía."""
+        buckets = self.tables[table]
+        if not buckets:
+            return None
+
+        cx, cy = center
+        limit = min_distance * min_distance
+        cum_weights = self.cum_weights[table]
+        for _ in range(attempts):
+            bucket = rng.choices(buckets, cum_weights=cum_weights)[0]
+            x, y = self._point(bucket.cells[rng.randrange(len(bucket.cells))], rng)
+            dx = x - cx
+            dy = y - cy
+            if dx * dx + dy * dy > limit:
+                return x, y
+
+        return self.sample_many(1, center, min_distance, table, rng)[0]
+
+    def sample_many(self, count: int, center, min_distance: float,
+                    table: str = "enemy", rng=random):
+        """
+        `count` puntos a más de `min_distance` px de `center`. Si ninguna
+        celda cumple (radio mayor que el mapa), devuelve las más lejanas.
+        """
+        buckets = self.tables[table]
+        if not buckets or count <= 0:
+            return []
+
+        # Margen de una diagonal de celda: cualquier punto dentro de ella cumple
+        limit = min_distance + self.tile_size * 1.5
+        origin = np.array(center, dtype=np.float64)
+
+        valid, weights = [], []
+        for bucket in buckets:
+            delta = bucket.cells - origin
+            far = bucket.cells[np.einsum("ij,ij->i", delta, delta) > limit * limit]
+            if len(far):
+                valid.append(far)
+                weights.append(bucket.weight * len(far))
+
+        if not valid:
+            cells = np.concatenate([bucket.cells for bucket in buckets])
+            delta = cells - origin
+            order = np.argsort(-np.einsum("ij,ij->i", delta, delta))
+            return [self._point(cells[order[i % len(order)]], rng) for i in range(count)]
+
+        picks = rng.choices(range(len(valid)), weights=weights, k=count)
+        return [self._point(valid[i][rng.randrange(len(valid[i]))], rng) for i in picks]
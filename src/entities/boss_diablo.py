@@ -141,15 +141,8 @@ class BossDiablo(Entity):
         self.is_boss = True
 
 
-    @property
-    def rect(self):
-        """Hitbox real del Diablo usada en colisiones y daño."""
-        return pygame.Rect(
-            int(self.x + self.hitbox_offset_x),
-            int(self.y + self.hitbox_offset_y),
-            self.hitbox_width,
-            self.hitbox_height,
-        )
+    # `rect` (hitbox real del Diablo usada en colisiones y daño) viene de
+    # Entity: Rect persistente que solo se recoloca cuando cambian x/y.
 
 
     def clamp_to_map(self):
@@ -216,10 +209,10 @@ class BossDiablo(Entity):
             self.health = 0
             self.set_state("death")
             if self.sound_manager:
-                self.sound_manager.play("diablo_death")
+                self.sound_manager.play("diablo_death", (self.x, self.y))
         else:
             if self.sound_manager:
-                self.sound_manager.play("diablo_hurt")
+                self.sound_manager.play("diablo_hurt", (self.x, self.y))
 
     # ==========================================================
     # Lógica de IA
@@ -242,19 +235,8 @@ class BossDiablo(Entity):
         # --------------------------------------------------
         # Distancia REAL usando hitboxes (no solo x,y)
         # --------------------------------------------------
-        boss_hitbox = pygame.Rect(
-            self.x + self.hitbox_offset_x,
-            self.y + self.hitbox_offset_y,
-            self.hitbox_width,
-            self.hitbox_height,
-        )
-
-        player_hitbox = pygame.Rect(
-            player.x + player.hitbox_offset_x,
-            player.y + player.hitbox_offset_y,
-            player.hitbox_width,
-            player.hitbox_height,
-        )
+        boss_hitbox = self.rect
+        player_hitbox = player.hitbox
 
         dx = player_hitbox.centerx - boss_hitbox.centerx
         dy = player_hitbox.centery - boss_hitbox.centery
@@ -299,7 +281,7 @@ class BossDiablo(Entity):
             # Frame donde "conecta" el golpe
             if self.current_frame_index == mid and not self.attack_executed:
                 if self.sound_manager:
-                    self.sound_manager.play("diablo_attack")
+                    self.sound_manager.play("diablo_attack", (self.x, self.y))
 
                 atk_rect = self.get_attack_hitbox()
                 if atk_rect is not None and atk_rect.colliderect(player_hitbox):
@@ -11,8 +11,11 @@ from core.settings import (
     ENEMY_ATTACK_COOLDOWN,
     ENEMY_ATTACK_RANGE,
     ENEMY_SPRITES,
+    ENEMY_HURT_FLASH,
 )
-from graphics.sprite_sheet import SpriteSheet
+from graphics.frame_cache import enemy_frame_cache
+from graphics.tint_cache import tint_cache
+from entities.enemy_batch import BatchField
 
 
 class EnemyState(Enum):
@@ -24,7 +27,25 @@ class EnemyState(Enum):
     DEATH = auto()
 
 
+_STATE_BY_CODE = {state.value: state for state in EnemyState}
+
+
 class Enemy(Entity):
+    # Campos que pasan a ser vistas sobre EnemyBatch cuando se usa el backend NumPy
+    x = BatchField(decode=float)
+    y = BatchField(decode=float)
+    health = BatchField(decode=float)
+    last_attack_time = BatchField(decode=float)
+    state = BatchField(
+        decode=lambda code: _STATE_BY_CODE[int(code)],
+        encode=lambda state: state.value,
+    )
+    alive = BatchField(decode=bool)
+
+    # Lote al que pertenece (None = ruta por objeto)
+    batch = None
+    row = -1
+
     def __init__(
         self,
         x,
@@ -34,13 +55,34 @@ class Enemy(Entity):
         damage: float | None = None,
         sound_manager = None
     ):
+        # Físicas base
+        super().__init__(x, y, TILE_SIZE, TILE_SIZE, speed=2.0)
+        self.reinit(x, y, enemy_type, health, damage, sound_manager)
+
+    def reinit(
+        self,
+        x,
+        y,
+        enemy_type: str | None = None,
+        health: float | None = None,
+        damage: float | None = None,
+        sound_manager = None
+    ):
+        """
+        Deja el enemigo como recién construido en (x, y), para reciclarlo
+        desde EnemyPool. Debe estar fuera del EnemyBatch (batch is None).
+        """
         # Tipo de enemigo (orc1, orc2, orc3)
         if enemy_type is None:
             enemy_type = random.choice(list(ENEMY_SPRITES.keys()))
         self.enemy_type = enemy_type
 
-        # Físicas base
-        super().__init__(x, y, TILE_SIZE, TILE_SIZE, speed=2.0)
+        self.x = x
+        self.y = y
+        self.prev_x = x
+        self.prev_y = y
+        self.alive = True
+        self._hitbox_key = None
 
         # Vida y daño
         self.health = health if health is not None else ENEMY_BASE_HEALTH
@@ -87,62 +129,12 @@ class Enemy(Entity):
     # ----------------------
     # CARGA DE SPRITES 4x8
     # ----------------------
-    def _load_strip(self, image_path: str):
+    def _load_animations(self):
         """
-        Carga una hoja con 4 filas (direcciones) y N columnas:
-        - fila 0: down
-        - fila 1: up
-        - fila 2: left
-        - fila 3: right
-        Asume frames cuadrados (cell_w = cell_h).
-        Devuelve dict[direction] -> [frames]
+        Devuelve las animaciones de este tipo desde la caché compartida.
+        El dict es el mismo para todos los enemigos del tipo: NO modificar.
         """
-        sheet = SpriteSheet(image_path)
-        full_surface = sheet.sprite_sheet
-        sheet_width, sheet_height = full_surface.get_size()
-
-        rows = 4
-        cell_h = sheet_height // rows
-        cell_w = cell_h                 # frames cuadrados
-        frames_per_row = sheet_width // cell_w
-
-        SCALE = 1.5  # ajusta si quieres enemigos más grandes o más pequeños
-
-        dir_rows = {
-            "down": 0,
-            "up": 1,
-            "left": 2,
-            "right": 3,
-        }
-
-        directional_frames: dict[str, list[pygame.Surface]] = {}
-
-        for dir_name, row_idx in dir_rows.items():
-            frames: list[pygame.Surface] = []
-            y = row_idx * cell_h
-
-            for col in range(frames_per_row):
-                x = col * cell_w
-                frame = sheet.get_sprite(x, y, cell_w, cell_h)
-
-                # Escalamos UNA vez aquí
-                new_w = int(cell_w * SCALE)
-                new_h = int(cell_h * SCALE)
-                frame = pygame.transform.scale(frame, (new_w, new_h))
-
-                frames.append(frame)
-
-            directional_frames[dir_name] = frames
-
-        return directional_frames
-
-    def _load_animations(self):
-        """Carga todas las animaciones definidas en settings para este tipo."""
-        paths = ENEMY_SPRITES[self.enemy_type]
-        animations = {}
-        for key, path in paths.items():
-            animations[key] = self._load_strip(path)  # dict[direction] -> [frames]
-        return animations
+        return enemy_frame_cache.get_enemy_animations(self.enemy_type)
 
 
     # ----------------------
@@ -197,16 +189,9 @@ class Enemy(Entity):
     # ----------------------
     # HITBOX
     # ----------------------
-    @property
-    def rect(self):
-        from pygame import Rect
-        return Rect(
-            int(self.x + self.hitbox_offset_x),
-            int(self.y + self.hitbox_offset_y),
-            self.hitbox_width,
-            self.hitbox_height,
-        )
-    
+    # `rect` viene de Entity: Rect persistente que solo se recoloca cuando
+    # cambian x/y (ver Entity.rect).
+
     # ----------------------
     # CAMPO DE ATAQUE
     # ----------------------
@@ -218,15 +203,8 @@ class Enemy(Entity):
         if self.state != EnemyState.ATTACK:
             return None
 
-        import pygame
-
         # Usamos la hitbox reducida como base
-        base_rect = pygame.Rect(
-            self.x + self.hitbox_offset_x,
-            self.y + self.hitbox_offset_y,
-            self.hitbox_width,
-            self.hitbox_height,
-        )
+        base_rect = self.rect
 
         range_px = int(self.attack_range)
 
@@ -294,16 +272,18 @@ class Enemy(Entity):
             self._set_animation_for(EnemyState.DEATH)
             # Sonido de muerte
             if self.sound_manager:
-                self.sound_manager.play("orc_death")
+                self.sound_manager.play("orc_death", (self.x, self.y))
         else:
             self._set_animation_for(EnemyState.HURT)
             # Sonido de daño
             if self.sound_manager:
-                self.sound_manager.play("orc_hurt")
+                self.sound_manager.play("orc_hurt", (self.x, self.y))
 
-    def _start_attack(self):
+    def _start_attack(self, now: float | None = None):
         self._set_animation_for(EnemyState.ATTACK)
-        self.last_attack_time = pygame.time.get_ticks() / 1000.0
+        if now is None:
+            now = pygame.time.get_ticks() / 1000.0
+        self.last_attack_time = now
         self.attack_executed = False
 
     # ----------------------
@@ -334,21 +314,64 @@ class Enemy(Entity):
     # ----------------------
     # UPDATE (IA + ESTADOS)
     # ----------------------
-    def update(self, dt: float, player):
-        if not self.alive:
-            return
-
-        # Estados que ignoran movimiento
+    def _update_reaction(self, dt: float) -> bool:
+        """Estados que ignoran movimiento (DEATH / HURT). True si consumió el frame."""
         if self.state == EnemyState.DEATH:
             self._update_animation(dt, loop=False)
             if self.animation_finished:
                 self.alive = False
-            return
+            return True
 
         if self.state == EnemyState.HURT:
             self._update_animation(dt, loop=False)
             if self.animation_finished:
                 self._set_animation_for(EnemyState.RUN)
+            return True
+
+        return False
+
+    def _update_attack(self, dt: float, player):
+        self._update_animation(dt, loop=False)
+
+        frames = self.current_frames
+        mid_index = len(frames) // 2 if frames else 0
+
+        # Solo pegamos una vez, en la mitad de la animación
+        if not self.attack_executed and self.current_frame_index >= mid_index:
+            # Sonido de ataque del orco
+            if self.sound_manager:
+                self.sound_manager.play("orc_attack", (self.x, self.y))
+
+            atk_rect = self.get_attack_hitbox()
+
+            if atk_rect is not None:
+                # Hitbox del jugador (reducida si existe, si no usamos rect/width/height)
+                if hasattr(player, "hitbox"):
+                    player_rect = player.hitbox
+                elif hasattr(player, "rect"):
+                    player_rect = player.rect
+                else:
+                    player_rect = pygame.Rect(
+                        player.x,
+                        player.y,
+                        getattr(player, "width", 32),
+                        getattr(player, "height", 32),
+                    )
+
+                if atk_rect.colliderect(player_rect) and hasattr(player, "take_damage"):
+                    player.take_damage(self.damage)
+
+            self.attack_executed = True
+
+        if self.animation_finished:
+            self._set_animation_for(EnemyState.RUN)
+
+    def update(self, dt: float, player):
+        """Ruta por objeto (ENEMY_SIM_BACKEND = "object")."""
+        if not self.alive:
+            return
+
+        if self._update_reaction(dt):
             return
 
         # Distancia al jugador
@@ -372,50 +395,11 @@ class Enemy(Entity):
         )
 
         if can_attack:
-            self._start_attack()
+            self._start_attack(now)
 
         # Ataque
         if self.state == EnemyState.ATTACK:
-            self._update_animation(dt, loop=False)
-
-            frames = self.current_frames
-            mid_index = len(frames) // 2 if frames else 0
-
-            # Solo pegamos una vez, en la mitad de la animación
-            if not self.attack_executed and self.current_frame_index >= mid_index:
-                # Sonido de ataque del orco
-                if self.sound_manager:
-                    self.sound_manager.play("orc_attack")
-
-                atk_rect = self.get_attack_hitbox()
-
-                if atk_rect is not None:
-                    # Hitbox del jugador (reducida si existe, si no usamos rect/width/height)
-                    if hasattr(player, "hitbox_width"):
-                        player_rect = pygame.Rect(
-                            player.x + player.hitbox_offset_x,
-                            player.y + player.hitbox_offset_y,
-                            player.hitbox_width,
-                            player.hitbox_height,
-                        )
-                    elif hasattr(player, "rect"):
-                        player_rect = player.rect
-                    else:
-                        player_rect = pygame.Rect(
-                            player.x,
-                            player.y,
-                            getattr(player, "width", 32),
-                            getattr(player, "height", 32),
-                        )
-
-                    if atk_rect.colliderect(player_rect) and hasattr(player, "take_damage"):
-                        player.take_damage(self.damage)
-
-                self.attack_executed = True
-
-            if self.animation_finished:
-                self._set_animation_for(EnemyState.RUN)
-
+            self._update_attack(dt, player)
             return
 
         # Movimiento
@@ -439,6 +423,31 @@ class Enemy(Entity):
 
         self._update_animation(dt, loop=True)
 
+    def _batch_step(self, dt, player, dx, dy, can_attack, moving, running, now):
+        """
+        Parte por objeto del backend NumPy: EnemyBatch ya calculó distancia,
+        ataque posible y movimiento (y movió la fila); aquí solo quedan
+        dirección, transición de estado, golpe y animación.
+        """
+        self._update_direction_from_vector(dx, dy)
+
+        if can_attack:
+            self._start_attack(now)
+
+        if self.state == EnemyState.ATTACK:
+            self._update_attack(dt, player)
+            return
+
+        if moving:
+            desired_state = EnemyState.RUN if running else EnemyState.WALK
+        else:
+            desired_state = EnemyState.IDLE
+
+        if self.state != desired_state:
+            self._set_animation_for(desired_state)
+
+        self._update_animation(dt, loop=True)
+
     # ----------------------
     # DIBUJADO
     # ----------------------
@@ -451,6 +460,10 @@ class Enemy(Entity):
 
         frame = self.current_frames[self.current_frame_index]
 
+        # Parpadeo blanco mientras recibe daño (variante cacheada del frame)
+        if ENEMY_HURT_FLASH and self.state == EnemyState.HURT and tint_cache.flash_on():
+            frame = tint_cache.variant(frame, "flash")
+
         screen.blit(
             frame,
             (self.x - camera_offset[0], self.y - camera_offset[1])
@@ -0,0 +1,202 @@
+import numpy as np
+import pygame
+
+
+class BatchField:
+    """
+    Atributo de Enemy que vive en una columna del EnemyBatch.
+
+    Mientras el enemigo no está registrado en un lote, el valor se guarda
+    en el propio objeto (`_<nombre>`); al registrarse, lecturas y escrituras
+    van directamente a la fila `enemy.row` del array correspondiente.
+    """
+
+    def __init__(self, decode=None, encode=None):
+        self.decode = decode
+        self.encode = encode
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.local = "_" + name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        batch = obj.batch
+        if batch is None:
+            return getattr(obj, self.local)
+        value = batch.columns[self.name][obj.row]
+        return self.decode(value) if self.decode else value
+
+    def __set__(self, obj, value):
+        batch = obj.batch
+        if batch is None:
+            setattr(obj, self.local, value)
+            return
+        batch.columns[self.name][obj.row] = self.encode(value) if self.encode else value
+
+
+class EnemyBatch:
+    """
+    Backend structure-of-arrays para orcos.
+
+    Posiciones, vida, temporizadores de ataque y códigos de estado de todos
+    los enemigos registrados viven en arrays de NumPy. La persecución, el
+    rango de ataque y el cooldown se calculan en bloque una vez por frame;
+    cada Enemy queda como una vista fina sobre su fila y solo ejecuta en
+    Python lo que no es vectorizable (animación, sonido y golpe al jugador).
+    """
+
+    # Columnas que Enemy expone como BatchField (vistas sobre la fila)
+    VIEW_COLUMNS = {
+        "x": np.float64,
+        "y": np.float64,
+        "health": np.float64,
+        "last_attack_time": np.float64,
+        "state": np.int8,
+        "alive": np.bool_,
+    }
+    # Columnas constantes por enemigo (se copian al registrarlo)
+    STATIC_COLUMNS = {
+        "speed": np.float64,          # velocidad ya multiplicada por speed_variation
+        "attack_range": np.float64,
+        "attack_cooldown": np.float64,
+    }
+
+    def __init__(self, capacity: int = 64):
+        self.capacity = capacity
+        self.count = 0
+        self.enemies = []   # fila -> Enemy
+        self.columns: dict[str, np.ndarray] = {}
+        for name, dtype in {**self.VIEW_COLUMNS, **self.STATIC_COLUMNS}.items():
+            self.columns[name] = np.zeros(capacity, dtype=dtype)
+
+    def __len__(self):
+        return self.count
+
+    # ----------------------
+    # REGISTRO DE FILAS
+    # ----------------------
+    def _grow(self):
+        self.capacity *= 2
+        for name, column in self.columns.items():
+            grown = np.zeros(self.capacity, dtype=column.dtype)
+            grown[: self.count] = column[: self.count]
+            self.columns[name] = grown
+
+    def add(self, enemy):
+        """Registra `enemy` en una fila nueva; a partir de aquí sus campos son vistas."""
+        if enemy.batch is not None:
+            return
+        if self.count == self.capacity:
+            self._grow()
+
+        row = self.count
+        columns = self.columns
+        for name in self.VIEW_COLUMNS:
+            value = getattr(enemy, name)
+            columns[name][row] = value.value if name == "state" else value
+
+        columns["speed"][row] = enemy.speed * enemy.speed_variation
+        columns["attack_range"][row] = enemy.attack_range
+        columns["attack_cooldown"][row] = enemy.attack_cooldown
+
+        enemy.batch = self
+        enemy.row = row
+        self.enemies.append(enemy)
+        self.count += 1
+
+    def _detach(self, enemy):
+        """Copia los valores de la fila al objeto y lo desliga del lote."""
+        values = {name: getattr(enemy, name) for name in self.VIEW_COLUMNS}
+        enemy.batch = None
+        enemy.row = -1
+        for name, value in values.items():
+            setattr(enemy, name, value)
+
+    def remove_dead(self):
+        """Libera las filas de enemigos con alive=False (swap con la última fila)."""
+        alive = self.columns["alive"]
+        row = 0
+        while row < self.count:
+            if alive[row]:
+                row += 1
+                continue
+
+            self._detach(self.enemies[row])
+            last = self.count - 1
+            if row != last:
+                for column in self.columns.values():
+                    column[row] = column[last]
+                moved = self.enemies[last]
+                moved.row = row
+                self.enemies[row] = moved
+            self.enemies.pop()
+            self.count -= 1
+
+    def clear(self):
+        for enemy in self.enemies:
+            self._detach(enemy)
+        self.enemies.clear()
+        self.count = 0
+
+    # ----------------------
+    # UPDATE EN BLOQUE
+    # ----------------------
+    def update(self, dt: float, player):
+        """Equivalente en lote a llamar Enemy.update(dt, player) en cada fila."""
+        n = self.count
+        if n == 0:
+            return
+
+        from entities.enemy import EnemyState
+
+        c = self.columns
+        state = c["state"][:n]
+        alive = c["alive"][:n]
+
+        reacting = (state == EnemyState.DEATH.value) | (state == EnemyState.HURT.value)
+        chasing = alive & ~reacting
+
+        # HURT / DEATH: solo animación, por objeto (son pocos a la vez)
+        for row in np.flatnonzero(alive & reacting).tolist():
+            self.enemies[row]._update_reaction(dt)
+
+        rows = np.flatnonzero(chasing)
+        if rows.size == 0:
+            return
+
+        x = c["x"]
+        y = c["y"]
+        dx = player.x - x[rows]
+        dy = player.y - y[rows]
+        dist = np.sqrt(dx * dx + dy * dy)
+
+        now = pygame.time.get_ticks() / 1000.0
+        attack_range = c["attack_range"][rows]
+
+        can_attack = (dist <= attack_range) & (
+            (now - c["last_attack_time"][rows]) >= c["attack_cooldown"][rows]
+        )
+        attacking = can_attack | (state[rows] == EnemyState.ATTACK.value)
+        moving = ~attacking & (dist > 5)
+        running = dist > attack_range * 1.5
+
+        # Movimiento vectorizado (mismo cálculo que la ruta por objeto)
+        step = np.where(running, 1.5, 1.0) * c["speed"][rows]
+        inv_dist = np.divide(1.0, dist, out=np.zeros_like(dist), where=dist > 0)
+        move_rows = rows[moving]
+        x[move_rows] += (dx * inv_dist * step)[moving]
+        y[move_rows] += (dy * inv_dist * step)[moving]
+
+        # Parte no vectorizable: dirección, transición de estado, ataque, animación
+        enemies = self.enemies
+        for row, ddx, ddy, attack, move, run in zip(
+            rows.tolist(),
+            dx.tolist(),
+            dy.tolist(),
+            can_attack.tolist(),
+            moving.tolist(),
+            running.tolist(),
+        ):
+            enemies[row]._batch_step(dt, player, ddx, ddy, attack, move, run, now)
@@ -0,0 +1,57 @@
+from core.settings import ENEMY_POOL_MAX_FREE
+from entities.enemy import Enemy
+
+
+class EnemyPool:
+    """
+    Reciclaje de orcos muertos.
+
+    acquire() devuelve un Enemy reiniciado con Enemy.reinit() si hay alguno
+    libre y solo construye uno nuevo si la reserva está vacía; release()
+    devuelve a la reserva un orco que ya salió de la partida (y del
+    EnemyBatch). Como mucho se guardan `max_free` orcos libres.
+    """
+
+    def __init__(self, max_free: int = ENEMY_POOL_MAX_FREE):
+        self.max_free = max_free
+        self.free: list[Enemy] = []
+        self.created = 0     # construidos con Enemy(...)
+        self.reused = 0      # servidos desde la reserva
+        self.released = 0    # devueltos a la reserva
+        self.discarded = 0   # devueltos con la reserva llena
+
+    def acquire(self, x, y, enemy_type=None, health=None, damage=None, sound_manager=None) -> Enemy:
+        if self.free:
+            enemy = self.free.pop()
+            enemy.reinit(x, y, enemy_type, health, damage, sound_manager)
+            self.reused += 1
+            return enemy
+
+        self.created += 1
+        return Enemy(x, y, enemy_type=enemy_type, health=health, damage=damage,
+                     sound_manager=sound_manager)
+
+    def release(self, enemy):
+        """Guarda `enemy` para reutilizarlo; ignora lo que no sea un orco (p. ej. el Diablo)."""
+        if type(enemy) is not Enemy or enemy.batch is not None:
+            return
+        if len(self.free) >= self.max_free:
+            self.discarded += 1
+            return
+        enemy.sound_manager = None
+        self.free.append(enemy)
+        self.released += 1
+
+    def clear(self):
+        self.free.clear()
+
+    def stats(self):
+        served = self.created + self.reused
+        return {
+            "free": len(self.free),
+            "created": self.created,
+            "reused": self.reused,
+            "released": self.released,
+            "discarded": self.discarded,
+            "reuse_rate": round(self.reused / served, 3) if served else 0.0,
+        }
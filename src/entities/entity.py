@@ -7,11 +7,34 @@ class Entity:
         self.speed = speed
         self.alive = True
 
+        # Hitbox (las subclases pueden reducirla y desplazarla tras el super())
+        self.hitbox_width = width
+        self.hitbox_height = height
+        self.hitbox_offset_x = 0
+        self.hitbox_offset_y = 0
+
+        # Rect persistente: se recoloca in situ solo cuando cambian x/y
+        self._hitbox = None
+        self._hitbox_key = None
+
     @property
     def rect(self):
-        """Rectángulo de colisión base (sin hitbox especial)."""
-        from pygame import Rect
-        return Rect(int(self.x), int(self.y), self.width, self.height)
+        """
+        Hitbox en coordenadas del mundo.
+        Es SIEMPRE el mismo Rect (no se asigna uno nuevo por acceso): no
+        modificarlo desde fuera; usar .copy() si hace falta alterarlo.
+        """
+        key = (self.x, self.y, self.hitbox_width, self.hitbox_height)
+        if key != self._hitbox_key:
+            self._hitbox_key = key
+            left = int(self.x + self.hitbox_offset_x)
+            top = int(self.y + self.hitbox_offset_y)
+            if self._hitbox is None:
+                from pygame import Rect
+                self._hitbox = Rect(left, top, self.hitbox_width, self.hitbox_height)
+            else:
+                self._hitbox.update(left, top, self.hitbox_width, self.hitbox_height)
+        return self._hitbox
 
     def update(self, dt: float):
         """Sobrescribir en subclases."""
@@ -19,4 +42,4 @@ class Entity:
 
     def draw(self, screen, camera_offset):
         """Sobrescribir en subclases."""
-        pass
\ No newline at end of file
+        pass
@@ -2,6 +2,9 @@ import pygame
 import math
 import os
 
+from core.asset_loader import assets
+from graphics.effect_cache import effect_cache
+
 
 class Item:
     """Clase base para ítems coleccionables."""
@@ -14,6 +17,10 @@ class Item:
         self.height = 32
         self.alive = True  # Para mantener compatibilidad con sistema de entidades
         self.collected = False
+
+        # Hitbox persistente (ver propiedad rect)
+        self._rect = pygame.Rect(int(x), int(y), self.width, self.height)
+        self._rect_key = None
         
         # Animación de flotación
         self.float_offset = 0.0
@@ -29,7 +36,7 @@ class Item:
             "Aguardiente.png"
         )
         try:
-            self.image = pygame.image.load(sprite_path).convert_alpha()
+            self.image = assets.image(sprite_path)
             # Escalar a tamaño deseado
             self.image = pygame.transform.scale(self.image, (self.width, self.height))
         except Exception as e:
@@ -40,8 +47,13 @@ class Item:
     
     @property
     def rect(self):
-        """Hitbox para colisión con el jugador."""
-        return pygame.Rect(int(self.x), int(self.y + self.float_offset), self.width, self.height)
+        """Hitbox para colisión con el jugador (Rect persistente, no modificar)."""
+        key = (self.x, self.y, self.float_offset)
+        if key != self._rect_key:
+            self._rect_key = key
+            self._rect.x = int(self.x)
+            self._rect.y = int(self.y + self.float_offset)
+        return self._rect
     
     def update(self, dt):
         """Actualiza la animación de flotación."""
@@ -75,13 +87,9 @@ class Item:
         screen.blit(self.image, (pos_x, pos_y))
         
         # Efecto de brillo/aura opcional
-        glow_surface = pygame.Surface((self.width + 8, self.height + 8), pygame.SRCALPHA)
         alpha = int(100 + 50 * math.sin(pygame.time.get_ticks() / 200.0))
-        pygame.draw.circle(
-            glow_surface,
-            (255, 255, 150, alpha),
-            (glow_surface.get_width() // 2, glow_surface.get_height() // 2),
-            self.width // 2 + 4,
-            3
+        glow_surface = effect_cache.ring(
+            self.width // 2 + 4, 3, (255, 255, 150), alpha,
+            size=(self.width + 8, self.height + 8)
         )
         screen.blit(glow_surface, (pos_x - 4, pos_y - 4))
\ No newline at end of file
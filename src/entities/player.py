@@ -1,16 +1,21 @@
 import os
 import pygame
 from graphics.sprite_sheet import SpriteSheet
+from core.asset_loader import assets
+from core.input_provider import KeyboardInput
 from core.settings import MAP_WIDTH_PX, MAP_HEIGHT_PX, PLAYER_MAX_HEALTH, BANDAGE_HEAL_AMOUNT, MAX_BANDAGES
 
 
 
 class Player:
-    def __init__(self, x, y, sprite_path=None, sprite_size=64, unarmed_row=39, armed_row=10, frames_per_direction=None, row_index_base=0, sound_manager=None):
+    def __init__(self, x, y, sprite_path=None, sprite_size=64, unarmed_row=39, armed_row=10, frames_per_direction=None, row_index_base=0, sound_manager=None, input_provider=None):
         """Player with configurable sprite sheet layout."""
         self.max_health = PLAYER_MAX_HEALTH
         self.health = self.max_health
 
+        # Fuente de teclas/ratón: teclado real o un proveedor guionado (modo headless)
+        self.input = input_provider or KeyboardInput()
+
                 # --- Feedback de daño recibido ---
         self.is_hurt = False
         self.hurt_timer = 0.0
@@ -97,9 +102,9 @@ class Player:
         self.recalculate_stats()
 
         # ejemplo dentro de __init__, después de cargar el sprite sheet principal
-        self.swing_sheet = pygame.image.load(
+        self.swing_sheet = assets.image(
             os.path.join(os.path.dirname(__file__), "..", "assets", "sprites", "attack_swing.png")
-        ).convert_alpha()
+        )
 
         self.load_swing_animations()
 
@@ -112,6 +117,10 @@ class Player:
         self.hitbox_offset_x = (self.width - self.hitbox_width) // 2
         self.hitbox_offset_y = self.height - self.hitbox_height
 
+        # Rect persistente de la hitbox (ver propiedad `hitbox`)
+        self._hitbox = pygame.Rect(0, 0, self.hitbox_width, self.hitbox_height)
+        self._hitbox_key = None
+
 
         # Sprite sheet setup
         if sprite_path is None:
@@ -171,6 +180,7 @@ class Player:
                 print(f"[WARN] No se pudo cargar attack_swing.png: {e}")
         else:
             print("[WARN] No se encontró assets/sprites/attack_swing.png")
+        self.prescale_swing_frames()
 
         # Animation state
         self.current_animation = 'idle_down'
@@ -291,8 +301,22 @@ class Player:
 
         return frames
 
+    @property
+    def hitbox(self):
+        """
+        Hitbox reducida en coordenadas del mundo.
+        Es SIEMPRE el mismo Rect, recolocado in situ solo cuando cambian x/y:
+        no modificarlo desde fuera (usar .copy()).
+        """
+        key = (self.x, self.y)
+        if key != self._hitbox_key:
+            self._hitbox_key = key
+            self._hitbox.x = int(self.x + self.hitbox_offset_x)
+            self._hitbox.y = int(self.y + self.hitbox_offset_y)
+        return self._hitbox
+
     def handle_input(self):
-        keys = pygame.key.get_pressed()
+        keys = self.input.get_pressed()
         self.movement = {'up': False, 'down': False, 'left': False, 'right': False}
 
         if not self.is_attacking:
@@ -310,7 +334,7 @@ class Player:
                 self.facing = 'right'
 
             # Iniciar ataque con clic izquierdo o tecla J
-            if keys[pygame.K_j] or pygame.mouse.get_pressed()[0]:
+            if keys[pygame.K_j] or self.input.mouse_pressed()[0]:
                 self.start_attack()
 
     def start_attack(self):
@@ -522,6 +546,7 @@ class Player:
 
         self.attack_damage = base_damage
         self.attack_range_multiplier = base_range
+        self.prescale_swing_frames()
 
     def recalculate_stats(self):
         """Recalcula velocidad, daño, rango y resistencia según niveles y arma."""
@@ -553,21 +578,16 @@ class Player:
         resistance_bonus = 0.10 * (self.resistance_level - 1)
         self.damage_taken_multiplier = max(0.4, 1.0 - resistance_bonus)
 
+        self.prescale_swing_frames()
+
 
     def get_attack_hitbox(self):
         """Devuelve un Rect con el área de impacto del ataque (o None si no hay ataque activo)."""
         if not self.is_attacking:
             return None
 
-        import pygame
-
         # Usamos la hitbox reducida como base
-        base_rect = pygame.Rect(
-            self.x + self.hitbox_offset_x,
-            self.y + self.hitbox_offset_y,
-            self.hitbox_width,
-            self.hitbox_height,
-        )
+        base_rect = self.hitbox
 
         range_mult = getattr(self, "attack_range_multiplier", 1.0)
         atk_width = int(self.hitbox_width * range_mult)
@@ -620,38 +640,22 @@ class Player:
         if atk_rect is None:
             return None
 
-        # Elegimos los frames del swing según la dirección
-        frames = self.attack_swing_frames.get(self.facing, [])
+        # Frames ya escalados para el arma y nivel de rango actuales
+        frames = self.get_scaled_swing_frames(atk_rect.height).get(self.facing, [])
         if not frames:
             return None
 
         # Usar el mismo índice de frame que la animación de ataque
         index = min(self.animation_frame, len(frames) - 1)
-        base_image = frames[index]
-
-        base_w, base_h = base_image.get_width(), base_image.get_height()
-
-        # Escalamos manteniendo proporción tomando la altura del área de ataque
-        # (puedes usar el ancho si te gusta más cómo se ve)
-        scale_factor = atk_rect.height / base_h
-
-        new_w = max(1, int(base_w * scale_factor))
-        new_h = max(1, int(base_h * scale_factor))
-
-        # Escalar imagen (no modificamos el frame original)
-        scaled_image = pygame.transform.smoothscale(base_image, (new_w, new_h))
+        scaled_image = frames[index]
+        new_w, new_h = scaled_image.get_size()
 
         # Centramos el swing en el centro del área de ataque
         world_x = atk_rect.centerx - new_w // 2
         world_y = atk_rect.centery - new_h // 2
 
         # Rectángulo base: hitbox del cuerpo del jugador (no el área de ataque)
-        base_rect = pygame.Rect(
-            self.x + self.hitbox_offset_x,
-            self.y + self.hitbox_offset_y,
-            self.hitbox_width,
-            self.hitbox_height,
-        )
+        base_rect = self.hitbox
 
         fw, fh = new_w, new_h
 
@@ -672,6 +676,42 @@ class Player:
         return scaled_image, world_x, world_y
 
 
+    def prescale_swing_frames(self):
+        """Escala los frames del swing para el arma y rango actuales (tras cambiar stats)."""
+        if not getattr(self, "attack_swing_frames", None):
+            return  # aún en __init__ o sin sprite de swing
+        range_mult = getattr(self, "attack_range_multiplier", 1.0)
+        self.get_scaled_swing_frames(int(self.hitbox_height * range_mult))
+
+    def get_scaled_swing_frames(self, target_height: int):
+        """
+        Frames del swing por dirección escalados a `target_height` (la altura
+        del área de ataque). Esa altura solo cambia con el arma o el nivel de
+        rango, así que el juego de frames se reconstruye únicamente entonces.
+        """
+        if getattr(self, "_swing_scaled_height", None) == target_height:
+            return self._swing_scaled_frames
+
+        scaled = {}
+        for direction, frames in self.attack_swing_frames.items():
+            scaled[direction] = []
+            for base_image in frames:
+                base_w, base_h = base_image.get_width(), base_image.get_height()
+
+                # Escalamos manteniendo proporción tomando la altura del área de ataque
+                # (puedes usar el ancho si te gusta más cómo se ve)
+                scale_factor = target_height / base_h
+
+                new_w = max(1, int(base_w * scale_factor))
+                new_h = max(1, int(base_h * scale_factor))
+
+                # Escalar imagen (no modificamos el frame original)
+                scaled[direction].append(pygame.transform.smoothscale(base_image, (new_w, new_h)))
+
+        self._swing_scaled_height = target_height
+        self._swing_scaled_frames = scaled
+        return scaled
+
     def take_damage(self, amount: float):
         """Aplica daño al jugador y activa el efecto de daño (hurt flash)."""
         # Si el daño es cero o negativo, no hacemos nada
@@ -0,0 +1,117 @@
+from collections import OrderedDict
+
+import pygame
+
+from core.settings import EFFECT_CACHE_BUDGET_MB, EFFECT_ALPHA_STEP, EFFECT_SCALE_STEP
+
+
+class EffectCache:
+    """
+    Frames pre-renderizados de efectos (auras, brillos, ondas expansivas y
+    swings escalados de los especiales Q/E).
+
+    Radio, alfa y escala se cuantizan para que los valores que oscilan cada
+    frame caigan en un número pequeño de claves; cada frame se construye la
+    primera vez que se pide y se reutiliza después. La caché es LRU y está
+    acotada en bytes (EFFECT_CACHE_BUDGET_MB). Las Surfaces devueltas son
+    compartidas: NO modificar.
+    """
+
+    def __init__(self, budget_mb: float = EFFECT_CACHE_BUDGET_MB,
+                 alpha_step: int = EFFECT_ALPHA_STEP, scale_step: float = EFFECT_SCALE_STEP):
+        self.budget_bytes = int(budget_mb * 1024 * 1024)
+        self.alpha_step = alpha_step
+        self.scale_step = scale_step
+
+        self.surfaces: OrderedDict = OrderedDict()
+        self.bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+
+    # ----------------------
+    # CUANTIZACIÓN
+    # ----------------------
+    def quantize_alpha(self, alpha) -> int:
+        step = self.alpha_step
+        return max(0, min(255, int(round(alpha / step)) * step))
+
+    def quantize_scale(self, scale) -> float:
+        step = self.scale_step
+        return round(round(scale / step) * step, 4)
+
+    # ----------------------
+    # LRU
+    # ----------------------
+    def _get(self, key):
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+        return surface
+
+    def _put(self, key, surface):
+        self.misses += 1
+        self.surfaces[key] = surface
+        self.bytes += surface.get_width() * surface.get_height() * surface.get_bytesize()
+        while self.bytes > self.budget_bytes and len(self.surfaces) > 1:
+            _, old = self.surfaces.popitem(last=False)
+            self.bytes -= old.get_width() * old.get_height() * old.get_bytesize()
+        return surface
+
+    # ----------------------
+    # EFECTOS
+    # ----------------------
+    def ring(self, radius: int, width: int, color, alpha, size=None, radius_step: int = 1):
+        """
+        Anillo `color` + `alpha` de grosor `width` centrado en una Surface
+        SRCALPHA de (2*radius, 2*radius) o de `size` si se indica.
+        Con radius_step > 1 el radio se redondea a ese múltiplo (ondas grandes).
+        """
+        if radius_step > 1:
+            radius = max(radius_step, int(round(radius / radius_step)) * radius_step)
+        alpha = self.quantize_alpha(alpha)
+        rgb = tuple(color[:3])
+        key = ("ring", radius, width, rgb, alpha, size)
+
+        surface = self._get(key)
+        if surface is not None:
+            return surface
+
+        surface = pygame.Surface(size or (radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(
+            surface,
+            (*rgb, alpha),
+            (surface.get_width() // 2, surface.get_height() // 2),
+            radius,
+            width
+        )
+        return self._put(key, surface)
+
+    def scaled(self, frame: pygame.Surface, scale: float):
+        """rotozoom(frame, 0, scale) con la escala cuantizada (frame debe ser persistente)."""
+        scale = self.quantize_scale(scale)
+        key = ("scaled", frame, scale)
+
+        surface = self._get(key)
+        if surface is not None:
+            return surface
+        return self._put(key, pygame.transform.rotozoom(frame, 0, scale))
+
+    def clear(self):
+        self.surfaces.clear()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "surfaces": len(self.surfaces),
+            "mb": round(self.bytes / (1024 * 1024), 2),
+        }
+
+
+# Instancia única para todo el proceso
+effect_cache = EffectCache()
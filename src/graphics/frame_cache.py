@@ -0,0 +1,118 @@
+import pygame
+
+from graphics.sprite_sheet import SpriteSheet
+from core.settings import ENEMY_SPRITES, ENEMY_SPRITE_SCALE
+
+
+def load_directional_strip(image_path: str, scale: float):
+    """
+    Carga una hoja con 4 filas (direcciones) y N columnas:
+    - fila 0: down
+    - fila 1: up
+    - fila 2: left
+    - fila 3: right
+    Asume frames cuadrados (cell_w = cell_h).
+    Devuelve dict[direction] -> [frames] ya escalados.
+    """
+    sheet = SpriteSheet(image_path)
+    full_surface = sheet.sprite_sheet
+    sheet_width, sheet_height = full_surface.get_size()
+
+    rows = 4
+    cell_h = sheet_height // rows
+    cell_w = cell_h                 # frames cuadrados
+    frames_per_row = sheet_width // cell_w
+
+    dir_rows = {
+        "down": 0,
+        "up": 1,
+        "left": 2,
+        "right": 3,
+    }
+
+    new_w = int(cell_w * scale)
+    new_h = int(cell_h * scale)
+
+    directional_frames: dict[str, list[pygame.Surface]] = {}
+
+    for dir_name, row_idx in dir_rows.items():
+        frames: list[pygame.Surface] = []
+        y = row_idx * cell_h
+
+        for col in range(frames_per_row):
+            x = col * cell_w
+            frame = sheet.get_sprite(x, y, cell_w, cell_h)
+            frames.append(pygame.transform.scale(frame, (new_w, new_h)))
+
+        directional_frames[dir_name] = frames
+
+    return directional_frames
+
+
+class FrameCache:
+    """
+    Atlas compartido de frames de enemigos.
+
+    Cada lista de frames se guarda bajo la clave
+    (tipo_enemigo, estado, dirección, escala) y se construye UNA sola vez
+    por proceso. Todos los Enemy reciben el mismo dict de animaciones por
+    referencia, así que un spawn no decodifica ni escala nada.
+    """
+
+    def __init__(self):
+        # (enemy_type, state, direction, scale) -> [frames]
+        self.frames: dict[tuple, list[pygame.Surface]] = {}
+        # (enemy_type, scale) -> animations[state][direction] -> [frames]
+        self._animation_sets: dict[tuple, dict] = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    def get_enemy_animations(self, enemy_type: str, scale: float = ENEMY_SPRITE_SCALE):
+        """Devuelve animations[state][direction] para el tipo pedido (compartido, NO modificar)."""
+        key = (enemy_type, scale)
+        animations = self._animation_sets.get(key)
+        if animations is not None:
+            self.hits += 1
+            return animations
+
+        self.misses += 1
+        animations = {}
+        for state, path in ENEMY_SPRITES[enemy_type].items():
+            strip = load_directional_strip(path, scale)
+            for direction, frames in strip.items():
+                self.frames[(enemy_type, state, direction, scale)] = frames
+            animations[state] = strip
+
+        self._animation_sets[key] = animations
+        return animations
+
+    def prewarm(self, enemy_types=None, scale: float = ENEMY_SPRITE_SCALE):
+        """Construye por adelantado las animaciones (llamar tras pygame.display.set_mode)."""
+        if enemy_types is None:
+            enemy_types = ENEMY_SPRITES.keys()
+        for enemy_type in enemy_types:
+            if (enemy_type, scale) not in self._animation_sets:
+                self.get_enemy_animations(enemy_type, scale)
+
+    def clear(self):
+        self.frames.clear()
+        self._animation_sets.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """
+        Contadores para verificar que los spawns no asignan memoria:
+        tras prewarm(), 'misses' no debería crecer durante la partida.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "frame_lists": len(self.frames),
+            "animation_sets": len(self._animation_sets),
+        }
+
+
+# Instancia única para todo el proceso
+enemy_frame_cache = FrameCache()
@@ -1,8 +1,10 @@
 import pygame
 
+from core.asset_loader import assets
+
 class SpriteSheet:
     def __init__(self, image_path):
-        self.sprite_sheet = pygame.image.load(image_path).convert_alpha()
+        self.sprite_sheet = assets.image(image_path)
 
     def get_sprite(self, x, y, width, height):
         # Create a new blank image with transparency
@@ -0,0 +1,99 @@
+from collections import OrderedDict
+
+import pygame
+
+from core.settings import TEXT_CACHE_MAX_SURFACES
+
+
+class CachedFont:
+    """
+    Envoltorio de pygame.font.Font cuyo render() pasa por la TextCache.
+    El resto de métodos (size, get_height, ...) van directos a la fuente.
+    """
+
+    def __init__(self, cache, key, font):
+        self._cache = cache
+        self.key = key          # (name, size, bold)
+        self.font = font
+
+    def render(self, text, antialias, color, background=None):
+        return self._cache.render_with(self, text, antialias, color, background)
+
+    def render_uncached(self, text, antialias, color, background=None):
+        """Sin pasar por la caché: texto de depuración que cambia casi cada frame."""
+        return self.font.render(str(text), antialias, color, background)
+
+    def __getattr__(self, name):
+        return getattr(self.font, name)
+
+
+class TextCache:
+    """
+    Servicio de texto compartido para HUD y menús.
+
+    - Fuentes: una por (nombre, tamaño, negrita), creadas con SysFont UNA vez.
+    - Textos: Surface renderizada por (texto, fuente, color) con expulsión
+      LRU. Las etiquetas fijas ("Mapa", pistas de pausa) se renderizan una
+      sola vez y los contadores solo cuando cambia su valor.
+    """
+
+    def __init__(self, max_surfaces: int = TEXT_CACHE_MAX_SURFACES):
+        self.max_surfaces = max_surfaces
+        # (name, size, bold) -> CachedFont
+        self.fonts: dict[tuple, CachedFont] = {}
+        # (text, font_key, color, antialias, background) -> Surface
+        self.surfaces: OrderedDict = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def font(self, name: str = "arial", size: int = 18, bold: bool = False) -> CachedFont:
+        key = (name, size, bold)
+        font = self.fonts.get(key)
+        if font is None:
+            font = CachedFont(self, key, pygame.font.SysFont(name, size, bold=bold))
+            self.fonts[key] = font
+        return font
+
+    def render_with(self, font: CachedFont, text, antialias, color, background=None):
+        """Surface de `text` con `font` (compartida entre llamadas, NO modificar)."""
+        color = tuple(color)
+        if background is not None:
+            background = tuple(background)
+        key = (str(text), font.key, color, bool(antialias), background)
+
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.font.render(key[0], antialias, color, background)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_surfaces:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def render(self, text, size: int = 18, color=(255, 255, 255),
+               bold: bool = False, name: str = "arial", antialias: bool = True):
+        return self.render_with(self.font(name, size, bold), text, antialias, color)
+
+    def clear(self):
+        self.fonts.clear()
+        self.surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """Tras el primer frame de cada pantalla, 'misses' solo debería crecer al cambiar un valor."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "fonts": len(self.fonts),
+            "surfaces": len(self.surfaces),
+        }
+
+
+# Instancia única para todo el proceso
+text_cache = TextCache()
@@ -0,0 +1,68 @@
+from collections import OrderedDict
+
+import pygame
+
+from core.settings import TINT_CACHE_MAX_SURFACES
+
+
+class TintCache:
+    """
+    Variantes teñidas de frames de animación (p. ej. el flash blanco de daño).
+
+    Cada variante se genera UNA vez por frame de origen y tipo de tinte y se
+    reutiliza; los frames de origen son los de las animaciones del jugador o
+    del atlas compartido de enemigos, que viven toda la partida. LRU acotada
+    por número de Surfaces. Las variantes son compartidas: NO modificar.
+    """
+
+    # tipo -> (color, flags de fill)
+    TINTS = {
+        "flash": ((255, 255, 255), pygame.BLEND_RGB_ADD),   # parpadeo blanco al recibir daño
+    }
+
+    def __init__(self, max_surfaces: int = TINT_CACHE_MAX_SURFACES):
+        self.max_surfaces = max_surfaces
+        # (frame, tint) -> Surface
+        self.variants: OrderedDict = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def variant(self, frame: pygame.Surface, tint: str = "flash") -> pygame.Surface:
+        key = (frame, tint)
+        surface = self.variants.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.variants.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        color, flags = self.TINTS[tint]
+        surface = frame.copy()
+        surface.fill(color, special_flags=flags)
+
+        self.variants[key] = surface
+        if len(self.variants) > self.max_surfaces:
+            self.variants.popitem(last=False)
+        return surface
+
+    @staticmethod
+    def flash_on(period_ms: int = 40) -> bool:
+        """Fase del parpadeo: True en los ticks pares de `period_ms`."""
+        return (pygame.time.get_ticks() // period_ms) % 2 == 0
+
+    def clear(self):
+        self.variants.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "variants": len(self.variants),
+        }
+
+
+# Instancia única para todo el proceso
+tint_cache = TintCache()
@@ -0,0 +1,140 @@
+"""
+Modo headless para pruebas de carga: corre la lógica del juego sin ventana
+ni render, con drivers SDL "dummy" y entrada guionada o aleatoria, tan rápido
+como se pueda durante N segundos simulados, y reporta ticks por segundo.
+
+Uso (desde src/):
+    python headless.py                              # 60 s simulados, entrada aleatoria
+    python headless.py --seconds 30 --enemies 300   # población fija de orcos
+    python headless.py --input idle --json          # jugador quieto, salida JSON
+
+Los cooldowns de ataque de los enemigos usan pygame.time.get_ticks() (reloj
+real), así que a más ticks/s los orcos atacan proporcionalmente menos por
+segundo simulado; el coste de movimiento, colisiones y spawn sí es el real.
+"""
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import contextlib
+import json
+import random
+import sys
+import time
+
+from core.game import Game
+from core.game_state import GameState
+from core.input_provider import RandomInput, ScriptedInput
+from core.settings import SIM_TICK_RATE
+
+
+STAT_CHOICES = ("move", "strength", "range", "resistance")
+
+
+def make_input(mode: str, seed=None):
+    if mode == "idle":
+        return ScriptedInput([])
+    return RandomInput(seed=seed)
+
+
+def run_headless(seconds: float = 60.0, enemies=None, input_mode: str = "random",
+                 seed=None, tick_rate: int = SIM_TICK_RATE):
+    """
+    Simula `seconds` segundos de partida a paso fijo y devuelve un dict con
+    ticks, tiempo real, ticks/s y el estado final. `enemies` fija la
+    población objetivo (spawn inicial + tope de max_enemies_on_screen).
+    """
+    rng = random.Random(seed)
+    if seed is not None:
+        random.seed(seed)   # spawns del juego
+
+    game = Game(input_provider=make_input(input_mode, seed))
+
+    load_start = time.perf_counter()
+    while game.state == GameState.LOADING:
+        game.update(0.0)
+        time.sleep(0.001)
+    load_time = time.perf_counter() - load_start
+
+    def start_run():
+        game.start_game()
+        if enemies:
+            game.max_enemies_on_screen = enemies
+            # start_game() ya spawnea unos cuantos: solo se completa hasta el objetivo
+            game.spawn_initial_enemies(count=max(0, enemies - len(game.enemies)))
+
+    start_run()
+
+    dt = 1.0 / tick_rate
+    total_ticks = int(seconds * tick_rate)
+    deaths = 0
+    kills = 0
+    peak_enemies = 0
+
+    start = time.perf_counter()
+    for _ in range(total_ticks):
+        game.step(dt)
+        game.flush_sounds()
+
+        if game.state == GameState.PAUSED and game.pending_level_up_choice:
+            game.apply_stat_upgrade(rng.choice(STAT_CHOICES))
+        elif game.state in (GameState.GAME_OVER, GameState.VICTORY):
+            deaths += game.state == GameState.GAME_OVER
+            kills += game.kills
+            start_run()
+
+        if enemies:
+            game.max_enemies_on_screen = enemies
+        peak_enemies = max(peak_enemies, len(game.enemies))
+    wall = time.perf_counter() - start
+
+    return {
+        "ticks": total_ticks,
+        "tick_rate": tick_rate,
+        "sim_seconds": round(total_ticks / tick_rate, 3),
+        "wall_seconds": round(wall, 3),
+        "ticks_per_second": round(total_ticks / wall, 1) if wall > 0 else None,
+        "realtime_factor": round(total_ticks / tick_rate / wall, 2) if wall > 0 else None,
+        "load_seconds": round(load_time, 3),
+        "enemies_alive": sum(1 for e in game.enemies if e.alive),
+        "peak_enemies": peak_enemies,
+        "kills": kills + game.kills,
+        "deaths": deaths,
+        "player_level": game.level,
+        "sounds": game.sound_manager.stats() if game.sound_manager else None,
+        "enemy_pool": game.enemy_pool.stats(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulación headless para pruebas de carga")
+    parser.add_argument("--seconds", type=float, default=60.0, help="segundos simulados")
+    parser.add_argument("--enemies", type=int, default=None, help="población fija de orcos")
+    parser.add_argument("--input", choices=("random", "idle"), default="random")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--tick-rate", type=int, default=SIM_TICK_RATE)
+    parser.add_argument("--json", action="store_true", help="imprimir el reporte como JSON")
+    args = parser.parse_args()
+
+    # Los prints del juego van a stderr para que stdout sea solo el reporte
+    with contextlib.redirect_stdout(sys.stderr):
+        report = run_headless(
+            seconds=args.seconds,
+            enemies=args.enemies,
+            input_mode=args.input,
+            seed=args.seed,
+            tick_rate=args.tick_rate,
+        )
+
+    if args.json:
+        print(json.dumps(report))
+    else:
+        for key, value in report.items():
+            print(f"{key:>18}: {value}")
+
+
+if __name__ == "__main__":
+    main()